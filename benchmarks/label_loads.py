@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""Benchmark of loading and dumping the TensorBay labels.
+
+Run it from the root of the repository::
+
+    python benchmarks/label_loads.py --data 1000 --boxes 50
+
+"""
+
+import argparse
+import timeit
+from typing import Any, Dict, List
+
+from tensorbay.label import Label
+
+
+def _get_label_contents(boxes: int, polygons: int) -> Dict[str, Any]:
+    box2d = {
+        "box2d": {"xmin": 1.0, "ymin": 2.0, "xmax": 3.0, "ymax": 4.0},
+        "category": "car",
+        "attributes": {"occluded": False, "truncated": 0.5},
+        "instance": "1",
+    }
+    polygon = {
+        "polygon": [{"x": float(i), "y": float(i)} for i in range(8)],
+        "category": "person",
+    }
+    return {
+        "CLASSIFICATION": {"category": "street", "attributes": {"weather": "sunny"}},
+        "BOX2D": [box2d] * boxes,
+        "POLYGON": [polygon] * polygons,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the time per label."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", type=int, default=1000, help="the number of the labels")
+    parser.add_argument("--boxes", type=int, default=50, help="the number of boxes per label")
+    parser.add_argument("--polygons", type=int, default=5, help="the number of polygons per label")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of the repeats")
+    args = parser.parse_args()
+
+    contents_list = [_get_label_contents(args.boxes, args.polygons)] * args.data
+    labels: List[Label] = []
+
+    def _loads() -> None:
+        labels[:] = [Label.loads(contents) for contents in contents_list]
+
+    def _dumps() -> None:
+        for label in labels:
+            label.dumps()
+
+    for name, function in (("Label.loads", _loads), ("Label.dumps", _dumps)):
+        elapsed = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(f"{name}: {elapsed:.3f}s in total, {elapsed / args.data * 1e6:.1f}us per label")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,10 @@ dataset.enable_cache()
 dataset.enable_cache("<path/to/cache/folder>")
 """"""
 
+"""Setting Cache Size"""
+dataset.enable_cache("<path/to/cache/folder>", max_size=100 * 1024**3)
+""""""
+
 """Open Remote Data"""
 segment = dataset[0]
 MAX_EPOCH = 100
@@ -39,6 +43,18 @@ for epoch in range(MAX_EPOCH):
         # code using opened data here
 """"""
 
+"""Prefetch Remote Data"""
+dataset_client = gas.get_dataset("<DATASET_NAME>")
+dataset_client.enable_cache("<path/to/cache/folder>")
+statistics = dataset_client.prefetch(["<SEGMENT_NAME>"], jobs=8)
+print(statistics.downloaded_size, statistics.throughput)
+""""""
+
+"""Update Cache"""
+dataset_client.checkout("<NEW_REVISION>")
+statistics = dataset_client.update_cache("<BASE_REVISION>", jobs=8)
+""""""
+
 """Cache Enabled"""
 print(dataset.cache_enabled)
 # True
@@ -63,6 +63,13 @@ gas.upload_dataset(dataset, jobs=8, skip_uploaded_files=True)
 gas.upload_dataset(dataset, jobs=8)
 """"""
 
+"""Update data/ synchronize segment"""
+segment = dataset["<SEGMENT_NAME>"]
+plan = dataset_client.get_sync_plan(segment, jobs=8, delete=True)
+print(plan.get_preview())
+dataset_client.apply_sync_plan(plan, jobs=8)
+""""""
+
 """Update data/ delete segment"""
 dataset_client.create_draft("draft-3")
 dataset_client.delete_segment("<SEGMENT_NAME>")
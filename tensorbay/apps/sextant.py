@@ -12,6 +12,7 @@ from urllib.parse import urljoin
 from tensorbay.client.lazy import PagingList
 from tensorbay.client.requests import Client
 from tensorbay.exception import ResourceNotExistError
+from tensorbay.utility import config
 
 
 class Evaluation:
@@ -95,10 +96,10 @@ class Benchmark:  # pylint: disable=too-many-instance-attributes
         return f'{self.__class__.__name__}("{self.name}")'
 
     def _generate_evaluations(
-        self, offset: int = 0, limit: int = 128
+        self, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[Evaluation, None, int]:
 
-        params: Dict[str, Any] = {"offset": offset, "limit": limit}
+        params: Dict[str, Any] = {"offset": offset, "limit": limit or config.page_size}
         response = self.sextant.open_api_do(
             "GET", f"benchmarks/{self.benchmark_id}/evaluations", "", params=params
         ).json()
@@ -132,7 +133,7 @@ class Benchmark:  # pylint: disable=too-many-instance-attributes
             A list of evaluations.
 
         """
-        return PagingList(self._generate_evaluations, 128)
+        return PagingList(self._generate_evaluations)
 
 
 class Sextant(Client):
@@ -149,10 +150,10 @@ class Sextant(Client):
         self._open_api = urljoin(self.gateway_url, "apps-sextant/v1/")
 
     def _generate_benmarks(
-        self, offset: int = 0, limit: int = 128
+        self, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[Benchmark, None, int]:
 
-        params: Dict[str, Any] = {"offset": offset, "limit": limit}
+        params: Dict[str, Any] = {"offset": offset, "limit": limit or config.page_size}
         response = self.open_api_do("GET", "benchmarks", "", params=params).json()
 
         for benchmark in response["benchmarks"]:
@@ -193,7 +194,7 @@ class Sextant(Client):
             The list of Benchmark instances.
 
         """
-        return PagingList(self._generate_benmarks, 128)
+        return PagingList(self._generate_benmarks)
 
     def get_benchmark(self, name: str) -> Benchmark:
         """Get a benchmark instance by name.
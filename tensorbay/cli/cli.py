@@ -214,6 +214,23 @@ def commit(obj: ContextInfo, tbrn: str, message: Tuple[str, ...]) -> None:
         "",
         "# Upload files in a folder.",
         "$ gas cp -r <local_folder> tb:<dataset_name>#<draft_number>:<segment_name>",
+        "",
+        "# Upload the jpg files in a folder except the ones in the cache directories.",
+        "$ gas cp -r <local_folder> tb:<dataset_name>#<draft_number>:<segment_name> "
+        "--include '*.jpg' --exclude '.cache'",
+        "",
+        "# Upload the new and changed files in a folder and delete the remote files not in it.",
+        "$ gas cp -r --sync --delete <local_folder> "
+        "tb:<dataset_name>#<draft_number>:<segment_name>",
+        "",
+        "# Download a file.",
+        "$ gas cp tb:<dataset_name>[@<revision>]:<segment_name>://<remote_path> <local_path>",
+        "",
+        "# Download a dataset or a segment, skipping the files already downloaded.",
+        "$ gas cp -r -s tb:<dataset_name>[@<revision>][:<segment_name>] <local_folder>",
+        "",
+        "# Update a dataset downloaded from the base revision by the diff.",
+        "$ gas cp -r tb:<dataset_name>[@<revision>] <local_folder> --base <base_revision>",
     )
 )
 @click.argument("local_paths", type=str, nargs=-1)
@@ -227,7 +244,36 @@ def commit(obj: ContextInfo, tbrn: str, message: Tuple[str, ...]) -> None:
     "--skip",
     "skip_uploaded_files",
     is_flag=True,
-    help="Whether to skip the uploaded files.",
+    help="Whether to skip the uploaded files, or the downloaded files with the same checksums.",
+)
+@click.option(
+    "--include",
+    type=str,
+    multiple=True,
+    help="The glob pattern of the files in the directories to upload, can be given repeatedly.",
+)
+@click.option(
+    "--exclude",
+    type=str,
+    multiple=True,
+    help="The glob pattern of the files and directories to skip, can be given repeatedly.",
+)
+@click.option(
+    "--base",
+    type=str,
+    default="",
+    help="The revision which the local folder is downloaded from, only the diff is downloaded.",
+)
+@click.option(
+    "--sync",
+    is_flag=True,
+    help="Only upload the new files and the files whose checksums differ from the remote ones.",
+)
+@click.option(
+    "--delete", is_flag=True, help="Delete the remote files not in the local paths with --sync."
+)
+@click.option(
+    "--dry-run", is_flag=True, help="Only show the plan of the synchronization with --sync."
 )
 @click.pass_obj
 def cp(  # pylint: disable=invalid-name, too-many-arguments
@@ -237,21 +283,89 @@ def cp(  # pylint: disable=invalid-name, too-many-arguments
     is_recursive: bool,
     jobs: int,
     skip_uploaded_files: bool,
+    include: Tuple[str, ...],
+    exclude: Tuple[str, ...],
+    base: str,
+    sync: bool,
+    delete: bool,
+    dry_run: bool,
 ) -> None:
-    """Copy local data to a remote path.\f
+    """Copy local data to a remote path, or remote data to a local path.\f
 
     Arguments:
         obj: A :class:`.utility.ContextInfo` instance containing the command context.
-        local_paths: An iterable of local paths contains data to be uploaded.
-        tbrn: The path to save the uploaded data, like "tb:KITTI:seg1".
+        local_paths: An iterable of local paths contains data to be uploaded,
+            or the tbrn of the data to be downloaded.
+        tbrn: The path to save the uploaded data, like "tb:KITTI:seg1",
+            or the local path to save the downloaded data.
         is_recursive: Whether copy directories recursively.
-        jobs: Number of threads to upload data.
-        skip_uploaded_files: Whether skip the uploaded files.
+        jobs: Number of threads to upload or download data and walk directories.
+        skip_uploaded_files: Whether skip the uploaded files,
+            or the downloaded files with the same checksums.
+        include: The glob patterns of the files in the directories to upload.
+        exclude: The glob patterns of the files and directories to skip.
+        base: The revision which the local folder is downloaded from.
+        sync: Whether only upload the new files and the changed files.
+        delete: Whether delete the remote files not in the local paths when synchronizing.
+        dry_run: Whether only show the plan of the synchronization.
 
     """  # noqa: D301,D415
     from tensorbay.cli.cp import _implement_cp
 
-    _implement_cp(obj, local_paths, tbrn, is_recursive, jobs, skip_uploaded_files)
+    _implement_cp(
+        obj,
+        local_paths,
+        tbrn,
+        is_recursive,
+        jobs,
+        skip_uploaded_files,
+        include,
+        exclude,
+        base,
+        sync,
+        delete,
+        dry_run,
+    )
+
+
+@command(
+    synopsis=(
+        "# Download all the files of a dataset into the cache.",
+        "$ gas prefetch tb:<dataset_name>[@<revision>] [-j <jobs>]",
+        "",
+        "# Download the files of a segment into a size-bounded cache.",
+        "$ gas prefetch tb:<dataset_name>[@<revision>]:<segment_name> "
+        "--cache-path <cache_path> --max-size <max_size>",
+    )
+)
+@click.argument("tbrn", type=str)
+@click.option("-j", "--jobs", type=int, default=1, help="The number of threads.")
+@click.option(
+    "--cache-path",
+    type=str,
+    default="",
+    help="The path to store the cache, use the temporary directory if not given.",
+)
+@click.option(
+    "--max-size", type=int, default=None, help="The byte budget of the files in the cache."
+)
+@click.pass_obj
+def prefetch(
+    obj: ContextInfo, tbrn: str, jobs: int, cache_path: str, max_size: Optional[int]
+) -> None:
+    """Download the remote files of a dataset or a segment into the cache.\f
+
+    Arguments:
+        obj: A :class:`.utility.ContextInfo` instance containing the command context.
+        tbrn: The path to be prefetched, like "tb:KITTI@v1.0:seg1".
+        jobs: Number of threads to download the files.
+        cache_path: The path to store the cache.
+        max_size: The byte budget of the files in the cache.
+
+    """  # noqa: D301,D415
+    from tensorbay.cli.prefetch import _implement_prefetch
+
+    _implement_prefetch(obj, tbrn, jobs, cache_path, max_size)
 
 
 @command(
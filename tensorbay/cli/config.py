@@ -46,7 +46,15 @@ def _check_args_and_options(key: str, value: str, unset: bool) -> None:
             error('Use "--unset" option to unset config or use "key" and "value" to set config')
         if not key:
             error('Use "--unset" option with "key"')
-    if key not in {"editor", "timeout", "is_internal", "max_retries", ""}:
+    if key not in {
+        "editor",
+        "timeout",
+        "is_internal",
+        "max_retries",
+        "checksum_index_path",
+        "uploaded_objects_path",
+        "",
+    }:
         error(f'The option "{key}" is not supported to configure currently.')
 
 
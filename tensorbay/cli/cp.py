@@ -6,12 +6,17 @@
 """Implementation of gas cp."""
 
 import os
-from pathlib import Path, PurePosixPath
-from typing import Iterable
+from functools import partial
+from pathlib import PurePosixPath
+from typing import Iterable, Iterator, Tuple
+
+import click
 
 from tensorbay.cli.tbrn import TBRN, TBRNType
 from tensorbay.cli.utility import ContextInfo, error, exception_handler, get_dataset_client
-from tensorbay.dataset import Data, Segment
+from tensorbay.client.dataset import DatasetClient
+from tensorbay.dataset import Data, StreamSegment
+from tensorbay.utility.walk import walk_files
 
 
 @exception_handler
@@ -22,15 +27,60 @@ def _implement_cp(  # pylint: disable=too-many-arguments
     is_recursive: bool,
     jobs: int,
     skip_uploaded_files: bool,
+    include: Tuple[str, ...] = (),
+    exclude: Tuple[str, ...] = (),
+    base: str = "",
+    sync: bool = False,
+    delete: bool = False,
+    dry_run: bool = False,
+) -> None:
+    local_paths = tuple(local_paths)
+    if (delete or dry_run) and not sync:
+        error('"--delete" and "--dry-run" options are only available with "--sync" option')
+
+    if not tbrn.startswith("tb:") and len(local_paths) == 1 and local_paths[0].startswith("tb:"):
+        if sync:
+            error('"--sync" option is only available for uploading')
+
+        _download(obj, local_paths[0], tbrn, is_recursive, jobs, skip_uploaded_files, base)
+        return
+
+    if base:
+        error('"--base" option is only available for downloading')
+
+    _upload(
+        obj,
+        local_paths,
+        TBRN(tbrn=tbrn),
+        is_recursive,
+        jobs,
+        skip_uploaded_files,
+        include=include,
+        exclude=exclude,
+        sync=sync,
+        delete=delete,
+        dry_run=dry_run,
+    )
+
+
+def _upload(  # pylint: disable=too-many-arguments
+    obj: ContextInfo,
+    local_paths: Iterable[str],
+    tbrn_info: TBRN,
+    is_recursive: bool,
+    jobs: int,
+    skip_uploaded_files: bool,
+    *,
+    include: Tuple[str, ...],
+    exclude: Tuple[str, ...],
+    sync: bool,
+    delete: bool,
+    dry_run: bool,
 ) -> None:
-    gas = obj.get_gas()
-    tbrn_info = TBRN(tbrn=tbrn)
-
-    dataset_client = get_dataset_client(gas, tbrn_info, is_fusion=False)
-
     if tbrn_info.type not in (TBRNType.SEGMENT, TBRNType.NORMAL_FILE):
-        error(f'"{tbrn}" is not a segment or file type')
+        error(f'"{tbrn_info.get_tbrn()}" is not a segment or file type')
 
+    dataset_client = get_dataset_client(obj.get_gas(), tbrn_info, is_fusion=False)
     target_remote_path = tbrn_info.remote_path if tbrn_info.type == TBRNType.NORMAL_FILE else ""
 
     local_abspaths = [os.path.abspath(local_path) for local_path in local_paths]
@@ -40,58 +90,153 @@ def _implement_cp(  # pylint: disable=too-many-arguments
         and target_remote_path
         and not target_remote_path.endswith("/")
     ):
-        segment_client = dataset_client.get_or_create_segment(tbrn_info.segment_name)
-        segment_client.upload_file(local_abspaths[0], target_remote_path)
-    else:
-        segment = _get_segment(
-            tbrn_info.segment_name, local_abspaths, target_remote_path, is_recursive
+        if sync:
+            error('"--sync" option is only available for uploading into a segment or a directory')
+
+        dataset_client.get_or_create_segment(tbrn_info.segment_name).upload_file(
+            local_abspaths[0], target_remote_path
         )
+        return
+
+    segment = _get_segment(
+        tbrn_info.segment_name,
+        local_abspaths,
+        target_remote_path,
+        is_recursive,
+        include=include,
+        exclude=exclude,
+        jobs=jobs,
+    )
+    if not sync:
         dataset_client.upload_segment(
             segment, jobs=jobs, skip_uploaded_files=skip_uploaded_files, _is_cli=True
         )
+        return
+
+    _sync(dataset_client, segment, jobs=jobs, delete=delete, dry_run=dry_run)
+
+
+def _sync(
+    dataset_client: DatasetClient,
+    segment: StreamSegment,
+    *,
+    jobs: int,
+    delete: bool,
+    dry_run: bool,
+) -> None:
+    plan = dataset_client.get_sync_plan(segment, jobs=jobs, delete=delete)
+    click.echo(plan.get_preview())
+    if plan and not dry_run:
+        dataset_client.apply_sync_plan(plan, jobs=jobs)
+
+
+def _download(  # pylint: disable=too-many-arguments
+    obj: ContextInfo,
+    tbrn: str,
+    local_path: str,
+    is_recursive: bool,
+    jobs: int,
+    incremental: bool,
+    base: str,
+) -> None:
+    tbrn_info = TBRN(tbrn=tbrn)
+    if tbrn_info.type not in (TBRNType.DATASET, TBRNType.SEGMENT, TBRNType.NORMAL_FILE):
+        error(f'"{tbrn}" is not a dataset, segment or file type')
+
+    if base and tbrn_info.type != TBRNType.DATASET:
+        error('"--base" option is only available for downloading a dataset')
+
+    remote_path = tbrn_info.remote_path if tbrn_info.type == TBRNType.NORMAL_FILE else ""
+    is_file = bool(remote_path) and not remote_path.endswith("/")
+    if not is_file and not is_recursive:
+        error(f'"{tbrn}" is a directory, please use -r option')
+
+    local_path = os.path.abspath(local_path)
+    if is_file and os.path.isdir(local_path):
+        local_path = os.path.join(local_path, os.path.basename(remote_path))
+
+    dataset_client = get_dataset_client(obj.get_gas(), tbrn_info, is_fusion=False)
+    statistics = (
+        dataset_client.download_diff(local_path, base, jobs=jobs)
+        if base
+        else dataset_client.download(
+            local_path,
+            segment_name=None if tbrn_info.type == TBRNType.DATASET else tbrn_info.segment_name,
+            remote_path=remote_path,
+            jobs=jobs,
+            incremental=incremental,
+        )
+    )
+    click.echo(
+        f'Successfully copied "{tbrn_info.get_colored_tbrn()}" to "{local_path}": '
+        f"{statistics.downloaded_count} of {statistics.file_count} files downloaded, "
+        f"{statistics.downloaded_size} bytes in {statistics.elapsed:.2f}s "
+        f"({statistics.throughput / 1024 ** 2:.2f} MiB/s)"
+    )
 
 
-def _get_segment(
+def _get_segment(  # pylint: disable=too-many-arguments
     segment_name: str,
     local_abspaths: Iterable[str],
     remote_path: str,
     is_recursive: bool,
-) -> Segment:
+    *,
+    include: Iterable[str] = (),
+    exclude: Iterable[str] = (),
+    jobs: int = 1,
+) -> StreamSegment:
     """Get the pair of local_path and remote_path.
 
+    The directories are walked concurrently while the segment is uploaded, so the upload starts
+    as soon as the first files are found and the data are not held in memory.
+
     Arguments:
         segment_name: The name of the segment these data belong to.
         local_abspaths: A list of local abstract paths, could be folder or file.
         remote_path: The remote object path, not necessarily end with '/'.
         is_recursive: Whether copy directories recursively.
+        include: The glob patterns of the files in the directories to include.
+        exclude: The glob patterns of the files and directories in the directories to exclude.
+        jobs: The number of the directories walked concurrently.
 
     Returns:
         A segment contains mapping data.
 
     """
-    segment = Segment(segment_name)
+    local_abspaths = list(local_abspaths)
+    if not is_recursive and any(map(os.path.isdir, local_abspaths)):
+        error("Local paths include directories, please use -r option")
+
+    return StreamSegment(
+        segment_name,
+        partial(
+            _generate_data,
+            local_abspaths,
+            remote_path,
+            include=tuple(include),
+            exclude=tuple(exclude),
+            jobs=jobs,
+        ),
+    )
+
+
+def _generate_data(
+    local_abspaths: Iterable[str],
+    remote_path: str,
+    *,
+    include: Tuple[str, ...],
+    exclude: Tuple[str, ...],
+    jobs: int,
+) -> Iterator[Data]:
     for local_abspath in local_abspaths:
         if not os.path.isdir(local_abspath):
-            data = Data(
+            yield Data(
                 local_abspath,
                 target_remote_path=str(PurePosixPath(remote_path, os.path.basename(local_abspath))),
             )
-            segment.append(data)
             continue
 
-        if not is_recursive:
-            error("Local paths include directories, please use -r option")
-
         local_abspath = os.path.normpath(local_abspath)
-        folder_name = os.path.basename(local_abspath)
-        for root, _, filenames in os.walk(local_abspath):
-            relpath = os.path.relpath(root, local_abspath) if root != local_abspath else ""
-            for filename in filenames:
-                data = Data(
-                    os.path.join(root, filename),
-                    target_remote_path=str(
-                        PurePosixPath(Path(remote_path, folder_name, relpath, filename))
-                    ),
-                )
-                segment.append(data)
-    return segment
+        prefix = f"{PurePosixPath(remote_path, os.path.basename(local_abspath))}/"
+        for path, relpath in walk_files(local_abspath, include=include, exclude=exclude, jobs=jobs):
+            yield Data(path, target_remote_path=prefix + relpath)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""Implementation of gas prefetch."""
+
+from typing import Optional
+
+import click
+
+from tensorbay.cli.tbrn import TBRN, TBRNType
+from tensorbay.cli.utility import ContextInfo, error, exception_handler, get_dataset_client
+
+
+@exception_handler
+def _implement_prefetch(
+    obj: ContextInfo, tbrn: str, jobs: int, cache_path: str, max_size: Optional[int]
+) -> None:
+    tbrn_info = TBRN(tbrn=tbrn)
+    if tbrn_info.type not in (TBRNType.DATASET, TBRNType.SEGMENT):
+        error(f'"{tbrn}" is neither a dataset nor a segment')
+
+    if tbrn_info.is_draft:
+        error("Cache is not available for datasets under draft status")
+
+    dataset_client = get_dataset_client(obj.get_gas(), tbrn_info)
+    dataset_client.enable_cache(cache_path, max_size=max_size)
+    segments = None if tbrn_info.type == TBRNType.DATASET else (tbrn_info.segment_name,)
+    statistics = dataset_client.prefetch(segments, jobs=jobs)
+
+    click.echo(
+        f'Successfully prefetched "{tbrn_info.get_colored_tbrn()}": '
+        f"{statistics.downloaded_count} of {statistics.file_count} files downloaded, "
+        f"{statistics.downloaded_size} bytes in {statistics.elapsed:.2f}s "
+        f"({statistics.throughput / 1024 ** 2:.2f} MiB/s)"
+    )
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+from pathlib import Path
+
+import pytest
+
+from tensorbay.cli.cli import cp
+from tensorbay.cli.cp import _get_segment
+from tensorbay.cli.tests.conftest import assert_cli_fail, assert_cli_success
+from tensorbay.client import dataset
+from tensorbay.client.cache import DownloadStatistics
+from tensorbay.client.sync import SyncPlan
+from tensorbay.dataset import Data
+
+
+@pytest.fixture(name="local_tree")
+def local_tree_path(tmp_path: Path) -> Path:
+    """Create a local directory tree to upload.
+
+    Arguments:
+        tmp_path: The temporary directory.
+
+    Returns:
+        The path of the root directory.
+
+    """
+    root = tmp_path / "images"
+    for relpath in ("0.jpg", "1.png", "a/2.jpg", "a/b/3.jpg", ".cache/4.jpg", "c/.cache/5.jpg"):
+        path = root / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+    return root
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_get_segment(local_tree, jobs):
+    single_file = local_tree / "0.jpg"
+    segment = _get_segment("test", [str(local_tree), str(single_file)], "remote/", True, jobs=jobs)
+    remote_paths = {data.target_remote_path: data.path for data in segment}
+    assert remote_paths == {
+        "remote/images/0.jpg": str(single_file),
+        "remote/images/1.png": str(local_tree / "1.png"),
+        "remote/images/a/2.jpg": str(local_tree / "a" / "2.jpg"),
+        "remote/images/a/b/3.jpg": str(local_tree / "a" / "b" / "3.jpg"),
+        "remote/images/.cache/4.jpg": str(local_tree / ".cache" / "4.jpg"),
+        "remote/images/c/.cache/5.jpg": str(local_tree / "c" / ".cache" / "5.jpg"),
+        "remote/0.jpg": str(single_file),
+    }
+
+
+def test_get_segment_with_patterns(local_tree):
+    segment = _get_segment(
+        "test", [str(local_tree)], "", True, include=["*.jpg"], exclude=[".cache", "a/b"]
+    )
+    assert sorted(data.target_remote_path for data in segment) == [
+        "images/0.jpg",
+        "images/a/2.jpg",
+    ]
+
+
+def test_download(mocker, invoke, tmp_path, mock_get_dataset):
+    dataset_name = "test_cp"
+    tbrn = f"tb:{dataset_name}@v1.0"
+
+    result = invoke(cp, [tbrn, str(tmp_path)])
+    assert_cli_fail(result, f'ERROR: "{tbrn}" is a directory, please use -r option\n')
+
+    mock_get_dataset(mocker, False, False)
+    mocker.patch(f"{dataset.__name__}.DatasetClientBase.checkout")
+    statistics = DownloadStatistics()
+    statistics.record((0, 1024**2))
+    statistics.elapsed = 1
+    download = mocker.patch(f"{dataset.__name__}.DatasetClient.download", return_value=statistics)
+
+    result = invoke(cp, ["-r", "-s", "-j", "8", tbrn, str(tmp_path)])
+    assert_cli_success(
+        result,
+        f'Successfully copied "{tbrn}" to "{tmp_path}": '
+        "1 of 2 files downloaded, 1048576 bytes in 1.00s (1.00 MiB/s)\n",
+    )
+    download.assert_called_once_with(
+        str(tmp_path), segment_name=None, remote_path="", jobs=8, incremental=True
+    )
+
+    invoke(cp, [f"{tbrn}:segment1://a/data.png", str(tmp_path)])
+    download.assert_called_with(
+        str(tmp_path / "data.png"),
+        segment_name="segment1",
+        remote_path="a/data.png",
+        jobs=1,
+        incremental=False,
+    )
+
+    download_diff = mocker.patch(
+        f"{dataset.__name__}.DatasetClient.download_diff", return_value=statistics
+    )
+    result = invoke(cp, ["-r", "--base", "v0.9", tbrn, str(tmp_path)])
+    assert result.exit_code == 0
+    download_diff.assert_called_once_with(str(tmp_path), "v0.9", jobs=1)
+
+    result = invoke(cp, ["-r", "--base", "v0.9", f"{tbrn}:segment1", str(tmp_path)])
+    assert_cli_fail(result, 'ERROR: "--base" option is only available for downloading a dataset\n')
+
+
+def test_sync(mocker, invoke, local_tree, mock_get_dataset):
+    tbrn = "tb:test_cp#1:segment1"
+    result = invoke(cp, ["-r", "--delete", str(local_tree), tbrn])
+    assert_cli_fail(
+        result,
+        'ERROR: "--delete" and "--dry-run" options are only available with "--sync" option\n',
+    )
+
+    mock_get_dataset(mocker, False, False)
+    mocker.patch(f"{dataset.__name__}.DatasetClientBase.checkout")
+    plan = SyncPlan(
+        "segment1",
+        uploads=[Data(str(local_tree / "0.jpg"), target_remote_path="0.jpg")],
+        imports=[],
+        updates=[],
+        deletes=[],
+        unchanged_count=5,
+    )
+    get_sync_plan = mocker.patch(
+        f"{dataset.__name__}.DatasetClient.get_sync_plan", return_value=plan
+    )
+    apply_sync_plan = mocker.patch(f"{dataset.__name__}.DatasetClient.apply_sync_plan")
+    preview = (
+        'Segment "segment1": 1 to upload, 0 to import, 0 to update, 0 to delete, 5 unchanged\n'
+        "+ 0.jpg\n"
+    )
+
+    result = invoke(cp, ["-r", "--sync", "--delete", "--dry-run", str(local_tree), tbrn])
+    assert_cli_success(result, preview)
+    (segment,), keywords = get_sync_plan.call_args
+    assert segment.name == "segment1"
+    assert keywords == {"jobs": 1, "delete": True}
+    apply_sync_plan.assert_not_called()
+
+    result = invoke(cp, ["-r", "-j", "4", "--sync", str(local_tree), tbrn])
+    assert_cli_success(result, preview)
+    apply_sync_plan.assert_called_once_with(plan, jobs=4)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+import pytest
+
+from tensorbay.cli.cli import prefetch
+from tensorbay.cli.tests.conftest import assert_cli_fail, assert_cli_success
+from tensorbay.client import dataset
+from tensorbay.client.cache import DownloadStatistics
+
+
+@pytest.mark.parametrize("is_fusion", [True, False])
+def test_prefetch(mocker, invoke, is_fusion, mock_get_dataset):
+    dataset_name = "test_prefetch"
+    tbrn = f"tb:{dataset_name}"
+    segment_tbrn = f"{tbrn}@v1.0:segment1"
+
+    result = invoke(prefetch, [f"{tbrn}:segment1://data.png"])
+    assert_cli_fail(
+        result, f'ERROR: "{tbrn}:segment1://data.png" is neither a dataset nor a segment\n'
+    )
+
+    result = invoke(prefetch, [f"{tbrn}#1"])
+    assert_cli_fail(result, "ERROR: Cache is not available for datasets under draft status\n")
+
+    mock_get_dataset(mocker, is_fusion, False)
+    checkout = mocker.patch(f"{dataset.__name__}.DatasetClientBase.checkout")
+    enable_cache = mocker.patch(f"{dataset.__name__}.DatasetClientBase.enable_cache")
+    statistics = DownloadStatistics()
+    statistics.record((0, 1024**2, 1024**2))
+    statistics.elapsed = 2
+    prefetch_ = mocker.patch(
+        f"{dataset.__name__}.DatasetClientBase.prefetch", return_value=statistics
+    )
+
+    result = invoke(prefetch, [segment_tbrn, "-j", "8", "--max-size", "1024"])
+    assert_cli_success(
+        result,
+        f'Successfully prefetched "{segment_tbrn}": '
+        "2 of 3 files downloaded, 2097152 bytes in 2.00s (1.00 MiB/s)\n",
+    )
+    checkout.assert_called_once_with(revision="v1.0")
+    enable_cache.assert_called_once_with("", max_size=1024)
+    prefetch_.assert_called_once_with(("segment1",), jobs=8)
+
+    invoke(prefetch, [tbrn, "--cache-path", "cache"])
+    enable_cache.assert_called_with("cache", max_size=None)
+    prefetch_.assert_called_with(None, jobs=1)
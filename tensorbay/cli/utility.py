@@ -92,6 +92,10 @@ class ContextInfo:
                 client_config.is_internal = config_section.getboolean("is_internal")
             if "max_retries" in config_section:
                 client_config.max_retries = config_section.getint("max_retries")
+            if "checksum_index_path" in config_section:
+                client_config.checksum_index_path = config_section["checksum_index_path"]
+            if "uploaded_objects_path" in config_section:
+                client_config.uploaded_objects_path = config_section["uploaded_objects_path"]
 
     def generate_profiles(self) -> Iterable[Tuple[str, str, str]]:
         """Get all profiles and corresponding profile information.
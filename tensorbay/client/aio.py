@@ -0,0 +1,971 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""The asyncio-native clients of TensorBay.
+
+The clients in this module send the requests of uploading, listing and reading the data by
+``aiohttp`` in an event loop, so a single process can drive thousands of concurrent requests
+with a bounded connection pool. The metadata operations, such as getting the dataset or creating
+the segment, are delegated to the synchronous clients in the default executor.
+
+The optional module ``aiohttp`` is required, install it by ``pip3 install tensorbay[async]``.
+
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from datetime import timedelta
+from functools import partial
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from uuid import uuid4
+
+import filetype
+from requests.models import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+from ulid import from_timestamp
+
+from tensorbay.__version__ import __version__
+from tensorbay.client.dataset import DatasetClient, FusionDatasetClient
+from tensorbay.client.gas import GAS
+from tensorbay.client.journal import get_uploaded_objects
+from tensorbay.client.lazy import LazyPage
+from tensorbay.client.log import ResponseLogging
+from tensorbay.client.requests import Client
+from tensorbay.client.segment import _MASK_KEYS, FusionSegmentClient, SegmentClient
+from tensorbay.dataset import AuthData, Data, Frame, FusionSegment, RemoteData, Segment
+from tensorbay.exception import (
+    FrameError,
+    ModuleImportError,
+    ResponseError,
+    ResponseErrorDistributor,
+)
+from tensorbay.utility import FileMixin, chunked, config
+
+try:
+    import aiohttp
+except ModuleNotFoundError as error:
+    raise ModuleImportError(module_name=error.name) from error
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+_BACKOFF_FACTOR = 0.5
+_CALLBACK_SIZE = 50
+_BYTE_LIMIT = 256 * 1024 * 1024
+
+
+def _run_in_executor(function: Callable[..., _R], *args: Any) -> "asyncio.Future[_R]":
+    return asyncio.get_event_loop().run_in_executor(None, partial(function, *args))
+
+
+def _to_response(
+    aio_response: "aiohttp.ClientResponse", content: bytes, data: Any, elapsed: float
+) -> Response:
+    # The response is converted for reusing the error handling and the logging of requests.
+    request = PreparedRequest()
+    request.method = aio_response.method
+    request.url = str(aio_response.request_info.real_url)
+    request.headers = CaseInsensitiveDict(aio_response.request_info.headers)
+    if request.headers.get("Content-Type", "").startswith("multipart/form-data"):
+        del request.headers["Content-Type"]
+    elif isinstance(data, bytes):
+        request.body = data
+
+    response = Response()
+    response.request = request
+    response.status_code = aio_response.status
+    response.url = str(aio_response.url)
+    response.reason = aio_response.reason  # type: ignore[assignment]
+    response.headers = CaseInsensitiveDict(aio_response.headers)
+    response.encoding = aio_response.charset
+    response.elapsed = timedelta(seconds=elapsed)
+    response._content = content  # pylint: disable=protected-access
+    return response
+
+
+def _encode_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    # aiohttp rejects the boolean query values, encode them in the same way as requests.
+    return {key: str(value) if isinstance(value, bool) else value for key, value in params.items()}
+
+
+class _ByteSemaphore:
+    """The semaphore which bounds the total size of the files being sent concurrently.
+
+    Arguments:
+        limit: The max number of the bytes being sent, a larger file is sent alone.
+
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._available = limit
+        self._condition = asyncio.Condition()
+
+    async def acquire(self, size: int) -> int:
+        """Wait until the given number of bytes can be sent and reserve them.
+
+        Arguments:
+            size: The size of the file to send.
+
+        Returns:
+            The number of the reserved bytes, which should be released after sending.
+
+        """
+        size = min(size, self._limit)
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._available >= size)
+            self._available -= size
+        return size
+
+    async def release(self, size: int) -> None:
+        """Release the reserved bytes.
+
+        Arguments:
+            size: The number of the reserved bytes.
+
+        """
+        async with self._condition:
+            self._available += size
+            self._condition.notify_all()
+
+
+async def _map_unordered(
+    function: Callable[[_T], Awaitable[_R]], arguments: Iterable[_T], jobs: int
+) -> None:
+    iterator = iter(arguments)
+
+    async def _worker() -> None:
+        for argument in iterator:
+            await function(argument)
+
+    await asyncio.gather(*(_worker() for _ in range(jobs)))
+
+
+class AsyncClient:
+    """This class defines the asyncio-native request sender of TensorBay.
+
+    The requests share a connection pool, and the number of concurrent requests is limited by
+    a semaphore. The local files are streamed from the disk, and the total size of the files being
+    sent is limited by another semaphore.
+    The responses are converted to :class:`requests.Response`, so they are parsed and reported in
+    the same way as the synchronous :class:`~tensorbay.client.requests.Client`.
+
+    Arguments:
+        client: The synchronous client which holds the access key and the url.
+        limit: The max number of concurrent requests.
+        byte_limit: The max number of the bytes of the files being sent concurrently.
+
+    """
+
+    def __init__(self, client: Client, limit: int = 100, byte_limit: int = _BYTE_LIMIT) -> None:
+        self._client = client
+        self._limit = limit
+        self._byte_limit = byte_limit
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._byte_semaphore: Optional[_ByteSemaphore] = None
+
+    def _get_session(self) -> Tuple[aiohttp.ClientSession, asyncio.Semaphore, _ByteSemaphore]:
+        # The session and the semaphores are bound to the running event loop when created.
+        if self._session is None or self._semaphore is None or self._byte_semaphore is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._limit),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=config.timeout, sock_read=config.timeout
+                ),
+            )
+            self._semaphore = asyncio.Semaphore(self._limit)
+            self._byte_semaphore = _ByteSemaphore(self._byte_limit)
+
+        return self._session, self._semaphore, self._byte_semaphore
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._semaphore = None
+            self._byte_semaphore = None
+
+    async def do(  # pylint: disable=invalid-name
+        self, method: str, url: str, **kwargs: Any
+    ) -> Response:
+        """Send a request.
+
+        The request is retried as the synchronous session does, according to ``config.max_retries``,
+        ``config.allowed_retry_methods`` and ``config.allowed_retry_status``.
+
+        Arguments:
+            method: The method of the request.
+            url: The URL of the request.
+            **kwargs: Extra keyword arguments to send in the request, the ``data`` can be a function
+                which returns the body, it is called for every attempt, so the streamed files are
+                opened again when retrying.
+
+        Returns:
+            Response of the request.
+
+        Raises:
+            ResponseError: When the status code of the response is unexpected.
+            aiohttp.ClientError: When the request failed in all the attempts.
+
+        """
+        session, semaphore, _ = self._get_session()
+        retries = config.max_retries if method in config.allowed_retry_methods else 0
+        if not config.verify_tls_certificate:
+            kwargs["ssl"] = False
+        body = kwargs.pop("data", None)
+        loop = asyncio.get_event_loop()
+
+        async with semaphore:
+            for retry in range(retries + 1):
+                if retry:
+                    await asyncio.sleep(_BACKOFF_FACTOR * 2 ** (retry - 1))
+
+                data = body() if callable(body) else body
+                start = loop.time()
+                try:
+                    async with session.request(method, url, data=data, **kwargs) as aio_response:
+                        content = await aio_response.read()
+                        response = _to_response(aio_response, content, data, loop.time() - start)
+                except aiohttp.ClientError:
+                    if retry == retries:
+                        raise
+                    continue
+
+                if response.status_code in (200, 201):
+                    logger.debug(ResponseLogging(response))
+                    return response
+
+                if response.status_code not in config.allowed_retry_status:
+                    break
+
+        logger.error(
+            "Unexpected status code(%d)!%s", response.status_code, ResponseLogging(response)
+        )
+        raise ResponseError(response=response)
+
+    async def send_file(
+        self, method: str, url: str, local_path: str, data: Callable[[], Any], **kwargs: Any
+    ) -> Response:
+        """Send a request whose body streams the given local file.
+
+        The request waits until the total size of the files being sent is under the byte limit.
+
+        Arguments:
+            method: The method of the request.
+            url: The URL of the request.
+            local_path: The local path of the file to send.
+            data: The function which returns the body streaming the file of every attempt.
+            **kwargs: Extra keyword arguments to send in the request.
+
+        Returns:
+            Response of the request.
+
+        """
+        _, _, byte_semaphore = self._get_session()
+        size = await byte_semaphore.acquire(os.path.getsize(local_path))
+        try:
+            return await self.do(method, url, data=data, **kwargs)
+        finally:
+            await byte_semaphore.release(size)
+
+    async def open_api_do(
+        self, method: str, section: str, dataset_id: str = "", **kwargs: Any
+    ) -> Response:
+        """Send a request to the TensorBay Open API.
+
+        Arguments:
+            method: The method of the request.
+            section: The section of the request.
+            dataset_id: Dataset ID.
+            **kwargs: Extra keyword arguments to send in the request.
+
+        Raises:
+            ResponseError: When the status code OpenAPI returns is unexpected.
+
+        Returns:
+            Response of the request.
+
+        """
+        headers = kwargs.setdefault("headers", {})
+        headers["X-Token"] = self._client.access_key
+        headers[
+            "X-Source"
+        ] = f"{config._x_source}/{__version__}"  # pylint: disable=protected-access
+        headers["X-Request-Id"] = uuid4().hex
+
+        if "params" in kwargs:
+            kwargs["params"] = _encode_params(kwargs["params"])
+
+        url = self._client._url_make(section, dataset_id)  # pylint: disable=protected-access
+        try:
+            return await self.do(method, url, **kwargs)
+        except ResponseError as error:
+            response = error.response
+            error_code = response.json()["code"]
+            raise ResponseErrorDistributor.get(error_code, ResponseError)(
+                response=response
+            ) from None
+
+
+class AsyncSegmentClientBase:
+    """This class defines the basic concept of the asyncio-native segment client.
+
+    Arguments:
+        segment_client: The synchronous segment client.
+        client: The asyncio-native request sender.
+
+    """
+
+    def __init__(
+        self, segment_client: Union[SegmentClient, FusionSegmentClient], client: AsyncClient
+    ) -> None:
+        self._segment_client = segment_client
+        self._client = client
+        self._name = segment_client.name
+        self._dataset_id = segment_client._dataset_id  # pylint: disable=protected-access
+        self._status = segment_client.status
+
+    @property
+    def name(self) -> str:
+        """Return the segment name.
+
+        Returns:
+            The segment name.
+
+        """
+        return self._name
+
+    async def _post_formdata(
+        self, url: str, local_path: str, file_type: str, data: Dict[str, Any], filename: str
+    ) -> None:
+        def _get_form() -> aiohttp.FormData:
+            form = aiohttp.FormData(data)
+            # The file is closed by aiohttp after it is sent.
+            fp = open(local_path, "rb")  # pylint: disable=consider-using-with
+            form.add_field("file", fp, filename=filename, content_type=file_type)
+            return form
+
+        await self._client.send_file("POST", url, local_path, _get_form)
+
+    async def _post_multipart_formdata(
+        self, url: str, local_path: str, file_type: str, data: Dict[str, Any], filename: str = ""
+    ) -> None:
+        if "x-amz-date" in data:
+            data["Content-Type"] = file_type
+
+        try:
+            await self._post_formdata(url, local_path, file_type, data, filename)
+        except ResponseError as error:
+            if b"MalformedPOSTRequest" in error.response.content:
+                await self._post_formdata(
+                    url, local_path, file_type, data, "workaroundForMalformedPostRequest"
+                )
+            else:
+                raise
+
+    async def _upload_file(self, data: FileMixin) -> None:
+        """Upload the file in the data to the draft.
+
+        The file is streamed from the disk, large files are not uploaded by blocks.
+
+        Arguments:
+            data: The data instance needs to be uploaded.
+
+        """
+        permission = await _run_in_executor(
+            self._segment_client._get_upload_permission  # pylint: disable=protected-access
+        )
+        checksum = await _run_in_executor(data.get_checksum)
+
+        post_data = dict(permission["result"], key=permission["extra"]["objectPrefix"] + checksum)
+
+        host = permission["extra"]["host"]
+        backend_type = permission["extra"]["backendType"]
+
+        # The record of the uploaded objects may be a SQLite database, which blocks the event loop.
+        uploaded_objects = await _run_in_executor(
+            get_uploaded_objects, config.uploaded_objects_path
+        )
+        object_key = f"{host}/{post_data['key']}"
+        if await _run_in_executor(uploaded_objects.__contains__, object_key):
+            return
+
+        local_path = data.path
+        file_type = await _run_in_executor(filetype.guess_mime, local_path)
+
+        if backend_type == "azure":
+            url = (
+                f'{permission["extra"]["host"]}{permission["extra"]["objectPrefix"]}'
+                f'{checksum}?{permission["result"]["token"]}'
+            )
+            request_headers = {
+                "x-ms-blob-content-type": file_type,
+                "x-ms-blob-type": post_data["x-ms-blob-type"],
+            }
+            await self._client.send_file(
+                "PUT", url, local_path, partial(open, local_path, "rb"), headers=request_headers
+            )
+        elif backend_type == "fps":
+            await self._post_multipart_formdata(host, local_path, file_type, post_data, checksum)
+        else:
+            await self._post_multipart_formdata(host, local_path, file_type, post_data)
+
+        await _run_in_executor(uploaded_objects.add, object_key)
+
+    async def _upload_mask_files(self, data: Data) -> None:
+        masks = (getattr(data.label, key, None) for key in _MASK_KEYS)
+        await asyncio.gather(*(self._upload_file(mask) for mask in masks if mask))
+
+    async def _synchronize_import_info(self, callback_bodies: Tuple[Dict[str, Any], ...]) -> None:
+        put_data: Dict[str, Any] = {
+            "segmentName": self._name,
+            "objects": callback_bodies,
+            "deleteSource": False,
+        }
+        put_data.update(self._status.get_status_info())
+
+        await self._client.open_api_do(
+            "PUT", "multi/cloud-callback", self._dataset_id, json=put_data
+        )
+
+    async def _synchronize_upload_info(self, callback_bodies: Tuple[Dict[str, Any], ...]) -> None:
+        put_data: Dict[str, Any] = {
+            "segmentName": self._name,
+            "objects": callback_bodies,
+        }
+        put_data.update(self._status.get_status_info())
+
+        await self._client.open_api_do("PUT", "multi/callback", self._dataset_id, json=put_data)
+
+    async def _list_pages(
+        self, section: str, page_size: Optional[int] = None
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """List all the pages of the given section in order.
+
+        Like iterating a :class:`~tensorbay.client.lazy.PagingList`, the pages after the current
+        page are requested ahead concurrently by ``config.prefetch_pages``, so the concurrent
+        requests and the pages held in memory are bounded.
+
+        Arguments:
+            section: The section of the paging requests.
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
+
+        Yields:
+            The offsets and the responses of the pages.
+
+        """
+        limit = page_size if page_size else config.page_size
+
+        async def _list_page(offset: int) -> Tuple[int, Dict[str, Any]]:
+            params: Dict[str, Any] = {"segmentName": self._name, "offset": offset, "limit": limit}
+            params.update(self._status.get_status_info())
+
+            if config.is_internal:
+                params["isInternal"] = True
+
+            response = await self._client.open_api_do(
+                "GET", section, self._dataset_id, params=params
+            )
+            return offset, response.json()
+
+        page = await _list_page(0)
+        offsets = iter(range(limit, page[1]["totalCount"], limit))
+        pending: Deque["asyncio.Future[Tuple[int, Dict[str, Any]]]"] = deque()
+        try:
+            while True:
+                pending.extend(
+                    asyncio.ensure_future(_list_page(offset))
+                    for offset in islice(offsets, config.prefetch_pages - len(pending))
+                )
+                yield page
+
+                if pending:
+                    page = await pending.popleft()
+                    continue
+
+                offset = next(offsets, None)
+                if offset is None:
+                    return
+                page = await _list_page(offset)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def read(self, data: RemoteData) -> bytes:
+        """Read the content of the remote data.
+
+        The url of the data is refreshed once if it is expired.
+
+        Arguments:
+            data: The remote data to read.
+
+        Returns:
+            The content of the remote data.
+
+        Raises:
+            ResponseError: When the status code of the response is unexpected.
+
+        """
+        try:
+            response = await self._client.do("GET", data.get_url())
+        except ResponseError as error:
+            if error.response.status_code != 403:
+                raise
+            await _run_in_executor(data.url.update)  # type: ignore[union-attr]
+            response = await self._client.do("GET", data.get_url())
+
+        return response.content
+
+
+class AsyncSegmentClient(AsyncSegmentClientBase):
+    """This class defines the asyncio-native :class:`~tensorbay.client.segment.SegmentClient`.
+
+    Arguments:
+        segment_client: The synchronous segment client.
+        client: The asyncio-native request sender.
+
+    """
+
+    _segment_client: SegmentClient
+
+    async def _upload_data(self, data: Data) -> Dict[str, Any]:
+        await asyncio.gather(self._upload_file(data), self._upload_mask_files(data))
+        return data.get_callback_body()
+
+    async def upload_file(self, local_path: str, target_remote_path: str = "") -> None:
+        """Upload data with local path to the draft.
+
+        Arguments:
+            local_path: The local path of the data to upload.
+            target_remote_path: The path to save the data in segment client.
+
+        """
+        self._status.check_authority_for_draft()
+
+        data = Data(local_path, target_remote_path=target_remote_path)
+        await self._upload_file(data)
+
+        await self._synchronize_upload_info((data.get_callback_body(),))
+
+    async def upload_data(self, data: Data) -> None:
+        """Upload Data object to the draft.
+
+        Arguments:
+            data: The :class:`~tensorbay.dataset.data.Data`.
+
+        """
+        self._status.check_authority_for_draft()
+        await self._synchronize_upload_info((await self._upload_data(data),))
+
+    async def upload_data_list(self, data_list: Iterable[Union[Data, AuthData]], jobs: int) -> None:
+        """Upload the data concurrently and send the callbacks by batches.
+
+        Arguments:
+            data_list: The data to upload, :class:`~tensorbay.dataset.data.AuthData` is imported.
+            jobs: The number of the data uploaded concurrently.
+
+        """
+        self._status.check_authority_for_draft()
+        callback_bodies: List[Dict[str, Any]] = []
+
+        async def _upload(data: Union[Data, AuthData]) -> None:
+            if isinstance(data, AuthData):
+                await self._synchronize_import_info((data.get_callback_body(),))
+                return
+
+            callback_bodies.append(await self._upload_data(data))
+            if len(callback_bodies) >= _CALLBACK_SIZE:
+                chunk = tuple(callback_bodies)
+                callback_bodies.clear()
+                await self._synchronize_upload_info(chunk)
+
+        await _map_unordered(_upload, data_list, jobs)
+        if callback_bodies:
+            await self._synchronize_upload_info(tuple(callback_bodies))
+
+    async def list_data_paths(self, *, page_size: Optional[int] = None) -> AsyncIterator[str]:
+        """List required data path in a segment in a certain commit.
+
+        Arguments:
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
+
+        Yields:
+            The data paths.
+
+        """
+        async for _, response in self._list_pages("data", page_size):
+            for item in response["data"]:
+                yield item["remotePath"]
+
+    async def get_data(self, remote_path: str) -> RemoteData:
+        """Get required Data object from a dataset segment.
+
+        Arguments:
+            remote_path: The remote paths of the required data.
+
+        Returns:
+            :class:`~tensorbay.dataset.data.RemoteData`.
+
+        """
+        return await _run_in_executor(self._segment_client.get_data, remote_path)
+
+    async def list_data(self, *, page_size: Optional[int] = None) -> AsyncIterator[RemoteData]:
+        """List required Data object in a dataset segment.
+
+        Arguments:
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
+
+        Yields:
+            The :class:`~tensorbay.dataset.data.RemoteData`.
+
+        """
+        get_remote_data = self._segment_client._get_remote_data  # pylint: disable=protected-access
+        async for _, response in self._list_pages("data/details", page_size):
+            for item in response["dataDetails"]:
+                yield get_remote_data(item)
+
+
+class AsyncFusionSegmentClient(AsyncSegmentClientBase):
+    """This class defines the asyncio-native :class:`~tensorbay.client.segment.FusionSegmentClient`.
+
+    Arguments:
+        segment_client: The synchronous fusion segment client.
+        client: The asyncio-native request sender.
+
+    """
+
+    _segment_client: FusionSegmentClient
+
+    async def _upload_sensor_data(
+        self, sensor_name: str, data: Union[Data, AuthData], frame_id: str
+    ) -> Optional[Dict[str, Any]]:
+        callback_body = data.get_callback_body()
+        callback_body["frameId"] = frame_id
+        callback_body["sensorName"] = sensor_name
+
+        if isinstance(data, Data):
+            await asyncio.gather(self._upload_file(data), self._upload_mask_files(data))
+            return callback_body
+
+        await self._synchronize_import_info((callback_body,))
+        return None
+
+    async def upload_frame(self, frame: Frame, timestamp: Optional[float] = None) -> None:
+        """Upload frame to the draft.
+
+        Arguments:
+            frame: The :class:`~tensorbay.dataset.frame.Frame` to upload.
+            timestamp: The mark to sort frames, supporting timestamp and float.
+
+        Raises:
+            FrameError: When lacking frame id or frame id conflicts.
+
+        """
+        self._status.check_authority_for_draft()
+
+        if timestamp is None:
+            try:
+                frame_id = frame.frame_id
+            except AttributeError as error:
+                raise FrameError(
+                    "Lack frame id, please add frame id in frame or "
+                    "give timestamp to the function!"
+                ) from error
+        elif not hasattr(frame, "frame_id"):
+            frame_id = from_timestamp(timestamp)
+        else:
+            raise FrameError("Frame id conflicts, please do not give timestamp to the function!.")
+
+        results = await asyncio.gather(
+            *(
+                self._upload_sensor_data(sensor_name, data, frame_id.str)
+                for sensor_name, data in frame.items()
+                if isinstance(data, (Data, AuthData))
+            )
+        )
+        callback_bodies = [result for result in results if result is not None]
+        for chunked_callback_bodies in chunked(callback_bodies, _CALLBACK_SIZE):
+            await self._synchronize_upload_info(chunked_callback_bodies)
+
+    async def list_frames(self, *, page_size: Optional[int] = None) -> AsyncIterator[Frame]:
+        """List required frames in the segment in a certain commit.
+
+        Arguments:
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
+
+        Yields:
+            The :class:`~tensorbay.dataset.frame.Frame`.
+
+        """
+        limit = page_size if page_size else config.page_size
+        cache_path = self._segment_client._cache_path  # pylint: disable=protected-access
+        file_cache = self._segment_client._file_cache  # pylint: disable=protected-access
+
+        async for offset, response in self._list_pages("data/details", page_size):
+            url_page = LazyPage.from_items(
+                offset,
+                limit,
+                self._segment_client._generate_urls,  # pylint: disable=protected-access
+                (
+                    {frame["sensorName"]: frame["url"] for frame in item["frame"]}
+                    for item in response["dataDetails"]
+                ),
+            )
+            for index, item in enumerate(response["dataDetails"]):
+                yield Frame.from_response_body(
+                    item, index, url_page, cache_path=cache_path, file_cache=file_cache
+                )
+
+
+class AsyncDatasetClient:
+    """This class defines the asyncio-native :class:`~tensorbay.client.dataset.DatasetClient`.
+
+    Arguments:
+        dataset_client: The synchronous dataset client.
+        client: The asyncio-native request sender.
+
+    """
+
+    def __init__(self, dataset_client: DatasetClient, client: AsyncClient) -> None:
+        self._dataset_client = dataset_client
+        self._client = client
+
+    @property
+    def dataset_client(self) -> DatasetClient:
+        """Return the synchronous dataset client for the metadata operations.
+
+        Returns:
+            The synchronous dataset client.
+
+        """
+        return self._dataset_client
+
+    async def get_segment(self, name: str = "default") -> AsyncSegmentClient:
+        """Get a segment in a certain commit according to given name.
+
+        Arguments:
+            name: The name of the required segment.
+
+        Returns:
+            The required :class:`AsyncSegmentClient`.
+
+        """
+        segment_client = await _run_in_executor(self._dataset_client.get_segment, name)
+        return AsyncSegmentClient(segment_client, self._client)
+
+    async def get_or_create_segment(self, name: str = "default") -> AsyncSegmentClient:
+        """Get or create a segment with the given name.
+
+        Arguments:
+            name: The name of the segment.
+
+        Returns:
+            The created :class:`AsyncSegmentClient` with given name.
+
+        """
+        segment_client = await _run_in_executor(self._dataset_client.get_or_create_segment, name)
+        return AsyncSegmentClient(segment_client, self._client)
+
+    async def upload_segment(self, segment: Segment, *, jobs: int = 100) -> AsyncSegmentClient:
+        """Upload a :class:`~tensorbay.dataset.segment.Segment` to the dataset.
+
+        Arguments:
+            segment: The :class:`~tensorbay.dataset.segment.Segment` to upload.
+            jobs: The number of the data uploaded concurrently.
+
+        Returns:
+            The :class:`AsyncSegmentClient` used for uploading the data in the segment.
+
+        """
+        segment_client = await self.get_or_create_segment(segment.name)
+        await segment_client.upload_data_list(
+            (data for data in segment if isinstance(data, (Data, AuthData))), jobs
+        )
+        return segment_client
+
+
+class AsyncFusionDatasetClient:
+    """This class defines the asyncio-native :class:`~tensorbay.client.dataset.FusionDatasetClient`.
+
+    Arguments:
+        dataset_client: The synchronous fusion dataset client.
+        client: The asyncio-native request sender.
+
+    """
+
+    def __init__(self, dataset_client: FusionDatasetClient, client: AsyncClient) -> None:
+        self._dataset_client = dataset_client
+        self._client = client
+
+    @property
+    def dataset_client(self) -> FusionDatasetClient:
+        """Return the synchronous fusion dataset client for the metadata operations.
+
+        Returns:
+            The synchronous fusion dataset client.
+
+        """
+        return self._dataset_client
+
+    async def get_segment(self, name: str = "default") -> AsyncFusionSegmentClient:
+        """Get a fusion segment in a certain commit according to given name.
+
+        Arguments:
+            name: The name of the required fusion segment.
+
+        Returns:
+            The required :class:`AsyncFusionSegmentClient`.
+
+        """
+        segment_client = await _run_in_executor(self._dataset_client.get_segment, name)
+        return AsyncFusionSegmentClient(segment_client, self._client)
+
+    async def get_or_create_segment(self, name: str = "default") -> AsyncFusionSegmentClient:
+        """Get or create a fusion segment with the given name.
+
+        Arguments:
+            name: The name of the fusion segment.
+
+        Returns:
+            The created :class:`AsyncFusionSegmentClient` with given name.
+
+        """
+        segment_client = await _run_in_executor(self._dataset_client.get_or_create_segment, name)
+        return AsyncFusionSegmentClient(segment_client, self._client)
+
+    async def upload_segment(
+        self, segment: FusionSegment, *, jobs: int = 100
+    ) -> AsyncFusionSegmentClient:
+        """Upload a fusion segment object to the draft.
+
+        Arguments:
+            segment: The :class:`~tensorbay.dataset.segment.FusionSegment` to upload.
+            jobs: The number of the frames uploaded concurrently.
+
+        Returns:
+            The :class:`AsyncFusionSegmentClient` used for uploading the frames in the segment.
+
+        Raises:
+            FrameError: When the frames do not have the same patterns.
+
+        """
+        segment_client = await self.get_or_create_segment(segment.name)
+        for sensor in segment.sensors:
+            await _run_in_executor(
+                segment_client._segment_client.upload_sensor,  # pylint: disable=protected-access
+                sensor,
+            )
+
+        if not segment:
+            return segment_client
+
+        have_frame_id = hasattr(segment[0], "frame_id")
+        if any(hasattr(frame, "frame_id") != have_frame_id for frame in segment):
+            raise FrameError(
+                "All the frames should have the same patterns(all have frame id or not)."
+            )
+
+        if have_frame_id:
+            await _map_unordered(segment_client.upload_frame, segment, jobs)
+        else:
+            await _map_unordered(
+                lambda args: segment_client.upload_frame(args[1], 10 * args[0] + 10),
+                enumerate(segment),
+                jobs,
+            )
+
+        return segment_client
+
+
+_DATASET_CLIENTS: Dict[
+    Type[Union[DatasetClient, FusionDatasetClient]],
+    Type[Union[AsyncDatasetClient, AsyncFusionDatasetClient]],
+] = {DatasetClient: AsyncDatasetClient, FusionDatasetClient: AsyncFusionDatasetClient}
+
+
+class AsyncGAS:
+    """:class:`AsyncGAS` defines the asyncio-native :class:`~tensorbay.client.gas.GAS`.
+
+    Use it as an asynchronous context manager, or call :meth:`AsyncGAS.close` to close the
+    connection pool after using.
+
+    Arguments:
+        access_key: User's access key.
+        url: The host URL of the gas website.
+        limit: The max number of concurrent requests.
+        byte_limit: The max number of the bytes of the files being uploaded concurrently.
+
+    """
+
+    def __init__(
+        self, access_key: str, url: str = "", *, limit: int = 100, byte_limit: int = _BYTE_LIMIT
+    ) -> None:
+        self._gas = GAS(access_key, url)
+        self._client = AsyncClient(
+            self._gas._client, limit, byte_limit  # pylint: disable=protected-access
+        )
+
+    async def __aenter__(self) -> "AsyncGAS":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    @property
+    def gas(self) -> GAS:
+        """Return the synchronous GAS client for the metadata operations.
+
+        Returns:
+            The synchronous GAS client.
+
+        """
+        return self._gas
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self._client.close()
+
+    async def get_dataset(
+        self, name: str, is_fusion: bool = False
+    ) -> Union[AsyncDatasetClient, AsyncFusionDatasetClient]:
+        """Get a TensorBay dataset with given name and commit ID.
+
+        Arguments:
+            name: The name of the requested dataset.
+            is_fusion: Whether the dataset is a fusion dataset, True for fusion dataset.
+
+        Returns:
+            The requested :class:`AsyncDatasetClient` or :class:`AsyncFusionDatasetClient`.
+
+        """
+        dataset_client = await _run_in_executor(self._gas.get_dataset, name, is_fusion)
+        return _DATASET_CLIENTS[type(dataset_client)](
+            dataset_client, self._client  # type: ignore[arg-type]
+        )
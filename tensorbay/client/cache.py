@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""The local cache of the remote dataset on TensorBay."""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+from _io import BufferedReader
+from contextlib import contextmanager
+from hashlib import sha1
+from threading import Lock
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from tensorbay.utility import RemoteFileMixin, ReprMixin
+from tensorbay.utility.checksum import get_url_checksum
+from tensorbay.utility.sqlite import Database
+
+if sys.platform == "win32":
+    import msvcrt  # pylint: disable=import-error
+
+    def _lock_file(fp: IO[bytes]) -> None:
+        fp.seek(0)
+        while True:
+            try:
+                msvcrt.locking(fp.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # The locking gives up after 10 seconds, keep waiting for the other processes.
+                continue
+
+    def _unlock_file(fp: IO[bytes]) -> None:
+        fp.seek(0)
+        msvcrt.locking(fp.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(fp: IO[bytes]) -> None:
+        fcntl.flock(fp.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(fp: IO[bytes]) -> None:
+        fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+
+
+_THREAD_LOCKS: Dict[str, Lock] = {}
+_THREAD_LOCKS_LOCK = Lock()
+
+
+class MetadataCache:
+    """This class defines the persistent cache of the data details in committed datasets.
+
+    The data details of a commit are immutable, so the pages of the data details listed from
+    TensorBay are stored in a SQLite database, which is keyed by commit id, segment name and the
+    index of the data in the segment.
+
+    Arguments:
+        path: The path of the SQLite database file.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        self._database = Database(path)
+
+        with self._database.connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS total_counts ("
+                "commit_id TEXT, segment_name TEXT, total_count INTEGER, "
+                "PRIMARY KEY (commit_id, segment_name))"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS data_details ("
+                "commit_id TEXT, segment_name TEXT, data_index INTEGER, body TEXT, "
+                "PRIMARY KEY (commit_id, segment_name, data_index))"
+            )
+
+    def get_data_details(
+        self, commit_id: str, segment_name: str, offset: int, limit: int
+    ) -> Optional[Dict[str, Any]]:
+        """Get a page of data details from the cache.
+
+        Arguments:
+            commit_id: The commit id of the data details.
+            segment_name: The segment name of the data details.
+            offset: The offset of the page.
+            limit: The limit of the page.
+
+        Returns:
+            The page in the same format as the response of the data details listing request,
+            None if the page is not entirely cached.
+
+        """
+        with self._database.connect() as connection:
+            row = connection.execute(
+                "SELECT total_count FROM total_counts WHERE commit_id = ? AND segment_name = ?",
+                (commit_id, segment_name),
+            ).fetchone()
+            if row is None:
+                return None
+
+            total_count = row[0]
+            stop = min(offset + limit, total_count)
+            bodies = connection.execute(
+                "SELECT body FROM data_details WHERE commit_id = ? AND segment_name = ? "
+                "AND data_index >= ? AND data_index < ? ORDER BY data_index",
+                (commit_id, segment_name, offset, stop),
+            ).fetchall()
+
+        if len(bodies) != max(stop - offset, 0):
+            return None
+
+        return {
+            "dataDetails": [json.loads(body) for body, in bodies],
+            "totalCount": total_count,
+        }
+
+    def put_data_details(
+        self,
+        commit_id: str,
+        segment_name: str,
+        offset: int,
+        data_details: Iterable[Dict[str, Any]],
+        total_count: int,
+    ) -> None:
+        """Put a page of data details into the cache.
+
+        Arguments:
+            commit_id: The commit id of the data details.
+            segment_name: The segment name of the data details.
+            offset: The offset of the page.
+            data_details: The data details in the page.
+            total_count: The total count of the data in the segment.
+
+        """
+        with self._database.connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO total_counts VALUES (?, ?, ?)",
+                (commit_id, segment_name, total_count),
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO data_details VALUES (?, ?, ?, ?)",
+                (
+                    (commit_id, segment_name, index, json.dumps(body))
+                    for index, body in enumerate(data_details, offset)
+                ),
+            )
+
+
+class _DirectoryLock:
+    """This class defines the lock of a directory shared by the threads and the processes.
+
+    The threads in a process are serialized by a thread lock keyed by the real path of the
+    directory, and the processes are serialized by locking the lock file under the directory.
+
+    Arguments:
+        path: The path of the directory.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = os.path.join(path, "lock")
+        with _THREAD_LOCKS_LOCK:
+            self._thread_lock = _THREAD_LOCKS.setdefault(os.path.realpath(path), Lock())
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        """Hold the lock of the directory.
+
+        Yields:
+            None when the lock is held.
+
+        """
+        with self._thread_lock, open(self._path, "a+b") as fp:
+            _lock_file(fp)
+            try:
+                yield
+            finally:
+                _unlock_file(fp)
+
+
+class FileCache:  # pylint: disable=too-many-instance-attributes
+    """This class defines the size-bounded, content-addressed cache of the remote files.
+
+    The files are stored by their content keys under ``<path>/objects``, so the identical files in
+    different commits and datasets are stored and downloaded only once. The content key is the
+    checksum in the URL of the file on TensorBay, or the hash of the cache location of the file
+    when the URL is not addressed by the checksum.
+
+    The cache locations of the files, the sizes and the access records of the stored files are
+    kept in a SQLite index under ``<path>``. When the total size exceeds the byte budget, the least
+    recently used files, or the least frequently used files for the "lfu" policy, are evicted.
+    The eviction is serialized by the lock file under ``<path>``, so the cache can be shared by
+    the threads, the instances and the processes.
+
+    Arguments:
+        path: The root directory of the cache, which can be shared by datasets.
+        max_size: The byte budget of the cache, None for no limit.
+        policy: The eviction policy, "lru" or "lfu".
+
+    Attributes:
+        hits: The number of the files opened from the cache by this instance.
+        misses: The number of the files downloaded or not found in the index by this instance.
+
+    Raises:
+        ValueError: When the eviction policy is not supported.
+
+    """
+
+    _ORDERS = {
+        "lru": "last_access",
+        "lfu": "access_count, last_access",
+    }
+
+    def __init__(self, path: str, *, max_size: Optional[int] = None, policy: str = "lru") -> None:
+        if policy not in self._ORDERS:
+            raise ValueError(f'Unsupported eviction policy "{policy}", use "lru" or "lfu"')
+
+        self.path = path
+        self.max_size = max_size
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+
+        os.makedirs(path, exist_ok=True)
+        self._directory_lock = _DirectoryLock(path)
+        self._database = Database(os.path.join(path, "index.db"))
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS objects ("
+                "key TEXT PRIMARY KEY, size INTEGER, last_access REAL, access_count INTEGER)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS locations (location TEXT PRIMARY KEY, key TEXT)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        with self._database.connect() as connection:
+            # The index is updated on every access, losing the latest records on power failure only
+            # affects the eviction order, so the index is not synced to disk on every commit.
+            connection.execute("PRAGMA synchronous = OFF")
+            yield connection
+
+    def _get_object_path(self, key: str) -> str:
+        return os.path.join(self.path, "objects", key[:2], key)
+
+    def _lookup(self, location: str) -> Optional[str]:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT key FROM locations WHERE location = ?", (location,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            key: str = row[0]
+            cursor = connection.execute(
+                "UPDATE objects SET last_access = ?, access_count = access_count + 1 "
+                "WHERE key = ?",
+                (time.time(), key),
+            )
+            return key if cursor.rowcount else None
+
+    def _put(self, location: str, key: str, size: int) -> None:
+        with self._connect() as connection:
+            now = time.time()
+            connection.execute(
+                "INSERT OR IGNORE INTO objects VALUES (?, ?, ?, 0)", (key, size, now)
+            )
+            connection.execute(
+                "UPDATE objects SET last_access = ?, access_count = access_count + 1 "
+                "WHERE key = ?",
+                (now, key),
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO locations VALUES (?, ?)",
+                (location, key),
+            )
+
+    def _evict(self, keep: str) -> None:
+        if self.max_size is None:
+            return
+
+        with self._connect() as connection:
+            total_size = connection.execute("SELECT TOTAL(size) FROM objects").fetchone()[0]
+            if total_size <= self.max_size:
+                return
+
+            evicted = []
+            order = self._ORDERS[self.policy]
+            for key, size in connection.execute(
+                f"SELECT key, size FROM objects WHERE key != ? ORDER BY {order}", (keep,)
+            ):
+                if total_size <= self.max_size:
+                    break
+                evicted.append((key,))
+                total_size -= size
+
+            connection.executemany("DELETE FROM objects WHERE key = ?", evicted)
+            connection.executemany("DELETE FROM locations WHERE key = ?", evicted)
+
+        for (key,) in evicted:
+            try:
+                os.remove(self._get_object_path(key))
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _get_key(file: RemoteFileMixin) -> str:
+        checksum = get_url_checksum(file.get_url())
+        if checksum:
+            return checksum
+
+        return sha1(file.cache_path.encode()).hexdigest()
+
+    def _store(self, file: RemoteFileMixin) -> Tuple[BufferedReader, int]:
+        key = self._get_key(file)
+        object_path = self._get_object_path(key)
+        is_downloaded = False
+        while True:
+            # The files are only evicted under the directory lock after they are put into the
+            # index, so the file opened under the lock is put into the index before it is evicted,
+            # and the file opened by the others stays readable after it is evicted.
+            with self._directory_lock.hold():
+                try:
+                    fp = open(object_path, "rb")  # pylint: disable=consider-using-with
+                except FileNotFoundError:
+                    pass
+                else:
+                    size = os.fstat(fp.fileno()).st_size
+                    self._put(file.cache_path, key, size)
+                    self._evict(key)
+                    return fp, size if is_downloaded else 0
+
+            # The downloaded file is not in the index yet, it can not be evicted by the others.
+            file._write_cache(object_path)  # pylint: disable=protected-access
+            is_downloaded = True
+
+    @property
+    def size(self) -> int:
+        """Return the total size of the files in the cache.
+
+        Returns:
+            The total size of the files in bytes.
+
+        """
+        with self._connect() as connection:
+            return int(connection.execute("SELECT TOTAL(size) FROM objects").fetchone()[0])
+
+    def open(self, file: RemoteFileMixin) -> BufferedReader:
+        """Open the remote file from the cache, the file is downloaded into the cache if missing.
+
+        Arguments:
+            file: The remote file, whose ``cache_path`` is used as its location in the cache.
+
+        Returns:
+            The binary file pointer of the cached file.
+
+        """
+        location = file.cache_path
+        key = self._lookup(location)
+        if key is not None:
+            try:
+                fp = open(self._get_object_path(key), "rb")  # pylint: disable=consider-using-with
+            except FileNotFoundError:
+                pass
+            else:
+                with self._lock:
+                    self.hits += 1
+                return fp
+
+        with self._lock:
+            self.misses += 1
+
+        fp, _ = self._store(file)
+        return fp
+
+    def fetch(self, file: RemoteFileMixin) -> int:
+        """Download the remote file into the cache if it is missing.
+
+        Arguments:
+            file: The remote file, whose ``cache_path`` is used as its location in the cache.
+
+        Returns:
+            The number of the downloaded bytes, 0 when the file is already in the cache.
+
+        """
+        key = self._lookup(file.cache_path)
+        if key is not None and os.path.exists(self._get_object_path(key)):
+            return 0
+
+        fp, size = self._store(file)
+        fp.close()
+        return size
+
+
+class DownloadStatistics(ReprMixin):
+    """This class records the statistics of downloading the remote files.
+
+    Attributes:
+        file_count: The number of the remote files which are downloaded or skipped.
+        downloaded_count: The number of the downloaded files.
+        downloaded_size: The total size of the downloaded files in bytes.
+        elapsed: The elapsed time of downloading in seconds.
+
+    """
+
+    _repr_attrs = ("file_count", "downloaded_count", "downloaded_size", "elapsed")
+
+    def __init__(self) -> None:
+        self.file_count = 0
+        self.downloaded_count = 0
+        self.downloaded_size = 0
+        self.elapsed = 0.0
+        self._lock = Lock()
+        self._start = time.monotonic()
+
+    @property
+    def throughput(self) -> float:
+        """Return the download throughput.
+
+        Returns:
+            The download throughput in bytes per second.
+
+        """
+        return self.downloaded_size / self.elapsed if self.elapsed else 0.0
+
+    def record(self, sizes: Tuple[int, ...]) -> None:
+        """Record the downloaded sizes of the files.
+
+        Arguments:
+            sizes: The downloaded sizes of the files, 0 for the skipped files.
+
+        """
+        with self._lock:
+            self.file_count += len(sizes)
+            self.downloaded_count += sum(1 for size in sizes if size)
+            self.downloaded_size += sum(sizes)
+            self.elapsed = time.monotonic() - self._start
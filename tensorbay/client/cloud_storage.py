@@ -5,11 +5,11 @@
 
 """Related classes for the Storage Config."""
 
-from typing import Any, Dict, Iterator, List, Type, TypeVar
+from typing import Any, Dict, Iterator, List, Optional, Type, TypeVar
 
 from tensorbay.client.requests import Client
 from tensorbay.dataset import AuthData
-from tensorbay.utility import URL, AttrsMixin, ReprMixin, attr, camel, common_loads
+from tensorbay.utility import URL, AttrsMixin, ReprMixin, attr, camel, common_loads, config
 
 
 class CloudClient:
@@ -34,8 +34,8 @@ class CloudClient:
         response = self._client.open_api_do("GET", self._make_section("files/urls"), params=params)
         return response.json()["url"]  # type: ignore[no-any-return]
 
-    def _list_files(self, path: str, limit: int = 128) -> Iterator[str]:
-        params: Dict[str, Any] = {"prefix": path, "limit": limit}
+    def _list_files(self, path: str, limit: Optional[int] = None) -> Iterator[str]:
+        params: Dict[str, Any] = {"prefix": path, "limit": limit or config.page_size}
 
         while True:
             response = self._client.open_api_do(
@@ -7,35 +7,54 @@
 
 import functools
 import logging
-import os
-import shutil
-import tempfile
-from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, Iterator, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from ulid import ULID, from_timestamp
 
+from tensorbay.client.cache import FileCache, MetadataCache
 from tensorbay.client.diff import DataDiff, DatasetDiff, SegmentDiff
+from tensorbay.client.download import DatasetDownloadMixin, DownloadMixin
 from tensorbay.client.lazy import PagingList
 from tensorbay.client.log import (
-    CACHE_SPACE_WARNING,
     UPLOAD_SEGMENT_RESUME_TEMPLATE_CLI,
     UPLOAD_SEGMENT_RESUME_TEMPLATE_SDK,
 )
+from tensorbay.client.remote_paths import RemotePathSet, get_journal_path
 from tensorbay.client.requests import multithread_upload
-from tensorbay.client.segment import _STRATEGIES, FusionSegmentClient, SegmentClient
+from tensorbay.client.segment import _MASK_KEYS, _STRATEGIES, FusionSegmentClient, SegmentClient
 from tensorbay.client.statistics import Statistics
 from tensorbay.client.status import Status
+from tensorbay.client.sync import SyncMixin
 from tensorbay.client.version import BasicSearch, SquashAndMerge, VersionControlMixin
-from tensorbay.dataset import AuthData, Data, Frame, FusionSegment, Notes, RemoteData, Segment
+from tensorbay.dataset import (
+    AuthData,
+    Data,
+    Frame,
+    FusionSegment,
+    Notes,
+    RemoteData,
+    Segment,
+    StreamSegment,
+)
 from tensorbay.exception import (
     FrameError,
     InvalidParamsError,
     NameConflictError,
     ResourceNotExistError,
-    StatusError,
 )
 from tensorbay.label import Catalog
-from tensorbay.utility import Tqdm
+from tensorbay.utility import RemoteFileMixin, Tqdm, config
 
 if TYPE_CHECKING:
     from tensorbay.client.gas import GAS
@@ -43,7 +62,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class DatasetClientBase(VersionControlMixin):
+class DatasetClientBase(
+    VersionControlMixin, DownloadMixin
+):  # pylint: disable=too-many-instance-attributes
     """This class defines the basic concept of the dataset client.
 
     A :class:`DatasetClientBase` contains the information needed for
@@ -83,6 +104,8 @@ class DatasetClientBase(VersionControlMixin):
         self._alias = alias
         self._is_public = is_public
         self._cache_path: str = ""
+        self._metadata_cache: Optional[MetadataCache] = None
+        self._file_cache: Optional[FileCache] = None
 
     def _create_segment(self, name: str) -> None:
         post_data: Dict[str, Any] = {"name": name}
@@ -90,16 +113,16 @@ class DatasetClientBase(VersionControlMixin):
 
         self._client.open_api_do("POST", "segments", self._dataset_id, json=post_data)
 
-    def _list_segments(self, offset: int = 0, limit: int = 128) -> Dict[str, Any]:
+    def _list_segments(self, offset: int = 0, limit: Optional[int] = None) -> Dict[str, Any]:
         params: Dict[str, Any] = self._status.get_status_info()
         params["offset"] = offset
-        params["limit"] = limit
+        params["limit"] = limit or config.page_size
 
         response = self._client.open_api_do("GET", "segments", self._dataset_id, params=params)
         return response.json()  # type: ignore[no-any-return]
 
     def _generate_segment_names(
-        self, offset: int = 0, limit: int = 128
+        self, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[str, None, int]:
         response = self._list_segments(offset, limit)
 
@@ -157,6 +180,9 @@ class DatasetClientBase(VersionControlMixin):
         post_data.update(self._status.get_status_info())
 
         self._client.open_api_do("POST", "segments?move", self._dataset_id, json=post_data)
+        RemotePathSet.invalidate(
+            get_journal_path(self._dataset_id, self._status.draft_number, source_name)
+        )
 
     @property
     def dataset_id(self) -> str:
@@ -208,15 +234,6 @@ class DatasetClientBase(VersionControlMixin):
         """
         return self._is_public
 
-    @property
-    def cache_enabled(self) -> bool:
-        """Whether the cache is enabled.
-
-        Returns:
-            Whether the cache is enabled.
-        """
-        return bool(self._cache_path) and not self.status.is_draft
-
     @property  # type: ignore[misc]
     @functools.lru_cache()
     def squash_and_merge(self) -> SquashAndMerge:
@@ -241,41 +258,6 @@ class DatasetClientBase(VersionControlMixin):
             self._client, self._dataset_id, self._status, isinstance(self, FusionDatasetClient)
         )
 
-    def enable_cache(self, cache_path: str = "") -> None:
-        """Enable cache when open the remote data of the dataset.
-
-        Arguments:
-            cache_path: The path to store the cache.
-
-        Raises:
-            StatusError: When enable cache under draft status.
-
-        """
-        try:
-            self.status.check_authority_for_commit()
-        except StatusError as error:
-            raise StatusError("Cache is not available for datasets under draft status") from error
-
-        if cache_path:
-            self._cache_path = os.path.join(
-                os.path.abspath(os.path.expanduser(cache_path)), self.dataset_id
-            )
-        else:
-            self._cache_path = os.path.join(tempfile.gettempdir(), "tensorbay", self.dataset_id)
-        total_size = self.get_total_size()
-        print(
-            "To cache the entire dataset, "
-            f"please make sure there is free storage space larger than {total_size} bytes.\n"
-            "Note that cache will not work for datasets under draft status.\n\n"
-            f'The cache will be stored under "{self._cache_path}".\n'
-            "You can remove all the files after using."
-        )
-
-        os.makedirs(self._cache_path, exist_ok=True)
-        _, _, free = shutil.disk_usage(self._cache_path)
-        if free < total_size:
-            logger.warning(CACHE_SPACE_WARNING, free, total_size)
-
     def update_notes(
         self,
         *,
@@ -317,14 +299,18 @@ class DatasetClientBase(VersionControlMixin):
             self._client.open_api_do("GET", "notes", self._dataset_id, params=params).json()
         )
 
-    def list_segment_names(self) -> PagingList[str]:
+    def list_segment_names(self, *, page_size: Optional[int] = None) -> PagingList[str]:
         """List all segment names in a certain commit.
 
+        Arguments:
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
+
         Returns:
             The PagingList of segment names.
 
         """
-        return PagingList(self._generate_segment_names, 128)
+        return PagingList(self._generate_segment_names, page_size)
 
     def get_catalog(self) -> Catalog:
         """Get the catalog of the certain commit.
@@ -367,6 +353,9 @@ class DatasetClientBase(VersionControlMixin):
         delete_data.update(self._status.get_status_info())
 
         self._client.open_api_do("DELETE", "segments", self._dataset_id, json=delete_data)
+        RemotePathSet.invalidate(
+            get_journal_path(self._dataset_id, self._status.draft_number, name)
+        )
 
     def get_label_statistics(self) -> Statistics:
         """Get label statistics of the dataset.
@@ -397,7 +386,7 @@ class DatasetClientBase(VersionControlMixin):
         ).json()["totalSize"]
 
 
-class DatasetClient(DatasetClientBase):
+class DatasetClient(DatasetClientBase, DatasetDownloadMixin, SyncMixin):
     """This class defines :class:`DatasetClient`.
 
     :class:`DatasetClient` inherits from :class:`DataClientBase` and
@@ -410,7 +399,7 @@ class DatasetClient(DatasetClientBase):
     """
 
     def _generate_segments(
-        self, offset: int = 0, limit: int = 128
+        self, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[Segment, None, int]:
         response = self._list_segments(offset, limit)
 
@@ -424,9 +413,9 @@ class DatasetClient(DatasetClientBase):
         return response["totalCount"]  # type: ignore[no-any-return]
 
     def _generate_segment_diffs(
-        self, basehead: str, offset: int = 0, limit: int = 128
+        self, basehead: str, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[SegmentDiff, None, int]:
-        params: Dict[str, Any] = {"offset": offset, "limit": limit}
+        params: Dict[str, Any] = {"offset": offset, "limit": limit or config.page_size}
 
         response = self._client.open_api_do(
             "GET", f"diffs/{basehead}/segments", self._dataset_id, params=params
@@ -441,9 +430,9 @@ class DatasetClient(DatasetClientBase):
         return response["totalCount"]  # type: ignore[no-any-return]
 
     def _generate_data_diffs(
-        self, basehead: str, segment_name: str, offset: int = 0, limit: int = 128
+        self, basehead: str, segment_name: str, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[DataDiff, None, int]:
-        params: Dict[str, Any] = {"offset": offset, "limit": limit}
+        params: Dict[str, Any] = {"offset": offset, "limit": limit or config.page_size}
 
         response = self._client.open_api_do(
             "GET", f"diffs/{basehead}/segments/{segment_name}/data", self._dataset_id, params=params
@@ -456,12 +445,22 @@ class DatasetClient(DatasetClientBase):
 
     def _list_data_diffs(self, basehead: str, segment_name: str) -> PagingList[DataDiff]:
         return PagingList(
-            lambda offset, limit: self._generate_data_diffs(basehead, segment_name, offset, limit),
-            128,
+            lambda offset, limit: self._generate_data_diffs(basehead, segment_name, offset, limit)
         )
 
     def _list_segment_instances(self) -> PagingList[Segment]:
-        return PagingList(self._generate_segments, 128)
+        return PagingList(self._generate_segments)
+
+    def _get_segment_client(self, name: str) -> SegmentClient:
+        return SegmentClient(name, self)
+
+    def _generate_remote_files(self, segment_name: str) -> Iterator[RemoteFileMixin]:
+        for data in self._get_segment_client(segment_name).list_data():
+            yield data
+            for key in _MASK_KEYS:
+                mask = getattr(data.label, key, None)
+                if mask:
+                    yield mask
 
     def _upload_segment(
         self,
@@ -476,20 +475,28 @@ class DatasetClient(DatasetClientBase):
             lambda data: pbar.update_for_skip(not isinstance(data, RemoteData)),
             segment,  # type: ignore[arg-type]
         )
+        callback: Callable[[Tuple[Dict[str, Any], ...]], None]
+        callback = segment_client._synchronize_upload_info  # pylint: disable=protected-access
         if not skip_uploaded_files:
             segment_filter = all_data
         else:
-            done_set = set(segment_client.list_data_paths())
+            done_set = RemotePathSet.fetch(
+                segment_client._generate_data_paths,  # pylint: disable=protected-access
+                jobs=jobs,
+                path=get_journal_path(self._dataset_id, self._status.draft_number, segment.name),
+            )
             segment_filter = filter(
                 lambda data: pbar.update_for_skip(data.target_remote_path not in done_set),
                 all_data,
             )
+            if config.persist_remote_paths:
+                callback = done_set.recorded(callback)
 
         multithread_upload(
             # pylint: disable=protected-access
             segment_client._upload_or_import_data,
             segment_filter,
-            callback=segment_client._synchronize_upload_info,
+            callback=callback,
             jobs=jobs,
             pbar=pbar,
         )
@@ -608,12 +615,14 @@ class DatasetClient(DatasetClientBase):
 
         return SegmentClient(name, self)
 
-    def upload_segment(
+    def upload_segment(  # pylint: disable=too-many-arguments
         self,
         segment: Segment,
         *,
         jobs: int = 1,
         skip_uploaded_files: bool = False,
+        sync: bool = False,
+        delete: bool = False,
         quiet: bool = False,
         _is_cli: bool = False,
     ) -> SegmentClient:
@@ -630,10 +639,16 @@ class DatasetClient(DatasetClientBase):
                 contains the information needs to be upload.
             jobs: The number of the max workers in multi-thread uploading method.
             skip_uploaded_files: True for skipping the uploaded files.
+            sync: True for only uploading the new data and the data whose checksums differ from
+                the remote data with the same paths,
+                see :meth:`~tensorbay.client.sync.SyncMixin.get_sync_plan`.
+            delete: True for deleting the remote data which are not in the segment,
+                only available in sync mode.
             quiet: Set to True to stop showing the upload process bar.
             _is_cli: Whether the method is called by CLI.
 
         Raises:
+            ValueError: When deleting the remote data without sync mode.
             Exception: When the upload got interrupted by Exception.
 
         Returns:
@@ -641,21 +656,24 @@ class DatasetClient(DatasetClientBase):
             used for uploading the data in the segment.
 
         """
+        if delete and not sync:
+            raise ValueError('The "delete" argument is only available with "sync" set to True')
+
         self._status.check_authority_for_draft()
+        plan = self.get_sync_plan(segment, jobs=jobs, delete=delete) if sync else None
+        total = segment.count_hint if isinstance(segment, StreamSegment) else len(segment)
         try:
-            with Tqdm(len(segment), disable=quiet) as pbar:
+            if plan is not None:
+                logger.info(plan.get_summary())
+                return self.apply_sync_plan(plan, jobs=jobs, quiet=quiet)
+
+            with Tqdm(total, disable=quiet) as pbar:
                 return self._upload_segment(
-                    segment,
-                    jobs=jobs,
-                    skip_uploaded_files=skip_uploaded_files,
-                    pbar=pbar,
+                    segment, jobs=jobs, skip_uploaded_files=skip_uploaded_files, pbar=pbar
                 )
         except Exception:
             if _is_cli:
-                logger.error(
-                    UPLOAD_SEGMENT_RESUME_TEMPLATE_CLI,
-                    self._status.draft_number,
-                )
+                logger.error(UPLOAD_SEGMENT_RESUME_TEMPLATE_CLI, self._status.draft_number)
             else:
                 logger.error(
                     UPLOAD_SEGMENT_RESUME_TEMPLATE_SDK,
@@ -664,10 +682,17 @@ class DatasetClient(DatasetClientBase):
                 )
             raise
 
-    def get_diff(self, *, head: Optional[Union[str, int]] = None) -> DatasetDiff:
-        """Get a brief diff between head and its parent commit.
+    def get_diff(
+        self,
+        *,
+        base: Optional[Union[str, int]] = None,
+        head: Optional[Union[str, int]] = None,
+    ) -> DatasetDiff:
+        """Get a brief diff between head and base, or its parent commit if base is not given.
 
         Arguments:
+            base: Base version identification. Type int for draft number, type str for commit id.
+                If not given, use the parent commit of head.
             head: Target version identification. Type int for draft number, type str for revision.
                 If not given, use the current commit id.
 
@@ -675,13 +700,13 @@ class DatasetClient(DatasetClientBase):
             >>> self.get_diff(head="b382450220a64ca9b514dcef27c82d9a")
 
         Returns:
-            The brief diff between head and its parent commit.
+            The brief diff between head and base.
 
         """
-        basehead = self._get_basehead(None, head)
+        basehead = self._get_basehead(base, head)
 
         segment_diffs = PagingList(
-            lambda offset, limit: self._generate_segment_diffs(basehead, offset, limit), 128
+            lambda offset, limit: self._generate_segment_diffs(basehead, offset, limit)
         )
 
         dataset_diff = DatasetDiff(self.name, segment_diffs)
@@ -742,7 +767,7 @@ class FusionDatasetClient(DatasetClientBase):
                 yield data, sensor_name, frame_id.str
 
     def _generate_segments(
-        self, offset: int = 0, limit: int = 128
+        self, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[FusionSegment, None, int]:
         response = self._list_segments(offset, limit)
 
@@ -756,7 +781,13 @@ class FusionDatasetClient(DatasetClientBase):
         return response["totalCount"]  # type: ignore[no-any-return]
 
     def _list_segment_instances(self) -> PagingList[FusionSegment]:
-        return PagingList(self._generate_segments, 128)
+        return PagingList(self._generate_segments)
+
+    def _generate_remote_files(self, segment_name: str) -> Iterator[RemoteFileMixin]:
+        for frame in FusionSegmentClient(segment_name, self).list_frames():
+            for data in frame.values():
+                if isinstance(data, RemoteData):
+                    yield data
 
     def _upload_segment(
         self,
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""The multi-thread downloading framework and the mixins of downloading the files of a dataset."""
+
+import functools
+import logging
+import os
+import shutil
+import tempfile
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+
+from tensorbay.client.cache import DownloadStatistics, FileCache, MetadataCache
+from tensorbay.client.diff import DatasetDiff
+from tensorbay.client.lazy import PagingList
+from tensorbay.client.log import CACHE_SPACE_WARNING
+from tensorbay.client.requests import multithread_run
+from tensorbay.client.segment import _MASK_KEYS, SegmentClient
+from tensorbay.client.status import Status
+from tensorbay.client.struct import Commit
+from tensorbay.dataset import RemoteData
+from tensorbay.exception import StatusError
+from tensorbay.utility import RemoteFileMixin, Tqdm, config, fit_connection_pool
+from tensorbay.utility.file import DOWNLOADING_SUFFIX
+from tensorbay.utility.walk import walk_files
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+def multithread_download(
+    function: Callable[[_T], int],
+    arguments: Iterable[_T],
+    *,
+    jobs: int = 1,
+    quiet: bool = False,
+    desc: str = "Downloading",
+) -> DownloadStatistics:
+    """Multi-thread download framework.
+
+    Arguments:
+        function: The download function, which returns the number of the downloaded bytes.
+        arguments: The arguments of the download function.
+        jobs: The number of the max workers in multi-thread downloading procession.
+        quiet: Set to True to stop showing the process bar.
+        desc: The description of the process bar.
+
+    Returns:
+        The :class:`~tensorbay.client.cache.DownloadStatistics` of the downloading.
+
+    """
+    statistics = DownloadStatistics()
+    # Each downloading thread may download a large file by concurrent blocks.
+    fit_connection_pool(jobs * config.download_block_jobs)
+    with Tqdm(None, disable=quiet, desc=desc) as pbar:
+        multithread_run(function, arguments, callback=statistics.record, jobs=jobs, pbar=pbar)
+
+    return statistics
+
+
+def _download_file(file: Tuple[RemoteData, str], *, incremental: bool) -> int:
+    data, local_path = file
+    return data.download(local_path, incremental=incremental)
+
+
+def _link_unchanged_files(
+    base_path: str, head_path: str, all_changes: Dict[str, Optional[Dict[str, bool]]]
+) -> None:
+    if not os.path.isdir(base_path):
+        return
+
+    for segment_name in os.listdir(base_path):
+        segment_path = os.path.join(base_path, segment_name)
+        changes = all_changes.get(segment_name, {})
+        if changes is None or not os.path.isdir(segment_path):
+            continue
+
+        # The masks are not linked because the paths of the changed masks are unknown.
+        for path, relpath in walk_files(
+            segment_path, exclude=(*_MASK_KEYS, f"*{DOWNLOADING_SUFFIX}*")
+        ):
+            if relpath in changes:
+                continue
+
+            target_path = os.path.join(head_path, segment_name, *relpath.split("/"))
+            if os.path.exists(target_path):
+                continue
+
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            try:
+                os.link(path, target_path)
+            except OSError:
+                shutil.copy2(path, target_path)
+
+
+class DownloadMixin:
+    """A mixin class supporting caching the remote files of a dataset.
+
+    The classes using this mixin provide ``_generate_remote_files``, which generates the remote
+    data files and mask files of the segment with the given name.
+
+    """
+
+    _dataset_id: str
+    _status: Status
+    _cache_path: str
+    _metadata_cache: Optional[MetadataCache]
+    _file_cache: Optional[FileCache]
+
+    _generate_remote_files: Callable[[str], Iterator[RemoteFileMixin]]
+    list_segment_names: Callable[[], PagingList[str]]
+    get_total_size: Callable[[], int]
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether the cache is enabled.
+
+        Returns:
+            Whether the cache is enabled.
+        """
+        return bool(self._cache_path) and not self._status.is_draft
+
+    @property
+    def file_cache(self) -> Optional[FileCache]:
+        """Return the size-bounded file cache of the dataset.
+
+        Returns:
+            The :class:`~tensorbay.client.cache.FileCache` of the dataset,
+            None when the cache is not enabled with a byte budget.
+
+        """
+        return self._file_cache
+
+    def enable_cache(
+        self, cache_path: str = "", *, max_size: Optional[int] = None, policy: str = "lru"
+    ) -> None:
+        """Enable cache when open the remote data of the dataset.
+
+        The data details listed from the committed dataset are also cached,
+        so reopening the same commit reads the labels without network requests.
+
+        When ``max_size`` is given, the files are stored by their checksums in a
+        :class:`~tensorbay.client.cache.FileCache` under ``<cache_path>/files``,
+        which is shared by all the datasets and commits cached under the same path,
+        and the files are evicted when the total size exceeds ``max_size``.
+
+        Arguments:
+            cache_path: The path to store the cache.
+            max_size: The byte budget of the files in the cache, None for no limit.
+            policy: The eviction policy of the files, "lru" or "lfu".
+
+        Raises:
+            StatusError: When enable cache under draft status.
+
+        """
+        try:
+            self._status.check_authority_for_commit()
+        except StatusError as error:
+            raise StatusError("Cache is not available for datasets under draft status") from error
+
+        if cache_path:
+            cache_root = os.path.abspath(os.path.expanduser(cache_path))
+        else:
+            cache_root = os.path.join(tempfile.gettempdir(), "tensorbay")
+        self._cache_path = os.path.join(cache_root, self._dataset_id)
+
+        total_size = self.get_total_size()
+        required_size = total_size if max_size is None else min(total_size, max_size)
+        print(
+            "To cache the entire dataset, "
+            f"please make sure there is free storage space larger than {required_size} bytes.\n"
+            "Note that cache will not work for datasets under draft status.\n\n"
+            f'The cache will be stored under "{self._cache_path}".\n'
+            "You can remove all the files after using."
+        )
+
+        os.makedirs(self._cache_path, exist_ok=True)
+        self._metadata_cache = MetadataCache(os.path.join(self._cache_path, "metadata.db"))
+        self._file_cache = (
+            None
+            if max_size is None
+            else FileCache(os.path.join(cache_root, "files"), max_size=max_size, policy=policy)
+        )
+        _, _, free = shutil.disk_usage(self._cache_path)
+        if free < required_size:
+            logger.warning(CACHE_SPACE_WARNING, free, required_size)
+
+    def prefetch(
+        self, segments: Optional[Iterable[str]] = None, *, jobs: int = 1, quiet: bool = False
+    ) -> DownloadStatistics:
+        """Download the remote files of the dataset into the cache ahead of opening them.
+
+        The data files and the mask files of the segments are downloaded concurrently,
+        and the files already in the cache are skipped.
+
+        Arguments:
+            segments: The names of the segments to prefetch, all the segments if not given.
+            jobs: The number of the max workers in multi-thread downloading method.
+            quiet: Set to True to stop showing the process bar.
+
+        Returns:
+            The :class:`~tensorbay.client.cache.DownloadStatistics` of the prefetching.
+
+        Raises:
+            StatusError: When the cache is not enabled.
+
+        """
+        if not self.cache_enabled:
+            raise StatusError("Cache is not enabled, please enable cache under commit status first")
+
+        if segments is None:
+            segments = self.list_segment_names()
+
+        return multithread_download(
+            RemoteFileMixin.prefetch,
+            chain.from_iterable(map(self._generate_remote_files, segments)),
+            jobs=jobs,
+            quiet=quiet,
+            desc="Prefetching",
+        )
+
+
+class DatasetDownloadMixin(DownloadMixin):
+    """A mixin class supporting downloading the data files of a dataset to local directories.
+
+    The classes using this mixin provide ``_get_segment_client``, which returns the
+    :class:`~tensorbay.client.segment.SegmentClient` of the segment with the given name.
+
+    """
+
+    _get_segment_client: Callable[[str], SegmentClient]
+    get_commit: Callable[[Optional[str]], Commit]
+    get_diff: Callable[..., DatasetDiff]
+
+    def _get_file_changes(self, base_commit_id: str) -> Dict[str, Optional[Dict[str, bool]]]:
+        """Get the files changed from the base commit to the current version.
+
+        Arguments:
+            base_commit_id: The commit id of the base commit.
+
+        Returns:
+            A dict mapping the names of the changed segments to None for the deleted segments,
+            or to the dicts mapping the remote paths of the changed files to whether deleted.
+
+        """
+        all_changes: Dict[str, Optional[Dict[str, bool]]] = {}
+        for segment_diff in self.get_diff(base=base_commit_id):
+            if segment_diff.action == "delete":
+                all_changes[segment_diff.name] = None
+                continue
+
+            all_changes[segment_diff.name] = {
+                data_diff.remote_path: data_diff.action == "delete"
+                for data_diff in segment_diff
+                if data_diff.action == "delete" or data_diff.file.action
+            }
+
+        return all_changes
+
+    def _generate_changed_data(
+        self, all_changes: Dict[str, Optional[Dict[str, bool]]]
+    ) -> Iterator[Tuple[str, RemoteData]]:
+        """Generate the added or modified remote data in the changed segments.
+
+        The changed data are got one by one by their remote paths when it takes fewer requests
+        than listing the segment, otherwise the segment is listed once to find them.
+
+        Arguments:
+            all_changes: The file changes got by :meth:`DatasetDownloadMixin._get_file_changes`.
+
+        Yields:
+            The names of the segments and the added or modified remote data in them.
+
+        """
+        for segment_name, changes in all_changes.items():
+            if not changes:
+                continue
+
+            paths = {remote_path for remote_path, is_deleted in changes.items() if not is_deleted}
+            if not paths:
+                continue
+
+            segment_client = self._get_segment_client(segment_name)
+            # The total count of the data is got by listing a page of one data.
+            page_count = -(-len(segment_client.list_data(page_size=1)) // config.page_size)
+            if len(paths) < page_count:
+                for path in sorted(paths):
+                    yield segment_name, segment_client.get_data(path)
+                continue
+
+            for data in segment_client.list_data():
+                if data.path in paths:
+                    yield segment_name, data
+                    paths.remove(data.path)
+                    if not paths:
+                        break
+
+    def _generate_local_files(
+        self, segment_name: str, local_path: str, remote_path: str = ""
+    ) -> Iterator[Tuple[RemoteData, str]]:
+        for data in self._get_segment_client(segment_name).list_data():
+            if data.path.startswith(remote_path):
+                relpath = data.path[len(remote_path) :]
+                yield data, os.path.join(local_path, *relpath.split("/"))
+
+    def download(  # pylint: disable=too-many-arguments
+        self,
+        local_path: str,
+        *,
+        segment_name: Optional[str] = None,
+        remote_path: str = "",
+        jobs: int = 1,
+        incremental: bool = False,
+        quiet: bool = False,
+    ) -> DownloadStatistics:
+        """Download the data files of the dataset to a local directory.
+
+        The files of all the segments are downloaded to ``<local_path>/<segment_name>/``
+        if ``segment_name`` is not given, otherwise the files of the segment under the directory
+        ``remote_path`` are downloaded to ``<local_path>/`` with their paths relative to it.
+        A ``remote_path`` not ending with "/" refers to a single file downloaded to ``local_path``.
+
+        Arguments:
+            local_path: The local path to store the files.
+            segment_name: The name of the segment to download.
+            remote_path: The remote path of the directory or the file to download.
+            jobs: The number of the max workers in multi-thread downloading method.
+            incremental: Whether to skip the local files having the same checksums.
+            quiet: Set to True to stop showing the process bar.
+
+        Returns:
+            The :class:`~tensorbay.client.cache.DownloadStatistics` of the downloading.
+
+        """
+        files: Iterable[Tuple[RemoteData, str]]
+        if segment_name is None:
+            files = chain.from_iterable(
+                self._generate_local_files(name, os.path.join(local_path, name))
+                for name in self.list_segment_names()
+            )
+        elif remote_path and not remote_path.endswith("/"):
+            files = ((self._get_segment_client(segment_name).get_data(remote_path), local_path),)
+        else:
+            files = self._generate_local_files(segment_name, local_path, remote_path)
+
+        return multithread_download(
+            functools.partial(_download_file, incremental=incremental),
+            files,
+            jobs=jobs,
+            quiet=quiet,
+        )
+
+    def download_diff(
+        self, local_path: str, base: str, *, jobs: int = 1, quiet: bool = False
+    ) -> DownloadStatistics:
+        """Update the files downloaded from the base commit to the current version by the diff.
+
+        The ``local_path`` is the directory which the dataset of the base commit is downloaded to
+        by :meth:`DatasetDownloadMixin.download`. The deleted files and segments are removed from
+        it, and only the added or modified files are downloaded.
+
+        Arguments:
+            local_path: The local directory storing the files of the base commit.
+            base: The revision of the base commit.
+            jobs: The number of the max workers in multi-thread downloading method.
+            quiet: Set to True to stop showing the process bar.
+
+        Returns:
+            The :class:`~tensorbay.client.cache.DownloadStatistics` of the downloading.
+
+        """
+        all_changes = self._get_file_changes(self.get_commit(base).commit_id)
+        for segment_name, changes in all_changes.items():
+            segment_path = os.path.join(local_path, segment_name)
+            if changes is None:
+                shutil.rmtree(segment_path, ignore_errors=True)
+                continue
+
+            for remote_path, is_deleted in changes.items():
+                path = os.path.join(segment_path, *remote_path.split("/"))
+                if is_deleted and os.path.isfile(path):
+                    os.remove(path)
+
+        files = (
+            (data, os.path.join(local_path, segment_name, *data.path.split("/")))
+            for segment_name, data in self._generate_changed_data(all_changes)
+        )
+        return multithread_download(
+            functools.partial(_download_file, incremental=False), files, jobs=jobs, quiet=quiet
+        )
+
+    def update_cache(self, base: str, *, jobs: int = 1, quiet: bool = False) -> DownloadStatistics:
+        """Update the cache of the base commit to the current commit by the diff.
+
+        The cached files which are not changed are linked from the cache of the base commit,
+        and only the added or modified files are downloaded. The unchanged files are shared by
+        the commits in the size-bounded cache, so only the changed files are downloaded into it.
+
+        Arguments:
+            base: The revision of the base commit.
+            jobs: The number of the max workers in multi-thread downloading method.
+            quiet: Set to True to stop showing the process bar.
+
+        Returns:
+            The :class:`~tensorbay.client.cache.DownloadStatistics` of the downloading.
+
+        Raises:
+            StatusError: When the cache is not enabled.
+
+        """
+        if not self.cache_enabled:
+            raise StatusError("Cache is not enabled, please enable cache under commit status first")
+
+        base_commit_id = self.get_commit(base).commit_id
+        all_changes = self._get_file_changes(base_commit_id)
+        if not self._file_cache:
+            _link_unchanged_files(
+                os.path.join(self._cache_path, base_commit_id),
+                os.path.join(self._cache_path, self._status.commit_id),  # type: ignore[arg-type]
+                all_changes,
+            )
+
+        return multithread_download(
+            RemoteFileMixin.prefetch,
+            (data for _, data in self._generate_changed_data(all_changes)),
+            jobs=jobs,
+            quiet=quiet,
+            desc="Prefetching",
+        )
@@ -6,7 +6,8 @@
 """The implementation of the gas."""
 
 import logging
-from typing import Any, Dict, Generator, Optional, Type, Union, overload
+from itertools import groupby
+from typing import Any, Dict, Generator, Iterable, Iterator, Optional, Type, Union, overload
 
 from typing_extensions import Literal
 
@@ -17,9 +18,17 @@ from tensorbay.client.log import UPLOAD_DATASET_RESUME_TEMPLATE
 from tensorbay.client.requests import Client
 from tensorbay.client.status import Status
 from tensorbay.client.struct import ROOT_COMMIT_ID, UserInfo
-from tensorbay.dataset import Dataset, FusionDataset
+from tensorbay.dataset import (
+    Dataset,
+    FusionDataset,
+    FusionSegment,
+    ParallelDataset,
+    Segment,
+    StreamSegment,
+)
+from tensorbay.dataset.data import DataBase
 from tensorbay.exception import DatasetTypeError, ResourceNotExistError
-from tensorbay.utility import Tqdm
+from tensorbay.utility import Tqdm, config
 
 DatasetClientType = Union[DatasetClient, FusionDatasetClient]
 
@@ -27,6 +36,40 @@ logger = logging.getLogger(__name__)
 DEFAULT_BRANCH = "main"
 
 
+def _get_data_count(dataset: Union[Dataset, FusionDataset]) -> Optional[int]:
+    if isinstance(dataset, FusionDataset):
+        return sum(sum(len(frame) for frame in fusion_segment) for fusion_segment in dataset)
+
+    counts = [_get_segment_count(segment) for segment in dataset]
+    return None if None in counts else sum(counts)  # type: ignore[arg-type]
+
+
+def _get_segment_count(segment: Union[Segment, FusionSegment]) -> Optional[int]:
+    return segment.count_hint if isinstance(segment, StreamSegment) else len(segment)
+
+
+def _merge_shards(shards: Iterable[Segment], pbar: Tqdm) -> Iterator[StreamSegment]:
+    # The consecutive shards of a segment are uploaded as one segment, so the remote segment is
+    # only prepared once, and the total of the progress bar grows when every shard is loaded.
+    # Buffering the shards of every segment would defeat the streaming, so the shards of a segment
+    # are required to be consecutive, and a segment can not be uploaded twice.
+    merged_names = set()
+    for name, group in groupby(shards, key=lambda shard: shard.name):
+        if name in merged_names:
+            raise ValueError(
+                f'The shards of segment "{name}" are not consecutive in the arguments, '
+                "which is required when uploading a ParallelDataset"
+            )
+        merged_names.add(name)
+        yield StreamSegment(name, _chain_shards(group, pbar))
+
+
+def _chain_shards(shards: Iterable[Segment], pbar: Tqdm) -> Iterator["DataBase._Type"]:
+    for shard in shards:
+        pbar.add_total(_get_segment_count(shard))
+        yield from shard
+
+
 class GAS:
     """:class:`GAS` defines the initial client to interact between local and TensorBay.
 
@@ -43,16 +86,16 @@ class GAS:
         self._client = Client(access_key, url)
 
     def _generate_auth_storage_configs(
-        self, name: Optional[str] = None, offset: int = 0, limit: int = 128
+        self, name: Optional[str] = None, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[StorageConfig, None, int]:
-        params: Dict[str, Any] = {"offset": offset, "limit": limit}
+        params: Dict[str, Any] = {"offset": offset, "limit": limit or config.page_size}
         if name:
             params["name"] = name
 
         response = self._client.open_api_do("GET", "storage-configs", "", params=params).json()
 
-        for config in response["configs"]:
-            yield StorageConfig.loads(config)
+        for storage_config in response["configs"]:
+            yield StorageConfig.loads(storage_config)
 
         return response["totalCount"]  # type: ignore[no-any-return]
 
@@ -108,11 +151,11 @@ class GAS:
         self,
         name: Optional[str] = None,
         offset: int = 0,
-        limit: int = 128,
+        limit: Optional[int] = None,
     ) -> Dict[str, Any]:
         params: Dict[str, Any] = {
             "offset": offset,
-            "limit": limit,
+            "limit": limit or config.page_size,
         }
         if name:
             params["name"] = name
@@ -124,7 +167,7 @@ class GAS:
         self,
         name: Optional[str] = None,
         offset: int = 0,
-        limit: int = 128,
+        limit: Optional[int] = None,
     ) -> Generator[str, None, int]:
         response = self._list_datasets(name, offset, limit)
 
@@ -161,13 +204,13 @@ class GAS:
             raise TypeError("The given auth storage config name is illegal")
 
         try:
-            config = next(self._generate_auth_storage_configs(name))
+            storage_config = next(self._generate_auth_storage_configs(name))
         except StopIteration as error:
             raise ResourceNotExistError(
                 resource="auth storage config", identification=name
             ) from error
 
-        return config
+        return storage_config
 
     def list_auth_storage_configs(self) -> PagingList[StorageConfig]:
         """List auth storage configs.
@@ -177,8 +220,7 @@ class GAS:
 
         """
         return PagingList(
-            lambda offset, limit: self._generate_auth_storage_configs(None, offset, limit),
-            128,
+            lambda offset, limit: self._generate_auth_storage_configs(None, offset, limit)
         )
 
     def delete_storage_config(self, name: str) -> None:
@@ -468,9 +510,7 @@ class GAS:
             The PagingList of all TensorBay dataset names.
 
         """
-        return PagingList(
-            lambda offset, limit: self._generate_dataset_names(None, offset, limit), 128
-        )
+        return PagingList(lambda offset, limit: self._generate_dataset_names(None, offset, limit))
 
     def update_dataset(
         self,
@@ -585,7 +625,8 @@ class GAS:
 
         Raises:
             ValueError: When uploading the dataset based on both draft number
-                and branch name is not allowed.
+                and branch name is not allowed, or the shards of a segment in the
+                :class:`~tensorbay.dataset.dataset.ParallelDataset` are not consecutive.
             Exception: When Exception was raised during uploading dataset.
 
         """
@@ -614,17 +655,17 @@ class GAS:
             if dataset.catalog:
                 dataset_client.upload_catalog(dataset.catalog)
 
-            dataset_client.update_notes(**dataset.notes)  # type: ignore[arg-type]
+            dataset_client.update_notes(**dataset.notes)
 
-            if isinstance(dataset, Dataset):
-                data_count = sum(len(segment) for segment in dataset)
-            else:
-                data_count = sum(
-                    sum(len(frame) for frame in fusion_segment) for fusion_segment in dataset
+            is_streaming = isinstance(dataset, ParallelDataset)
+            with Tqdm(0 if is_streaming else _get_data_count(dataset), disable=quiet) as pbar:
+                segments: Iterable[Union[Segment, FusionSegment]] = (
+                    # The segments are loaded while uploading, so the total grows with them.
+                    _merge_shards(dataset.iter_segments(), pbar)
+                    if isinstance(dataset, ParallelDataset)
+                    else dataset
                 )
-
-            with Tqdm(data_count, disable=quiet) as pbar:
-                for segment in dataset:
+                for segment in segments:
                     dataset_client._upload_segment(  # pylint: disable=protected-access
                         segment,  # type: ignore[arg-type]
                         jobs=jobs,
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""The local journals for resuming the interrupted uploading and skipping the uploaded objects."""
+
+import json
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from hashlib import sha1
+from threading import Event, Lock
+from typing import Callable, Dict, Set
+
+from tensorbay.utility.sqlite import Database
+
+_MAX_AGE = 24 * 60 * 60
+# Azure discards the uncommitted blocks 7 days after they are uploaded.
+_MAX_BLOCK_AGE = 6 * 24 * 60 * 60
+
+
+class UploadJournal:
+    """This class defines the journal which records the uploaded blocks of a file.
+
+    The journal is stored as a json file under the temporary directory, so the uploading of a large
+    file can continue from the uploaded blocks after it got interrupted.
+    The journal older than the lifetime of the uncommitted blocks on the server is ignored.
+
+    Arguments:
+        key: The key of the uploading object, such as the url without the query string.
+        block_size: The size of the blocks in bytes.
+
+    """
+
+    def __init__(self, key: str, block_size: int) -> None:
+        dirname = os.path.join(tempfile.gettempdir(), "tensorbay", "uploading")
+        os.makedirs(dirname, exist_ok=True)
+
+        self._path = os.path.join(dirname, f"{sha1(key.encode()).hexdigest()}.json")
+        self._block_size = block_size
+        self._lock = Lock()
+        self._indices: Set[int] = set()
+        self._created_at = time.time()
+
+        try:
+            with open(self._path, encoding="utf-8") as fp:
+                contents = json.load(fp)
+        except (OSError, ValueError):
+            return
+
+        created_at = contents.get("createdAt", 0)
+        if contents.get("blockSize") == block_size and time.time() - created_at < _MAX_BLOCK_AGE:
+            self._indices.update(contents["indices"])
+            self._created_at = created_at
+
+    def __contains__(self, index: object) -> bool:
+        return index in self._indices
+
+    def add(self, index: int) -> None:
+        """Record the given block as uploaded.
+
+        Arguments:
+            index: The index of the uploaded block.
+
+        """
+        with self._lock:
+            self._indices.add(index)
+            contents = {
+                "blockSize": self._block_size,
+                "createdAt": self._created_at,
+                "indices": sorted(self._indices),
+            }
+
+            temp_path = f"{self._path}.{os.getpid()}"
+            with open(temp_path, "w", encoding="utf-8") as fp:
+                json.dump(contents, fp)
+            os.replace(temp_path, self._path)
+
+    def remove(self) -> None:
+        """Remove the journal after the uploading finished."""
+        with self._lock:
+            self._indices.clear()
+            try:
+                os.remove(self._path)
+            except FileNotFoundError:
+                pass
+
+
+class UploadedObjects:
+    """This class defines the record of the objects uploaded to TensorBay.
+
+    The objects are stored under the keys composed of the object prefix and the checksum of the
+    content, so the file whose object key is recorded does not need to be sent again. Concurrent
+    uploadings of the same object key are merged into one.
+
+    The record is stored in a SQLite database when the path is given, otherwise it is kept in
+    memory of the current process and bounded to the latest recorded keys.
+    The object may be removed on TensorBay later, so a recorded key expires after the max age and
+    the object is sent again.
+
+    Arguments:
+        path: The path of the SQLite database file, empty for recording in memory only.
+        max_age: The number of seconds a recorded key is trusted.
+
+    """
+
+    _MAX_MEMORY_KEYS = 65536
+
+    def __init__(self, path: str = "", max_age: float = _MAX_AGE) -> None:
+        self._path = os.path.abspath(os.path.expanduser(path)) if path else ""
+        self._max_age = max_age
+        self._lock = Lock()
+        self._keys: "OrderedDict[str, float]" = OrderedDict()
+        self._uploading: Dict[str, Event] = {}
+
+        if not self._path:
+            self._database = None
+            return
+
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        self._database = Database(self._path)
+        with self._database.connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS uploaded_objects ("
+                "key TEXT PRIMARY KEY, uploaded_at REAL)"
+            )
+            connection.execute(
+                "DELETE FROM uploaded_objects WHERE uploaded_at < ?", (time.time() - max_age,)
+            )
+
+    def __contains__(self, key: object) -> bool:
+        if self._database is None:
+            uploaded_at = self._keys.get(key)  # type: ignore[call-overload]
+        else:
+            with self._database.connect() as connection:
+                row = connection.execute(
+                    "SELECT uploaded_at FROM uploaded_objects WHERE key = ?", (key,)
+                ).fetchone()
+            uploaded_at = row[0] if row else None
+
+        return uploaded_at is not None and uploaded_at >= time.time() - self._max_age
+
+    def add(self, key: str) -> None:
+        """Record the given object as uploaded.
+
+        Arguments:
+            key: The key of the uploaded object.
+
+        """
+        uploaded_at = time.time()
+        if self._database is not None:
+            with self._database.connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO uploaded_objects VALUES (?, ?)", (key, uploaded_at)
+                )
+            return
+
+        with self._lock:
+            self._keys.pop(key, None)
+            self._keys[key] = uploaded_at
+            if len(self._keys) > self._MAX_MEMORY_KEYS:
+                self._keys.popitem(last=False)
+
+            expired = uploaded_at - self._max_age
+            while self._keys and next(iter(self._keys.values())) < expired:
+                self._keys.popitem(last=False)
+
+    def upload(self, key: str, upload: Callable[[], None]) -> bool:
+        """Upload the object by the given function unless it has been uploaded.
+
+        When the same object is being uploaded by another thread, wait for it to finish and
+        upload again only if it failed.
+
+        Arguments:
+            key: The key of the object.
+            upload: The function which uploads the object.
+
+        Returns:
+            Whether the object is uploaded by this call.
+
+        """
+        while True:
+            with self._lock:
+                if key in self:
+                    return False
+
+                event = self._uploading.get(key)
+                if event is None:
+                    event = self._uploading[key] = Event()
+                    break
+
+            event.wait()
+
+        try:
+            upload()
+            self.add(key)
+        finally:
+            with self._lock:
+                del self._uploading[key]
+            event.set()
+
+        return True
+
+
+_RECORDS: Dict[str, UploadedObjects] = {}
+_LOCK = Lock()
+
+
+def get_uploaded_objects(path: str) -> UploadedObjects:
+    """Get the record of the uploaded objects stored in the given path.
+
+    Arguments:
+        path: The path of the SQLite database file, empty for the record in memory.
+
+    Returns:
+        The :class:`UploadedObjects` stored in the path.
+
+    """
+    with _LOCK:
+        if path not in _RECORDS:
+            _RECORDS[path] = UploadedObjects(path)
+
+        return _RECORDS[path]
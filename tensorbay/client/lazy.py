@@ -5,10 +5,16 @@
 
 """Related classes for the lazy evaluation."""
 
-from itertools import repeat, zip_longest
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice, repeat, zip_longest
+from threading import Event, Lock
+from time import time
 from typing import (
     Any,
     Callable,
+    Deque,
+    Dict,
     Generator,
     Generic,
     Iterable,
@@ -16,13 +22,14 @@ from typing import (
     List,
     MutableSequence,
     Optional,
+    Set,
     Tuple,
     TypeVar,
     Union,
     overload,
 )
 
-from tensorbay.utility import ReprMixin, ReprType, locked
+from tensorbay.utility import ReprMixin, ReprType, config, fit_connection_pool, locked
 
 _T = TypeVar("_T")
 PagingGenerator = Callable[[int, int], Generator[_T, None, int]]
@@ -121,6 +128,38 @@ class ReturnGenerator(Generic[_T, _R]):
         self.value = yield from self._generator
 
 
+def map_pages(
+    func: PagingGenerator[_T],
+    function: Callable[[Iterable[_T]], _R],
+    total_count: int,
+    *,
+    jobs: int = 1,
+) -> List[_R]:
+    """Fetch the pages after the first page concurrently and apply the function to each of them.
+
+    The pages are requested by ``config.page_size``, the first page is fetched by the caller to
+    get the total count, so it is not requested again.
+
+    Arguments:
+        func: The paging generator function.
+        function: The function applied to the items of each page.
+        total_count: The total count of the items returned by the first page.
+        jobs: The number of the pages fetched concurrently.
+
+    Returns:
+        The results of the function on the pages in order.
+
+    """
+    limit = config.page_size
+    fit_connection_pool(jobs)
+    with ThreadPoolExecutor(jobs) as executor:
+        return list(
+            executor.map(
+                lambda offset: function(func(offset, limit)), range(limit, total_count, limit)
+            )
+        )
+
+
 class LazyPage(Generic[_T]):
     """In paging lazy evaluation system, a LazyPage instance represents a page with elements.
 
@@ -219,6 +258,116 @@ class InitPage(LazyPage[_T]):
         self.total_count = generator.value
 
 
+class AdaptivePagingGenerator(Generic[_T]):
+    """AdaptivePagingGenerator wraps a paging generator function to adapt the size of the requests.
+
+    One paging request pulls the elements of several consecutive pages, the number of pages grows
+    while the latency per element drops and shrinks when it rises. The extra pages are stored by
+    their offsets and served to the following paging requests without sending requests again.
+
+    The pages covered by a request in flight are claimed by it, so the pages pulled concurrently
+    by the prefetching threads wait for the request instead of being requested again.
+
+    Arguments:
+        func: A paging generator function, which takes offset<int> and limit<int> as inputs and
+            returns a generator. The returned generator should yield the element user needs, and
+            return the total count of the elements in the paging request.
+        max_limit: The max limit of a single paging request.
+
+    """
+
+    def __init__(self, func: PagingGenerator[_T], max_limit: int) -> None:
+        self._func = func
+        self._max_limit = max_limit
+        self._lock = Lock()
+        self._factor = 1
+        self._latency = float("inf")
+        self._pages: Dict[int, Tuple[List[_T], int]] = {}
+        self._pending: Dict[int, Event] = {}
+
+    def _claim(self, offset: int, limit: int) -> Tuple[Optional[Tuple[List[_T], int]], List[int]]:
+        """Get the stored page, or claim the pages to request.
+
+        Arguments:
+            offset: The offset of the page.
+            limit: The limit of the page.
+
+        Returns:
+            The stored elements and total count of the page, and an empty list of the claimed
+            offsets; or None and the offsets of the consecutive pages claimed by this request.
+
+        """
+        while True:
+            with self._lock:
+                page = self._pages.pop(offset, None)
+                if page is not None:
+                    return page, []
+
+                event = self._pending.get(offset)
+                if event is None:
+                    offsets = [offset]
+                    factor = min(self._factor, max(self._max_limit // limit, 1))
+                    while len(offsets) < factor:
+                        next_offset = offsets[-1] + limit
+                        if next_offset in self._pending or next_offset in self._pages:
+                            break
+                        offsets.append(next_offset)
+
+                    event = Event()
+                    for claimed_offset in offsets:
+                        self._pending[claimed_offset] = event
+                    return None, offsets
+
+            # The page is requested by another thread, wait for it and look it up again.
+            event.wait()
+
+    def __call__(self, offset: int, limit: int) -> Generator[_T, None, int]:
+        """Yield the elements of the required page and return the total count.
+
+        Arguments:
+            offset: The offset of the page.
+            limit: The limit of the page.
+
+        Yields:
+            The elements of the page.
+
+        Returns:
+            The total count of the elements.
+
+        """
+        page, offsets = self._claim(offset, limit)
+        if page is not None:
+            yield from page[0]
+            return page[1]
+
+        event = self._pending[offset]
+        try:
+            start_time = time()
+            generator = ReturnGenerator(self._func(offset, limit * len(offsets)))
+            elements = list(generator)
+            latency = (time() - start_time) / max(len(elements), 1)
+
+            with self._lock:
+                if latency <= self._latency:
+                    self._factor = len(offsets) * 2
+                else:
+                    self._factor = max(len(offsets) // 2, 1)
+                self._latency = latency
+
+                for index, page_offset in enumerate(offsets[1:], 1):
+                    page_elements = elements[index * limit : (index + 1) * limit]
+                    if page_elements:
+                        self._pages[page_offset] = (page_elements, generator.value)
+        finally:
+            with self._lock:
+                for claimed_offset in offsets:
+                    del self._pending[claimed_offset]
+            event.set()
+
+        yield from elements[:limit]
+        return generator.value
+
+
 class PagingList(MutableSequence[_T], ReprMixin):
     """PagingList is a wrap of web paging request.
 
@@ -229,7 +378,7 @@ class PagingList(MutableSequence[_T], ReprMixin):
         func: A paging generator function, which takes offset<int> and limit<int> as inputs and
             returns a generator. The returned generator should yield the element user needs, and
             return the total count of the elements in the paging request.
-        limit: The page size of each paging request.
+        limit: The page size of each paging request, use ``config.page_size`` if not given.
 
     """
 
@@ -239,9 +388,9 @@ class PagingList(MutableSequence[_T], ReprMixin):
 
     _items: List[LazyItem[_T]]
 
-    def __init__(self, func: PagingGenerator[_T], limit: int) -> None:
+    def __init__(self, func: PagingGenerator[_T], limit: Optional[int] = None) -> None:
         self._func = func
-        self._limit = limit
+        self._limit = limit if limit is not None else config.page_size
         self._init_items: Callable[[int], None] = self._init_all_items
 
     def __len__(self) -> int:
@@ -287,7 +436,12 @@ class PagingList(MutableSequence[_T], ReprMixin):
         self._get_items().__delitem__(index)
 
     def __iter__(self) -> Iterator[_T]:
-        for item in self._get_items():
+        items = self._get_items()
+        if config.prefetch_pages > 0:
+            yield from self._prefetch(items, config.prefetch_pages)
+            return
+
+        for item in items:
             yield item.get()
 
     def __reversed__(self) -> Iterator[_T]:
@@ -327,15 +481,63 @@ class PagingList(MutableSequence[_T], ReprMixin):
         div, mod = divmod(total_count, limit)
         yield from zip_longest(range(0, total_count, limit), repeat(limit, div), fillvalue=mod)
 
+    @staticmethod
+    def _generate_unpulled_pages(items: Iterable[LazyItem[_T]]) -> Iterator[LazyPage[_T]]:
+        pages: Set[LazyPage[_T]] = set()
+        for item in items:
+            if hasattr(item, "data"):
+                continue
+
+            page = item.page
+            if page not in pages:
+                pages.add(page)
+                yield page
+
+    def _prefetch(self, items: List[LazyItem[_T]], jobs: int) -> Iterator[_T]:
+        """Iterate the items while pulling the following pages concurrently.
+
+        The pages are pulled in the iteration order by a thread pool, at most ``jobs`` pages are
+        in flight at the same time.
+
+        Arguments:
+            items: The :class:`LazyItem` list to iterate.
+            jobs: The number of the pages pulled ahead concurrently.
+
+        Yields:
+            The elements of the items in order.
+
+        """
+        pages = self._generate_unpulled_pages(list(items))
+        fit_connection_pool(jobs)
+        with ThreadPoolExecutor(jobs) as executor:
+            futures: Deque["Future[None]"] = deque(
+                executor.submit(page.pull) for page in islice(pages, jobs)
+            )
+            try:
+                for item in items:
+                    while not hasattr(item, "data") and futures:
+                        futures.popleft().result()
+                        futures.extend(executor.submit(page.pull) for page in islice(pages, 1))
+
+                    yield item.get()
+            finally:
+                for future in futures:
+                    future.cancel()
+
     @locked
     def _init_all_items(self, index: int = 0) -> None:
         index = index if index >= 0 else 0
         index_offset = index // self._limit * self._limit
-        init_page = InitPage(index_offset, self._limit, self._func)
+        func = (
+            AdaptivePagingGenerator(self._func, config.max_page_size)
+            if config.adaptive_paging
+            else self._func
+        )
+        init_page = InitPage(index_offset, self._limit, func)
         total_count = init_page.total_count
         self._items: List[LazyItem[_T]] = []
         for offset, limit in self._range(total_count, self._limit):
-            page = init_page if offset == index_offset else LazyPage(offset, limit, self._func)
+            page = init_page if offset == index_offset else LazyPage(offset, limit, func)
             self._items.extend(page.items)
 
     @locked
@@ -157,12 +157,12 @@ class Profile:
 
     def _statistical_open(self, func: _OpenCallable) -> _OpenCallable:
         @wraps(func)
-        def wrapper(obj: RemoteFileMixin) -> UserResponse:
+        def wrapper(obj: RemoteFileMixin, *args: Any, **kwargs: Any) -> UserResponse:
             netloc = urlparse(obj.url.get()).netloc  # type: ignore[union-attr]
             download_path = f"[GET] {netloc}/*"
 
             start_time = time.time()
-            fp = func(obj)
+            fp = func(obj, *args, **kwargs)
             cost_time = time.time() - start_time
 
             item = self._summary.get(download_path, defaultdict(int))
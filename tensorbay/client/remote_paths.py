@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""The compact set of the remote paths in a segment on TensorBay."""
+
+import os
+import tempfile
+from hashlib import blake2b, sha1
+from threading import Lock
+from typing import IO, Any, Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from tensorbay.client.lazy import PagingGenerator, ReturnGenerator, map_pages
+from tensorbay.utility import config
+
+_DTYPE = np.dtype([("fingerprint", "<u8"), ("offset", "<u8")])
+
+
+def fingerprint(remote_path: str) -> int:
+    """Get the 64-bit fingerprint of the given remote path.
+
+    Arguments:
+        remote_path: The remote path.
+
+    Returns:
+        The fingerprint of the remote path.
+
+    """
+    return int.from_bytes(blake2b(remote_path.encode(), digest_size=8).digest(), "little")
+
+
+def _get_paths_path(path: str) -> str:
+    return f"{os.path.splitext(path)[0]}.paths"
+
+
+class _PathsWriter:
+    """Append the remote paths to the paths file and get their records.
+
+    Arguments:
+        fp: The paths file opened in binary appending or writing mode.
+
+    """
+
+    def __init__(self, fp: IO[bytes]) -> None:
+        self._fp = fp
+        self._lock = Lock()
+
+    def __call__(self, remote_paths: Iterable[str]) -> np.ndarray:
+        remote_paths = list(remote_paths)
+        lines = [f"{remote_path}\n".encode() for remote_path in remote_paths]
+        records = np.empty(len(lines), dtype=_DTYPE)
+        records["fingerprint"] = [fingerprint(remote_path) for remote_path in remote_paths]
+        lengths = np.fromiter(map(len, lines), dtype="<u8", count=len(lines))
+        records["offset"] = np.cumsum(lengths) - lengths
+
+        with self._lock:
+            self._fp.seek(0, os.SEEK_END)
+            records["offset"] += self._fp.tell()
+            self._fp.write(b"".join(lines))
+        return records
+
+
+def get_journal_path(dataset_id: str, draft_number: Optional[int], segment_name: str) -> str:
+    """Get the path of the journal which stores the remote paths of the given segment.
+
+    Arguments:
+        dataset_id: The id of the dataset.
+        draft_number: The number of the draft.
+        segment_name: The name of the segment.
+
+    Returns:
+        The path of the journal file, empty if ``config.persist_remote_paths`` is disabled.
+
+    """
+    if not config.persist_remote_paths:
+        return ""
+
+    key = f"{dataset_id}/{draft_number}/{segment_name}"
+    return os.path.join(
+        tempfile.gettempdir(),
+        "tensorbay",
+        "remote_paths",
+        f"{sha1(key.encode()).hexdigest()}.bin",
+    )
+
+
+class RemotePathSet:
+    """This class defines the compact set of the remote paths in a segment.
+
+    The remote paths are written to a file line by line, and the set keeps the sorted array of
+    their 64-bit fingerprints with the offsets of the paths in the file, which takes 16 bytes per
+    path in memory. A fingerprint hit is verified by reading the path from the file, so a
+    fingerprint collision never takes a path for an uploaded one.
+
+    When the path of the journal is given, the fingerprints and the offsets are stored in the
+    journal, the remote paths are stored next to it with the ``.paths`` suffix, and the remote
+    paths added later are appended to them, so the set can be loaded again without listing the
+    remote paths when the total count of the segment and the first page of the remote paths match.
+    The journal is removed when the data in the segment are deleted by the SDK.
+
+    Arguments:
+        records: The fingerprints of the remote paths and their offsets in the paths file.
+        fp: The paths file opened in binary reading mode.
+        path: The path of the journal file, empty for not storing the set.
+
+    """
+
+    def __init__(self, records: np.ndarray, fp: IO[bytes], path: str = "") -> None:
+        self._records = np.sort(records.astype(_DTYPE), order="fingerprint")
+        self._fp = fp
+        self._path = path
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        fingerprints = self._records["fingerprint"]
+        return int(np.count_nonzero(fingerprints[1:] != fingerprints[:-1])) + bool(
+            len(fingerprints)
+        )
+
+    def __contains__(self, remote_path: object) -> bool:
+        if not isinstance(remote_path, str):
+            return False
+
+        value = fingerprint(remote_path)
+        fingerprints = self._records["fingerprint"]
+        start = np.searchsorted(fingerprints, value, "left")
+        stop = np.searchsorted(fingerprints, value, "right")
+        line = f"{remote_path}\n".encode()
+        with self._lock:
+            for offset in self._records["offset"][start:stop]:
+                self._fp.seek(int(offset))
+                if self._fp.readline() == line:
+                    return True
+
+        return False
+
+    @classmethod
+    def load(cls, path: str) -> Optional["RemotePathSet"]:
+        """Load the set from the given journal file.
+
+        Arguments:
+            path: The path of the journal file.
+
+        Returns:
+            The loaded :class:`RemotePathSet`, None if the journal does not exist.
+
+        """
+        try:
+            with open(path, "rb") as fp:
+                records = np.frombuffer(fp.read(), dtype=_DTYPE)
+            paths_fp = open(_get_paths_path(path), "rb")  # pylint: disable=consider-using-with
+        except (OSError, ValueError):
+            return None
+
+        return cls(records, paths_fp, path)
+
+    @classmethod
+    def fetch(cls, func: PagingGenerator[str], *, jobs: int = 1, path: str = "") -> "RemotePathSet":
+        """Fetch the remote paths from TensorBay in parallel by the paging generator function.
+
+        When the journal in the given path holds the same number of paths as the total count and
+        contains all the paths in the first page, the set is loaded from the journal without
+        listing the other pages.
+
+        Arguments:
+            func: The paging generator function of the remote paths.
+            jobs: The number of the pages fetched concurrently.
+            path: The path of the journal file, empty for not storing the set.
+
+        Returns:
+            The fetched :class:`RemotePathSet`.
+
+        """
+        limit = config.page_size
+        first_page = ReturnGenerator(func(0, limit))
+        first_paths = list(first_page)
+        total_count = first_page.value
+
+        if path:
+            remote_path_set = cls.load(path)
+            if remote_path_set is not None:
+                if len(remote_path_set) == total_count and all(
+                    remote_path in remote_path_set for remote_path in first_paths
+                ):
+                    return remote_path_set
+                remote_path_set.close()
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        paths_path = _get_paths_path(path) if path else ""
+        # pylint: disable=consider-using-with
+        fp = open(f"{paths_path}.{os.getpid()}", "w+b") if path else tempfile.TemporaryFile()
+        writer = _PathsWriter(fp)
+        records = np.concatenate(
+            [writer(first_paths), *map_pages(func, writer, total_count, jobs=jobs)]
+        )
+        if not path:
+            return cls(records, fp)
+
+        fp.close()
+        os.replace(fp.name, paths_path)
+        remote_path_set = cls(records, open(paths_path, "rb"), path)
+        remote_path_set._dump()  # pylint: disable=protected-access
+        return remote_path_set
+
+    @staticmethod
+    def invalidate(path: str) -> None:
+        """Remove the journal in the given path since the remote paths in it are outdated.
+
+        Arguments:
+            path: The path of the journal file, empty for doing nothing.
+
+        """
+        if not path:
+            return
+
+        for journal_path in (path, _get_paths_path(path)):
+            try:
+                os.remove(journal_path)
+            except FileNotFoundError:
+                pass
+
+    def close(self) -> None:
+        """Close the file of the remote paths."""
+        self._fp.close()
+
+    def _dump(self) -> None:
+        temp_path = f"{self._path}.{os.getpid()}"
+        with open(temp_path, "wb") as fp:
+            fp.write(self._records.tobytes())
+        os.replace(temp_path, self._path)
+
+    def record(self, remote_paths: Iterable[str]) -> None:
+        """Record the given uploaded remote paths in the journal.
+
+        The set itself is not changed, since the uploaded paths are not looked up again in the
+        same uploading.
+
+        Arguments:
+            remote_paths: The uploaded remote paths.
+
+        """
+        if not self._path:
+            return
+
+        with self._lock:
+            # The paths are written before their records, so the records never point outside the
+            # paths file when the process got interrupted in between.
+            with open(_get_paths_path(self._path), "ab") as fp:
+                records = _PathsWriter(fp)(remote_paths)
+            with open(self._path, "ab") as fp:
+                fp.write(records.tobytes())
+
+    def recorded(
+        self, callback: Callable[[Tuple[Dict[str, Any], ...]], None]
+    ) -> Callable[[Tuple[Dict[str, Any], ...]], None]:
+        """Wrap the callback of the uploaded data to record their remote paths in the journal.
+
+        Arguments:
+            callback: The callback which synchronizes the information of the uploaded data.
+
+        Returns:
+            The callback which records the remote paths after synchronizing.
+
+        """
+
+        def _callback(callback_bodies: Tuple[Dict[str, Any], ...]) -> None:
+            callback(callback_bodies)
+            self.record(body["remotePath"] for body in callback_bodies)
+
+        return _callback
@@ -3,13 +3,14 @@
 # Copyright 2021 Graviti. Licensed under MIT License.
 #
 
-"""The multi-thread uploading framework and request senders of the TensorBay Dataset Open API."""
+"""The multi-thread task framework and request senders of the TensorBay Dataset Open API."""
 
 import logging
-from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
 from queue import Queue
 from threading import Lock
-from typing import Any, Callable, Generic, Iterable, Optional, Tuple, TypeVar
+from typing import Any, Callable, Generic, Iterable, Optional, Set, Tuple, TypeVar
 from urllib.parse import urljoin
 from uuid import uuid4
 
@@ -17,7 +18,7 @@ from requests.models import Response
 
 from tensorbay.__version__ import __version__
 from tensorbay.exception import ResponseError, ResponseErrorDistributor
-from tensorbay.utility import Tqdm, config, get_session
+from tensorbay.utility import Tqdm, config, fit_connection_pool, get_session
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +132,8 @@ class Client:
 _T = TypeVar("_T")
 _R = TypeVar("_R")
 
+_PENDING_FACTOR = 4
+
 
 def multithread_upload(
     function: Callable[[_T], Optional[_R]],
@@ -142,6 +145,9 @@ def multithread_upload(
 ) -> None:
     """Multi-thread upload framework.
 
+    The connection pools are enlarged for the concurrent blocks of the uploading threads, and the
+    tasks are run by :func:`multithread_run`.
+
     Arguments:
         function: The upload function.
         arguments: The arguments of the upload function.
@@ -149,17 +155,55 @@ def multithread_upload(
         jobs: The number of the max workers in multi-thread uploading procession.
         pbar: The :class:`Tqdm` instance for showing the upload process bar.
 
+    """
+    # Each uploading thread may upload a large file by concurrent blocks.
+    fit_connection_pool(jobs * config.upload_block_jobs)
+    multithread_run(function, arguments, callback=callback, jobs=jobs, pbar=pbar)
+
+
+def multithread_run(
+    function: Callable[[_T], Optional[_R]],
+    arguments: Iterable[_T],
+    *,
+    callback: Optional[Callable[[Tuple[_R, ...]], None]] = None,
+    jobs: int = 1,
+    pbar: Tqdm,
+) -> None:
+    """Multi-thread task framework shared by uploading and downloading.
+
+    The arguments are consumed lazily, at most ``jobs * _PENDING_FACTOR`` tasks are in flight at
+    the same time, a new task is only submitted when a previous one has been done.
+
+    Arguments:
+        function: The task function.
+        arguments: The arguments of the task function.
+        callback: The callback function.
+        jobs: The number of the max workers.
+        pbar: The :class:`Tqdm` instance for showing the process bar.
+
     """
     with ThreadPoolExecutor(jobs) as executor:
         if callback is not None:
             multi_callback = MultiCallbackTask(function=function, callback=callback)
             function = multi_callback.work
-        futures = [executor.submit(function, argument) for argument in arguments]
-
-        for future in futures:
-            future.add_done_callback(pbar.update_callback)
 
-        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        iterator = iter(arguments)
+
+        def _submit(count: int) -> Set["Future[Any]"]:
+            futures = set()
+            for argument in islice(iterator, count):
+                future = executor.submit(function, argument)
+                future.add_done_callback(pbar.update_callback)
+                futures.add(future)
+            return futures
+
+        not_done = _submit(jobs * _PENDING_FACTOR)
+        done: Set["Future[Any]"] = set()
+        while not_done:
+            done, not_done = wait(not_done, return_when=FIRST_COMPLETED)
+            if any(future.exception() for future in done):
+                break
+            not_done |= _submit(len(done))
 
         if callback is not None:
             multi_callback.last_callback()
@@ -38,17 +38,17 @@ class SearchResultBase(ReprMixin):
         self.search_result_commit_id = search_result_commit_id
         self._client = client
 
-    def _list_segments(self, offset: int = 0, limit: int = 128) -> Dict[str, Any]:
+    def _list_segments(self, offset: int = 0, limit: Optional[int] = None) -> Dict[str, Any]:
         params: Dict[str, Any] = {
             "commit": self.search_result_commit_id,
             "offset": offset,
-            "limit": limit,
+            "limit": limit or config.page_size,
         }
         response = self._client.open_api_do("GET", "segments", self.search_result_id, params=params)
         return response.json()  # type: ignore[no-any-return]
 
     def _generate_segment_names(
-        self, offset: int = 0, limit: int = 128
+        self, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[Any, None, int]:
         response = self._list_segments(offset, limit)
 
@@ -58,12 +58,12 @@ class SearchResultBase(ReprMixin):
         return response["totalCount"]  # type: ignore[no-any-return]
 
     def _list_data_details(
-        self, segment_name: str, offset: int = 0, limit: int = 128
+        self, segment_name: str, offset: int = 0, limit: Optional[int] = None
     ) -> Dict[str, Any]:
         params: Dict[str, Any] = {
             "segmentName": segment_name,
             "offset": offset,
-            "limit": limit,
+            "limit": limit or config.page_size,
             "commit": self.search_result_commit_id,
         }
 
@@ -76,7 +76,7 @@ class SearchResultBase(ReprMixin):
         return response.json()  # type: ignore[no-any-return]
 
     def _generate_urls(
-        self, segment_name: str, offset: int = 0, limit: int = 128
+        self, segment_name: str, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[Dict[str, str], None, int]:
         response = self._list_data_details(segment_name, offset, limit)
 
@@ -86,7 +86,7 @@ class SearchResultBase(ReprMixin):
         return response["totalCount"]  # type: ignore[no-any-return]
 
     def _generate_mask_urls(
-        self, segment_name: str, mask_type: str, offset: int = 0, limit: int = 128
+        self, segment_name: str, mask_type: str, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[Optional[str], None, int]:
         response = self._list_data_details(segment_name, offset, limit)
 
@@ -118,15 +118,16 @@ class SearchResultBase(ReprMixin):
             The PagingList of segment names.
 
         """
-        return PagingList(self._generate_segment_names, 128)
+        return PagingList(self._generate_segment_names)
 
 
 class SearchResult(SearchResultBase):
     """This class defines the structure of the search result from normal dataset."""
 
     def _generate_data(
-        self, segment_name: str, offset: int = 0, limit: int = 128
+        self, segment_name: str, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[RemoteData, None, int]:
+        limit = limit or config.page_size
         response = self._list_data_details(segment_name, offset, limit)
 
         urls = LazyPage.from_items(
@@ -162,18 +163,22 @@ class SearchResult(SearchResultBase):
 
         return response["totalCount"]  # type: ignore[no-any-return]
 
-    def list_data(self, segment_name: str) -> PagingList[RemoteData]:
+    def list_data(
+        self, segment_name: str, *, page_size: Optional[int] = None
+    ) -> PagingList[RemoteData]:
         """List required data of the segment with given name.
 
         Arguments:
             segment_name: Name of the segment.
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
 
         Returns:
             The PagingList of :class:`~tensorbay.dataset.data.RemoteData`.
 
         """
         return PagingList(
-            lambda offset, limit: self._generate_data(segment_name, offset, limit), 128
+            lambda offset, limit: self._generate_data(segment_name, offset, limit), page_size
         )
 
 
@@ -181,8 +186,9 @@ class FusionSearchResult(SearchResultBase):
     """This class defines the structure of the search result from fusion dataset."""
 
     def _generate_frames(
-        self, segment_name: str, offset: int = 0, limit: int = 128
+        self, segment_name: str, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[Frame, None, int]:
+        limit = limit or config.page_size
         response = self._list_data_details(segment_name, offset, limit)
 
         url_page = LazyPage.from_items(
@@ -200,18 +206,22 @@ class FusionSearchResult(SearchResultBase):
 
         return response["totalCount"]  # type: ignore[no-any-return]
 
-    def list_frames(self, segment_name: str) -> PagingList[Frame]:
+    def list_frames(
+        self, segment_name: str, *, page_size: Optional[int] = None
+    ) -> PagingList[Frame]:
         """List required frames of the segment with given name.
 
         Arguments:
             segment_name: Name of the segment.
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
 
         Returns:
             The PagingList of :class:`~tensorbay.dataset.frame.Frame`.
 
         """
         return PagingList(
-            lambda offset, limit: self._generate_frames(segment_name, offset, limit), 128
+            lambda offset, limit: self._generate_frames(segment_name, offset, limit), page_size
         )
 
     def get_sensors(self, segment_name: str) -> Sensors:
@@ -6,23 +6,24 @@
 """The segment of remote dataset on TensorBay."""
 
 import os
-import time
-from copy import deepcopy
+from functools import partial
 from itertools import zip_longest
-from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, List, Optional, Tuple, Union
 
-import filetype
-from requests_toolbelt import MultipartEncoder
 from ulid import ULID, from_timestamp
 
 from tensorbay.client.lazy import LazyPage, PagingList
+from tensorbay.client.remote_paths import RemotePathSet, get_journal_path
 from tensorbay.client.status import Status
+from tensorbay.client.upload import UploadMixin
 from tensorbay.dataset import AuthData, Data, Frame, RemoteData
 from tensorbay.dataset.data import DataBase
-from tensorbay.exception import FrameError, InvalidParamsError, ResourceNotExistError, ResponseError
+from tensorbay.exception import FrameError, InvalidParamsError, ResourceNotExistError
 from tensorbay.label import Label
+from tensorbay.label.columnar import split_label_columns
 from tensorbay.sensor.sensor import Sensor, Sensors
-from tensorbay.utility import URL, FileMixin, chunked, config, locked
+from tensorbay.utility import URL, chunked, config
+from tensorbay.utility.checksum import get_url_checksum
 
 if TYPE_CHECKING:
     from tensorbay.client.dataset import DatasetClient, FusionDatasetClient
@@ -31,7 +32,7 @@ _STRATEGIES = {"abort", "override", "skip"}
 _MASK_KEYS = ("semantic_mask", "instance_mask", "panoptic_mask")
 
 
-class SegmentClientBase:
+class SegmentClientBase(UploadMixin):  # pylint: disable=too-many-instance-attributes
     """This class defines the basic concept of :class:`SegmentClient`.
 
     A :class:`SegmentClientBase` contains the information needed for determining
@@ -47,8 +48,6 @@ class SegmentClientBase:
 
     """
 
-    _EXPIRED_IN_SECOND = 240
-
     def __init__(
         self, name: str, dataset_client: "Union[DatasetClient, FusionDatasetClient]"
     ) -> None:
@@ -66,8 +65,12 @@ class SegmentClientBase:
                 dataset_client.status.commit_id,  # type: ignore[arg-type]
                 name,
             )
+            self._metadata_cache = dataset_client._metadata_cache
+            self._file_cache = dataset_client._file_cache
         else:
             self._cache_path = ""
+            self._metadata_cache = None
+            self._file_cache = None
 
     def _get_url(self, remote_path: str) -> str:
         """Get URL of a specific remote path.
@@ -91,11 +94,11 @@ class SegmentClientBase:
         response = self._client.open_api_do("GET", "data/urls", self._dataset_id, params=params)
         return response.json()["urls"][0]["url"]  # type: ignore[no-any-return]
 
-    def _list_urls(self, offset: int = 0, limit: int = 128) -> Dict[str, Any]:
+    def _list_urls(self, offset: int = 0, limit: Optional[int] = None) -> Dict[str, Any]:
         params: Dict[str, Any] = {
             "segmentName": self._name,
             "offset": offset,
-            "limit": limit,
+            "limit": limit or config.page_size,
         }
         params.update(self._status.get_status_info())
 
@@ -123,11 +126,11 @@ class SegmentClientBase:
 
         return data_details  # type: ignore[no-any-return]
 
-    def _list_data_details(self, offset: int = 0, limit: int = 128) -> Dict[str, Any]:
+    def _list_data_details(self, offset: int = 0, limit: Optional[int] = None) -> Dict[str, Any]:
         params: Dict[str, Any] = {
             "segmentName": self._name,
             "offset": offset,
-            "limit": limit,
+            "limit": limit or config.page_size,
         }
         params.update(self._status.get_status_info())
 
@@ -137,6 +140,31 @@ class SegmentClientBase:
         response = self._client.open_api_do("GET", "data/details", self._dataset_id, params=params)
         return response.json()  # type: ignore[no-any-return]
 
+    def _list_cached_data_details(self, offset: int, limit: int) -> Tuple[Dict[str, Any], bool]:
+        """List the data details and read or write them through the metadata cache.
+
+        Arguments:
+            offset: The offset of the page.
+            limit: The limit of the page.
+
+        Returns:
+            The response of the data details and whether it is read from the metadata cache.
+
+        """
+        if not self._metadata_cache:
+            return self._list_data_details(offset, limit), False
+
+        commit_id: str = self._status.commit_id  # type: ignore[assignment]
+        response = self._metadata_cache.get_data_details(commit_id, self._name, offset, limit)
+        if response is not None:
+            return response, True
+
+        response = self._list_data_details(offset, limit)
+        self._metadata_cache.put_data_details(
+            commit_id, self._name, offset, response["dataDetails"], response["totalCount"]
+        )
+        return response, False
+
     def _get_mask_url(self, mask_type: str, remote_path: str) -> str:
         params: Dict[str, Any] = {
             "segmentName": self._name,
@@ -158,12 +186,14 @@ class SegmentClientBase:
 
         return mask_url  # type: ignore[no-any-return]
 
-    def _list_mask_urls(self, mask_type: str, offset: int = 0, limit: int = 128) -> Dict[str, Any]:
+    def _list_mask_urls(
+        self, mask_type: str, offset: int = 0, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
         params: Dict[str, Any] = {
             "segmentName": self._name,
             "maskType": mask_type,
             "offset": offset,
-            "limit": limit,
+            "limit": limit or config.page_size,
         }
         params.update(self._status.get_status_info())
 
@@ -173,155 +203,23 @@ class SegmentClientBase:
         response = self._client.open_api_do("GET", "masks/urls", self._dataset_id, params=params)
         return response.json()  # type: ignore[no-any-return]
 
-    def _list_labels(self, offset: int = 0, limit: int = 128) -> Dict[str, Any]:
+    def _list_labels(self, offset: int = 0, limit: Optional[int] = None) -> Dict[str, Any]:
         params: Dict[str, Any] = {
             "segmentName": self._name,
             "offset": offset,
-            "limit": limit,
+            "limit": limit or config.page_size,
         }
         params.update(self._status.get_status_info())
 
         response = self._client.open_api_do("GET", "labels", self._dataset_id, params=params)
         return response.json()  # type: ignore[no-any-return]
 
-    @locked
-    def _request_upload_permission(self) -> None:
-        params: Dict[str, Any] = {"expired": self._EXPIRED_IN_SECOND, "segmentName": self._name}
-        params.update(self._status.get_status_info())
-
-        if config.is_internal:
-            params["isInternal"] = True
-
-        _permission = self._client.open_api_do(
-            "GET", "policies", self._dataset_id, params=params
-        ).json()
-
-        result = _permission["result"]
-        del result["multipleUploadLimit"]
-
-        keys = [key for key, value in result.items() if value is None]
-        for key in keys:
-            del result[key]
-
-        self._permission = _permission
-
-    def _get_upload_permission(self) -> Dict[str, Any]:
-        if int(time.time()) >= self._permission["expireAt"]:
-            self._request_upload_permission()
-
-        return deepcopy(self._permission)
-
-    def _upload_file(self, data: FileMixin) -> None:
-        """Upload the file in the data to the draft.
-
-        Arguments:
-            data: The data instance needs to be uploaded.
-
-        """
-        permission = self._get_upload_permission()
-        post_data = permission["result"]
-
-        local_path = data.path
-        checksum = data.get_checksum()
-
-        post_data["key"] = permission["extra"]["objectPrefix"] + checksum
-
-        host = permission["extra"]["host"]
-        backend_type = permission["extra"]["backendType"]
-        if backend_type == "azure":
-            url = (
-                f'{permission["extra"]["host"]}{permission["extra"]["objectPrefix"]}'
-                f'{checksum}?{permission["result"]["token"]}'
-            )
-
-            self._put_binary_file_to_azure(url, local_path, post_data)
-        elif backend_type == "fps":
-            self._post_multipart_formdata(
-                host,
-                local_path,
-                post_data,
-                checksum,
-            )
-        else:
-            self._post_multipart_formdata(
-                host,
-                local_path,
-                post_data,
-            )
-
     def _upload_mask_files(self, label: Label) -> None:
         for key in _MASK_KEYS:
             mask = getattr(label, key, None)
             if mask:
                 self._upload_file(mask)
 
-    def _post_multipart_formdata(
-        self,
-        url: str,
-        local_path: str,
-        data: Dict[str, Any],
-        filename: str = "",
-    ) -> None:
-        with open(local_path, "rb") as fp:
-            file_type = filetype.guess_mime(local_path)
-            if "x-amz-date" in data:
-                data["Content-Type"] = file_type
-
-            try:
-                data["file"] = (filename, fp, file_type)
-                self._post_formdata(url, data)
-            except ResponseError as error:
-                if b"MalformedPOSTRequest" in error.response.content:
-                    data["file"] = ("workaroundForMalformedPostRequest", fp, file_type)
-                    self._post_formdata(url, data)
-                else:
-                    raise
-
-    def _post_formdata(self, url: str, data: Dict[str, Any]) -> None:
-        multipart = MultipartEncoder(data)
-        self._client.do(
-            "POST",
-            url,
-            data=multipart,
-            headers={"Content-Type": multipart.content_type},
-        )
-
-    def _put_binary_file_to_azure(
-        self,
-        url: str,
-        local_path: str,
-        data: Dict[str, Any],
-    ) -> None:
-        with open(local_path, "rb") as fp:
-            file_type = filetype.guess_mime(local_path)
-            request_headers = {
-                "x-ms-blob-content-type": file_type,
-                "x-ms-blob-type": data["x-ms-blob-type"],
-            }
-            self._client.do("PUT", url, data=fp, headers=request_headers)
-
-    def _synchronize_import_info(self, callback_bodies: Tuple[Dict[str, Any], ...]) -> None:
-        put_data: Dict[str, Any] = {
-            "segmentName": self.name,
-            "objects": callback_bodies,
-            "deleteSource": False,
-        }
-        put_data.update(self._status.get_status_info())
-
-        self._client.open_api_do("PUT", "multi/cloud-callback", self._dataset_id, json=put_data)
-
-    def _synchronize_upload_info(
-        self,
-        callback_bodies: Tuple[Dict[str, Any], ...],
-    ) -> None:
-        put_data: Dict[str, Any] = {
-            "segmentName": self.name,
-            "objects": callback_bodies,
-        }
-        put_data.update(self._status.get_status_info())
-
-        self._client.open_api_do("PUT", "multi/callback", self._dataset_id, json=put_data)
-
     def _upload_label(self, data: Union[AuthData, Data]) -> None:
         label = data.label.dumps()
         if not label:
@@ -407,11 +305,13 @@ class SegmentClient(SegmentClientBase):
     def __init__(self, name: str, data_client: "DatasetClient") -> None:
         super().__init__(name, data_client)
 
-    def _generate_data_paths(self, offset: int = 0, limit: int = 128) -> Generator[str, None, int]:
+    def _generate_data_paths(
+        self, offset: int = 0, limit: Optional[int] = None
+    ) -> Generator[str, None, int]:
         params: Dict[str, Any] = {
             "segmentName": self._name,
             "offset": offset,
-            "limit": limit,
+            "limit": limit or config.page_size,
         }
         params.update(self._status.get_status_info())
 
@@ -422,45 +322,86 @@ class SegmentClient(SegmentClientBase):
 
         return response["totalCount"]  # type: ignore[no-any-return]
 
-    def _generate_data(self, offset: int = 0, limit: int = 128) -> Generator[RemoteData, None, int]:
+    def _generate_data_checksums(
+        self, offset: int = 0, limit: Optional[int] = None
+    ) -> Generator[Tuple[str, Optional[str]], None, int]:
         response = self._list_data_details(offset, limit)
 
-        urls = LazyPage.from_items(
-            offset,
-            limit,
-            self._generate_urls,
-            (item["url"] for item in response["dataDetails"]),
+        for item in response["dataDetails"]:
+            checksum = item.get("checksum") or get_url_checksum(item["url"])
+            yield item["remotePath"], checksum
+
+        return response["totalCount"]  # type: ignore[no-any-return]
+
+    def _generate_data(
+        self, offset: int = 0, limit: Optional[int] = None, label_columns: Tuple[str, ...] = ()
+    ) -> Generator[RemoteData, None, int]:
+        limit = limit or config.page_size
+        response, is_cached = self._list_cached_data_details(offset, limit)
+        contents, columns = split_label_columns(
+            [item["label"] for item in response["dataDetails"]], label_columns
         )
+        details = [
+            dict(item, label=label) for item, label in zip(response["dataDetails"], contents)
+        ]
+        page = list(self._create_data(offset, limit, details, is_cached))
+        for column in columns:
+            column.bind(data.label for data in page)
+
+        yield from page
+        return response["totalCount"]  # type: ignore[no-any-return]
 
-        mask_urls = {}
-        for key in _MASK_KEYS:
-            mask_urls[key] = LazyPage.from_items(
+    def _create_data(
+        self, offset: int, limit: int, details: List[Dict[str, Any]], is_cached: bool
+    ) -> Generator[RemoteData, None, None]:
+        # The urls in the cached data details are expired, they are pulled lazily when required.
+        urls = (
+            LazyPage(offset, limit, self._generate_urls)
+            if is_cached
+            else LazyPage.from_items(
                 offset,
                 limit,
-                lambda offset, limit, k=key.upper(): (  # type: ignore[misc]
-                    self._generate_mask_urls(k, offset, limit)
-                ),
-                (item["label"].get(key.upper(), {}).get("url") for item in response["dataDetails"]),
+                self._generate_urls,
+                (item["url"] for item in details),
             )
+        )
 
-        for i, item in enumerate(response["dataDetails"]):
+        mask_urls = {}
+        for key in _MASK_KEYS:
+            mask_func = partial(self._generate_mask_urls, key.upper())
+            mask_urls[key] = (
+                LazyPage(offset, limit, mask_func)
+                if is_cached
+                else LazyPage.from_items(
+                    offset,
+                    limit,
+                    mask_func,
+                    (item["label"].get(key.upper(), {}).get("url") for item in details),
+                )
+            )
+
+        for i, item in enumerate(details):
             data = RemoteData.from_response_body(
                 item,
                 url=URL.from_getter(urls.items[i].get, urls.pull),
                 cache_path=self._cache_path,
+                file_cache=self._file_cache,
             )
             label = data.label
             for key in _MASK_KEYS:
                 mask = getattr(label, key, None)
                 if mask:
-                    mask.url = URL.from_getter(mask_urls[key].items[i].get, mask_urls[key].pull)
+                    mask.url = URL.from_getter(
+                        mask_urls[key].items[i].get, mask_urls[key].pull  # type: ignore[arg-type]
+                    )
                     mask.cache_path = os.path.join(self._cache_path, key, mask.path)
+                    mask.file_cache = self._file_cache
 
             yield data
 
-        return response["totalCount"]  # type: ignore[no-any-return]
-
-    def _generate_urls(self, offset: int = 0, limit: int = 128) -> Generator[str, None, int]:
+    def _generate_urls(
+        self, offset: int = 0, limit: Optional[int] = None
+    ) -> Generator[str, None, int]:
         response = self._list_urls(offset, limit)
 
         for item in response["urls"]:
@@ -469,7 +410,7 @@ class SegmentClient(SegmentClientBase):
         return response["totalCount"]  # type: ignore[no-any-return]
 
     def _generate_mask_urls(
-        self, mask_type: str, offset: int = 0, limit: int = 128
+        self, mask_type: str, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[Optional[str], None, int]:
         response = self._list_mask_urls(mask_type, offset, limit)
 
@@ -706,14 +647,22 @@ class SegmentClient(SegmentClientBase):
 
             self._client.open_api_do("POST", "data?multipleMove", self._dataset_id, json=post_data)
 
-    def list_data_paths(self) -> PagingList[str]:
+        RemotePathSet.invalidate(
+            get_journal_path(self._dataset_id, self._status.draft_number, source["segmentName"])
+        )
+
+    def list_data_paths(self, *, page_size: Optional[int] = None) -> PagingList[str]:
         """List required data path in a segment in a certain commit.
 
+        Arguments:
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
+
         Returns:
             The PagingList of data paths.
 
         """
-        return PagingList(self._generate_data_paths, 128)
+        return PagingList(self._generate_data_paths, page_size)
 
     def get_data(self, remote_path: str) -> RemoteData:
         """Get required Data object from a dataset segment.
@@ -731,11 +680,24 @@ class SegmentClient(SegmentClientBase):
         if not remote_path:
             raise ResourceNotExistError(resource="data", identification=remote_path)
 
-        data_details = self._get_data_details(remote_path)
+        return self._get_remote_data(self._get_data_details(remote_path))
+
+    def _get_remote_data(self, data_details: Dict[str, Any]) -> RemoteData:
+        """Create the remote data from the data details, the urls are refreshed one by one.
+
+        Arguments:
+            data_details: The data details of the remote data.
+
+        Returns:
+            :class:`~tensorbay.dataset.data.RemoteData`.
+
+        """
+        remote_path = data_details["remotePath"]
         data = RemoteData.from_response_body(
             data_details,
             url=URL(data_details["url"], lambda: self._get_url(remote_path)),
             cache_path=self._cache_path,
+            file_cache=self._file_cache,
         )
         label = data.label
 
@@ -749,17 +711,29 @@ class SegmentClient(SegmentClientBase):
                     ),
                 )
                 mask.cache_path = os.path.join(self._cache_path, key, mask.path)
+                mask.file_cache = self._file_cache
 
         return data
 
-    def list_data(self) -> PagingList[RemoteData]:
+    def list_data(
+        self, *, page_size: Optional[int] = None, label_columns: Iterable[str] = ()
+    ) -> PagingList[RemoteData]:
         """List required Data object in a dataset segment.
 
+        Arguments:
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
+            label_columns: The label types stored in :class:`~tensorbay.label.columnar.LabelColumns`
+                like ``("box2d",)``, the labels of these types are loaded into the arrays of each
+                page directly, and the label objects are only created when they are accessed.
+
         Returns:
             The PagingList of :class:`~tensorbay.dataset.data.RemoteData`.
 
         """
-        return PagingList(self._generate_data, 128)
+        return PagingList(
+            partial(self._generate_data, label_columns=tuple(label_columns)), page_size
+        )
 
     def delete_data(self, remote_path: str) -> None:
         """Delete data of a segment in a certain commit with the given remote paths.
@@ -776,29 +750,40 @@ class SegmentClient(SegmentClientBase):
         delete_data.update(self._status.get_status_info())
 
         self._client.open_api_do("DELETE", "data", self._dataset_id, json=delete_data)
+        RemotePathSet.invalidate(
+            get_journal_path(self._dataset_id, self._status.draft_number, self._name)
+        )
 
-    def list_urls(self) -> PagingList[str]:
+    def list_urls(self, *, page_size: Optional[int] = None) -> PagingList[str]:
         """List the data urls in this segment.
 
+        Arguments:
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
+
         Returns:
             The PagingList of urls.
 
         """
-        return PagingList(self._generate_urls, 128)
+        return PagingList(self._generate_urls, page_size)
 
-    def list_mask_urls(self, mask_type: str) -> PagingList[Optional[str]]:
+    def list_mask_urls(
+        self, mask_type: str, *, page_size: Optional[int] = None
+    ) -> PagingList[Optional[str]]:
         """List the mask urls in this segment.
 
         Arguments:
             mask_type: The required mask type, the supported types are
                 ``SEMANTIC_MASK``, ``INSTANCE_MASK`` and ``PANOPTIC_MASK``
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
 
         Returns:
             The PagingList of mask urls.
 
         """
         return PagingList(
-            lambda offset, limit: self._generate_mask_urls(mask_type, offset, limit), 128
+            lambda offset, limit: self._generate_mask_urls(mask_type, offset, limit), page_size
         )
 
 
@@ -820,26 +805,36 @@ class FusionSegmentClient(SegmentClientBase):
     def __init__(self, name: str, data_client: "FusionDatasetClient") -> None:
         super().__init__(name, data_client)
 
-    def _generate_frames(self, offset: int = 0, limit: int = 128) -> Generator[Frame, None, int]:
-        response = self._list_data_details(offset, limit)
-
-        url_page = LazyPage.from_items(
-            offset,
-            limit,
-            self._generate_urls,
-            (
-                {frame["sensorName"]: frame["url"] for frame in item["frame"]}
-                for item in response["dataDetails"]
-            ),
+    def _generate_frames(
+        self, offset: int = 0, limit: Optional[int] = None
+    ) -> Generator[Frame, None, int]:
+        limit = limit or config.page_size
+        response, is_cached = self._list_cached_data_details(offset, limit)
+
+        # The urls in the cached data details are expired, they are pulled lazily when required.
+        url_page = (
+            LazyPage(offset, limit, self._generate_urls)
+            if is_cached
+            else LazyPage.from_items(
+                offset,
+                limit,
+                self._generate_urls,
+                (
+                    {frame["sensorName"]: frame["url"] for frame in item["frame"]}
+                    for item in response["dataDetails"]
+                ),
+            )
         )
 
         for index, item in enumerate(response["dataDetails"]):
-            yield Frame.from_response_body(item, index, url_page, cache_path=self._cache_path)
+            yield Frame.from_response_body(
+                item, index, url_page, cache_path=self._cache_path, file_cache=self._file_cache
+            )
 
         return response["totalCount"]  # type: ignore[no-any-return]
 
     def _generate_urls(
-        self, offset: int = 0, limit: int = 128
+        self, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[Dict[str, str], None, int]:
         response = self._list_urls(offset, limit)
 
@@ -956,14 +951,18 @@ class FusionSegmentClient(SegmentClientBase):
         for chunked_callback_bodies in chunked(callback_bodies, 50):
             self._synchronize_upload_info(chunked_callback_bodies)
 
-    def list_frames(self) -> PagingList[Frame]:
+    def list_frames(self, *, page_size: Optional[int] = None) -> PagingList[Frame]:
         """List required frames in the segment in a certain commit.
 
+        Arguments:
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
+
         Returns:
             The PagingList of :class:`~tensorbay.dataset.frame.Frame`.
 
         """
-        return PagingList(self._generate_frames, 128)
+        return PagingList(self._generate_frames, page_size)
 
     def delete_frame(self, frame_id: Union[str, ULID]) -> None:
         """Delete a frame of a segment in a certain commit with the given frame id.
@@ -981,13 +980,17 @@ class FusionSegmentClient(SegmentClientBase):
 
         self._client.open_api_do("DELETE", "frames", self._dataset_id, json=delete_data)
 
-    def list_urls(self) -> PagingList[Dict[str, str]]:
+    def list_urls(self, *, page_size: Optional[int] = None) -> PagingList[Dict[str, str]]:
         """List the data urls in this segment.
 
+        Arguments:
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
+
         Returns:
             The PagingList of url dict, which key is the sensor name, value is the url.
 
         """
-        urls = PagingList(self._generate_urls, 128)
+        urls = PagingList(self._generate_urls, page_size)
         urls._repr_maxlevel = 2  # pylint: disable=protected-access
         return urls
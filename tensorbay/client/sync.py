@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""The plan and the mixin of synchronizing a local segment to a segment on TensorBay."""
+
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from tensorbay.client.lazy import PagingGenerator, PagingList, ReturnGenerator, map_pages
+from tensorbay.client.requests import multithread_run, multithread_upload
+from tensorbay.client.segment import SegmentClient
+from tensorbay.client.status import Status
+from tensorbay.dataset import AuthData, Data, RemoteData, Segment
+from tensorbay.utility import ReprMixin, Tqdm, config
+
+_LocalData = Union[Data, AuthData]
+
+
+def fetch_remote_checksums(
+    func: PagingGenerator[Tuple[str, Optional[str]]], *, jobs: int = 1
+) -> Dict[str, Optional[str]]:
+    """Fetch the remote paths and checksums from TensorBay in parallel.
+
+    Arguments:
+        func: The paging generator function of the remote paths and checksums.
+        jobs: The number of the pages fetched concurrently.
+
+    Returns:
+        A dict mapping the remote paths to their checksums, None for the unknown checksums.
+
+    """
+    first_page = ReturnGenerator(func(0, config.page_size))
+    checksums = dict(first_page)
+    for page in map_pages(func, list, first_page.value, jobs=jobs):
+        checksums.update(page)
+
+    return checksums
+
+
+def _split_local_data(
+    local_data: Iterable[Union[_LocalData, RemoteData]], remote_checksums: Dict[str, Optional[str]]
+) -> Tuple[List[_LocalData], List[Data], Set[str], int]:
+    uploads: List[_LocalData] = []
+    files: List[Data] = []
+    local_paths = set()
+    unchanged_count = 0
+    for data in local_data:
+        if isinstance(data, RemoteData):
+            # The remote data are kept in the remote segment without uploading.
+            local_paths.add(data.path)
+            continue
+
+        local_paths.add(data.target_remote_path)
+        if isinstance(data, Data):
+            files.append(data)
+        elif data.target_remote_path not in remote_checksums:
+            uploads.append(data)
+        else:
+            unchanged_count += 1
+
+    return uploads, files, local_paths, unchanged_count
+
+
+def _compare_files(
+    files: List[Data], remote_checksums: Dict[str, Optional[str]], jobs: int
+) -> Tuple[List[_LocalData], List[Data], List[_LocalData]]:
+    with ThreadPoolExecutor(jobs) as executor:
+        local_checksums = executor.map(lambda data: data.get_checksum(), files)
+
+    stored_checksums = set(remote_checksums.values())
+    uploads: List[_LocalData] = []
+    imports: List[Data] = []
+    updates: List[_LocalData] = []
+    for data, local_checksum in zip(files, local_checksums):
+        remote_path = data.target_remote_path
+        if remote_path in remote_checksums:
+            if local_checksum != remote_checksums[remote_path]:
+                updates.append(data)
+        elif local_checksum in stored_checksums:
+            imports.append(data)
+        else:
+            uploads.append(data)
+
+    return uploads, imports, updates
+
+
+def _import_stored_data(segment_client: SegmentClient, data: Data) -> Dict[str, Any]:
+    # The file content is already stored in the segment, only the masks and the info are uploaded.
+    segment_client._upload_mask_files(data.label)  # pylint: disable=protected-access
+    return data.get_callback_body()
+
+
+class SyncPlan(ReprMixin):
+    """This class defines the plan of synchronizing a local segment to a remote segment.
+
+    The local data are compared with the remote data by their remote paths and checksums, only
+    the new data and the data whose content is changed are uploaded.
+
+    Arguments:
+        segment_name: The name of the segment.
+        uploads: The local data whose remote paths do not exist in the remote segment.
+        imports: The local data whose remote paths do not exist in the remote segment,
+            but whose content is stored as other remote data, so the files are not uploaded.
+        updates: The local data whose checksums differ from the remote data with the same path.
+        deletes: The remote paths which do not exist in the local segment.
+        unchanged_count: The number of the local data which are not changed.
+
+    """
+
+    _repr_attrs = (
+        "segment_name",
+        "upload_count",
+        "import_count",
+        "update_count",
+        "delete_count",
+        "unchanged_count",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        segment_name: str,
+        *,
+        uploads: List[_LocalData],
+        imports: List[Data],
+        updates: List[_LocalData],
+        deletes: List[str],
+        unchanged_count: int,
+    ) -> None:
+        self.segment_name = segment_name
+        self.uploads = uploads
+        self.imports = imports
+        self.updates = updates
+        self.deletes = deletes
+        self.unchanged_count = unchanged_count
+
+    def __bool__(self) -> bool:
+        return bool(self.uploads or self.imports or self.updates or self.deletes)
+
+    @classmethod
+    def create(
+        cls,
+        segment_name: str,
+        local_data: Iterable[Union[_LocalData, RemoteData]],
+        remote_checksums: Dict[str, Optional[str]],
+        *,
+        jobs: int = 1,
+        delete: bool = False,
+    ) -> "SyncPlan":
+        """Create the plan by comparing the local data with the remote checksums.
+
+        The checksums of the local files are computed concurrently, and are read from the
+        persistent checksum index if ``config.checksum_index_path`` is set, so the unchanged files
+        are not read again in the later synchronizations.
+        The new files whose checksums exist in the remote segment are imported without uploading.
+        The :class:`~tensorbay.dataset.data.AuthData` are only compared by their remote paths.
+
+        Arguments:
+            segment_name: The name of the segment.
+            local_data: The local data to synchronize, the remote data in it are not uploaded,
+                and are not deleted from the remote segment.
+            remote_checksums: The dict mapping the remote paths to their checksums.
+            jobs: The number of the local checksums computed concurrently.
+            delete: Whether to delete the remote data which do not exist in the local segment.
+
+        Returns:
+            The created :class:`SyncPlan`.
+
+        """
+        uploads, files, local_paths, unchanged_count = _split_local_data(
+            local_data, remote_checksums
+        )
+        new_files, imports, updates = _compare_files(files, remote_checksums, jobs)
+        uploads.extend(new_files)
+        unchanged_count += len(files) - len(new_files) - len(imports) - len(updates)
+        deletes = (
+            [remote_path for remote_path in remote_checksums if remote_path not in local_paths]
+            if delete
+            else []
+        )
+        return cls(
+            segment_name,
+            uploads=uploads,
+            imports=imports,
+            updates=updates,
+            deletes=deletes,
+            unchanged_count=unchanged_count,
+        )
+
+    @property
+    def upload_count(self) -> int:
+        """Return the number of the new data to upload.
+
+        Returns:
+            The number of the new data to upload.
+
+        """
+        return len(self.uploads)
+
+    @property
+    def import_count(self) -> int:
+        """Return the number of the new data whose files are already stored.
+
+        Returns:
+            The number of the new data whose files are already stored.
+
+        """
+        return len(self.imports)
+
+    @property
+    def update_count(self) -> int:
+        """Return the number of the changed data to upload.
+
+        Returns:
+            The number of the changed data to upload.
+
+        """
+        return len(self.updates)
+
+    @property
+    def delete_count(self) -> int:
+        """Return the number of the remote data to delete.
+
+        Returns:
+            The number of the remote data to delete.
+
+        """
+        return len(self.deletes)
+
+    def get_summary(self) -> str:
+        """Get the one-line summary of the plan.
+
+        Returns:
+            The summary of the numbers of the data to upload, import, update, delete and skip.
+
+        """
+        return (
+            f'Segment "{self.segment_name}": {self.upload_count} to upload, '
+            f"{self.import_count} to import, {self.update_count} to update, "
+            f"{self.delete_count} to delete, {self.unchanged_count} unchanged"
+        )
+
+    def get_preview(self) -> str:
+        """Get the preview of the plan, which lists the remote paths of the changes.
+
+        Returns:
+            The summary of the plan followed by the changed remote paths, one per line,
+            prefixed with "+" for uploading, "I" for importing, "M" for updating and "-" for
+            deleting.
+
+        """
+        lines = [self.get_summary()]
+        lines.extend(f"+ {data.target_remote_path}" for data in self.uploads)
+        lines.extend(f"I {data.target_remote_path}" for data in self.imports)
+        lines.extend(f"M {data.target_remote_path}" for data in self.updates)
+        lines.extend(f"- {remote_path}" for remote_path in self.deletes)
+        return "\n".join(lines)
+
+
+class SyncMixin:
+    """A mixin class supporting synchronizing local segments to the segments of a dataset."""
+
+    _status: Status
+    _get_segment_client: Callable[[str], SegmentClient]
+    get_or_create_segment: Callable[[str], SegmentClient]
+    list_segment_names: Callable[[], PagingList[str]]
+
+    def get_sync_plan(self, segment: Segment, *, jobs: int = 1, delete: bool = False) -> SyncPlan:
+        """Get the plan of synchronizing the segment to the remote segment with the same name.
+
+        The remote paths and checksums of the remote segment are listed concurrently, and are
+        compared with the local data, so the modified files with the same remote paths are
+        uploaded, and the unchanged files are skipped.
+
+        Arguments:
+            segment: The :class:`~tensorbay.dataset.segment.Segment` to synchronize.
+            jobs: The number of the pages listed and the checksums computed concurrently.
+            delete: True for deleting the remote data which are not in the segment.
+
+        Returns:
+            The :class:`SyncPlan` of the synchronization.
+
+        """
+        remote_checksums: Dict[str, Optional[str]] = {}
+        if segment.name in self.list_segment_names():
+            remote_checksums = fetch_remote_checksums(
+                # pylint: disable=protected-access
+                self._get_segment_client(segment.name)._generate_data_checksums,
+                jobs=jobs,
+            )
+
+        return SyncPlan.create(segment.name, segment, remote_checksums, jobs=jobs, delete=delete)
+
+    def apply_sync_plan(
+        self, plan: SyncPlan, *, jobs: int = 1, quiet: bool = False
+    ) -> SegmentClient:
+        """Upload the new and changed data and delete the remote data in the plan.
+
+        Arguments:
+            plan: The :class:`SyncPlan` got by :meth:`SyncMixin.get_sync_plan`.
+            jobs: The number of the max workers in multi-thread uploading method.
+            quiet: Set to True to stop showing the upload process bar.
+
+        Returns:
+            The :class:`~tensorbay.client.segment.SegmentClient`
+            used for uploading the data in the segment.
+
+        """
+        self._status.check_authority_for_draft()
+        segment_client = self.get_or_create_segment(plan.segment_name)
+        total = plan.upload_count + plan.import_count + plan.update_count + plan.delete_count
+        callback = segment_client._synchronize_upload_info  # pylint: disable=protected-access
+        with Tqdm(total, disable=quiet) as pbar:
+            multithread_upload(
+                segment_client._upload_or_import_data,  # pylint: disable=protected-access
+                chain(plan.uploads, plan.updates),
+                callback=callback,
+                jobs=jobs,
+                pbar=pbar,
+            )
+            multithread_upload(
+                functools.partial(_import_stored_data, segment_client),
+                plan.imports,
+                callback=callback,
+                jobs=jobs,
+                pbar=pbar,
+            )
+            multithread_run(segment_client.delete_data, plan.deletes, jobs=jobs, pbar=pbar)
+
+        return segment_client
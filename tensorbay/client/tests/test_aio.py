@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from tensorbay.client.dataset import DatasetClient
+from tensorbay.client.gas import DEFAULT_BRANCH, GAS
+from tensorbay.client.segment import SegmentClient
+from tensorbay.client.status import Status
+from tensorbay.client.tests.utility import mock_response
+from tensorbay.dataset import Data
+from tensorbay.exception import ResponseError
+from tensorbay.utility import config
+
+aio = pytest.importorskip("tensorbay.client.aio", exc_type=ImportError)
+
+URL = "https://host/path"
+
+
+class _MockResponse:
+    def __init__(self, status=200, content=b"{}"):
+        self.method = "POST"
+        self.url = URL
+        self.status = status
+        self.reason = "REASON"
+        self.headers = {"Content-Type": "application/json"}
+        self.charset = "utf-8"
+        self.request_info = SimpleNamespace(real_url=URL, headers={"X-Token": "token"})
+        self._content = content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        pass
+
+    async def read(self):
+        return self._content
+
+
+def _mock_session(mocker, monkeypatch, *results):
+    monkeypatch.setattr(aio, "_BACKOFF_FACTOR", 0)
+    mocker.patch.object(aio.aiohttp, "TCPConnector")
+    session = mocker.Mock()
+    session.request.side_effect = results
+    mocker.patch.object(aio.aiohttp, "ClientSession", return_value=session)
+    return session
+
+
+class TestAsyncClient:
+    gas_client = GAS("Accesskey-********************************")
+
+    def test_do(self, mocker, monkeypatch):
+        session = _mock_session(
+            mocker, monkeypatch, _MockResponse(503), _MockResponse(201, b'{"key": "value"}')
+        )
+        client = aio.AsyncClient(self.gas_client._client)
+        response = asyncio.run(client.do("POST", URL, data=b"body", params={"offset": 0}))
+
+        assert session.request.call_count == 2
+        assert session.request.call_args.args == ("POST", URL)
+        assert session.request.call_args.kwargs == {"data": b"body", "params": {"offset": 0}}
+        assert response.status_code == 201
+        assert response.url == URL
+        assert response.json() == {"key": "value"}
+        assert response.request.method == "POST"
+        assert response.request.body == b"body"
+        assert response.request.headers["X-Token"] == "token"
+
+    def test_do_error(self, mocker, monkeypatch):
+        session = _mock_session(
+            mocker, monkeypatch, _MockResponse(404, b'{"message": "NOT FOUND"}')
+        )
+        with pytest.raises(ResponseError) as error:
+            asyncio.run(aio.AsyncClient(self.gas_client._client).do("POST", URL))
+        assert error.value.response.status_code == 404
+        assert session.request.call_count == 1
+
+        session = _mock_session(
+            mocker, monkeypatch, *(aio.aiohttp.ClientError() for _ in range(config.max_retries + 1))
+        )
+        with pytest.raises(aio.aiohttp.ClientError):
+            asyncio.run(aio.AsyncClient(self.gas_client._client).do("POST", URL))
+        assert session.request.call_count == config.max_retries + 1
+
+    def test_send_file(self, mocker, monkeypatch, tmp_path):
+        session = _mock_session(mocker, monkeypatch, _MockResponse(500), _MockResponse(200))
+        local_path = tmp_path / "file.bin"
+        local_path.write_bytes(b"content")
+
+        def get_body():
+            return local_path.read_bytes()
+
+        get_body = mocker.Mock(side_effect=get_body)
+        client = aio.AsyncClient(self.gas_client._client, byte_limit=4)
+        asyncio.run(client.send_file("PUT", URL, str(local_path), get_body))
+
+        assert get_body.call_count == 2
+        assert [call.kwargs["data"] for call in session.request.call_args_list] == [b"content"] * 2
+
+    def test_byte_semaphore(self):
+        async def send(byte_semaphore, size, sent):
+            reserved = await byte_semaphore.acquire(size)
+            sent.append(size)
+            await asyncio.sleep(0.01)
+            await byte_semaphore.release(reserved)
+
+        async def main():
+            byte_semaphore = aio._ByteSemaphore(10)
+            sent = []
+            start = time.monotonic()
+            await asyncio.gather(*(send(byte_semaphore, size, sent) for size in (6, 6, 20)))
+            return sent, time.monotonic() - start
+
+        sent, elapsed = asyncio.run(main())
+        assert sent == [6, 6, 20]
+        assert elapsed >= 0.03
+
+
+class TestAsyncSegmentClient:
+    gas_client = GAS("Accesskey-********************************")
+    dataset_client = DatasetClient(
+        "test_dataset",
+        "12345",
+        gas_client,
+        status=Status(DEFAULT_BRANCH, draft_number=1),
+        alias="",
+        is_public=False,
+    )
+    segment_client = aio.AsyncSegmentClient(
+        SegmentClient("test_segment", dataset_client),
+        aio.AsyncClient(gas_client._client),
+    )
+
+    @pytest.mark.parametrize("prefetch_pages", (0, 2))
+    def test_list_data_paths(self, mocker, monkeypatch, prefetch_pages):
+        monkeypatch.setattr(config, "page_size", 2)
+        monkeypatch.setattr(config, "prefetch_pages", prefetch_pages)
+        remote_paths = [f"{index}.png" for index in range(9)]
+        requesting = set()
+        max_requesting = 0
+
+        async def open_api_do(method, section, dataset_id, params):
+            nonlocal max_requesting
+            offset, limit = params["offset"], params["limit"]
+            requesting.add(offset)
+            max_requesting = max(max_requesting, len(requesting))
+            await asyncio.sleep(0.01)
+            requesting.remove(offset)
+
+            data = [{"remotePath": path} for path in remote_paths[offset : offset + limit]]
+            return mock_response(data={"data": data, "totalCount": len(remote_paths)})
+
+        async def list_data_paths():
+            return [path async for path in self.segment_client.list_data_paths()]
+
+        open_api_do = mocker.patch.object(
+            self.segment_client._client, "open_api_do", side_effect=open_api_do
+        )
+        assert asyncio.run(list_data_paths()) == remote_paths
+        assert open_api_do.call_count == 5
+        assert max_requesting == max(prefetch_pages, 1)
+
+    def test_upload_data_list(self, mocker):
+        async def upload_data(data):
+            return data.get_callback_body()
+
+        mocker.patch.object(self.segment_client, "_upload_data", side_effect=upload_data)
+        synchronize_upload_info = mocker.patch.object(
+            self.segment_client, "_synchronize_upload_info"
+        )
+
+        data_list = [Data(f"{index}.png") for index in range(120)]
+        mocker.patch.object(Data, "get_callback_body", lambda data: {"remotePath": data.path})
+        asyncio.run(self.segment_client.upload_data_list(data_list, 8))
+
+        remote_paths = []
+        for args, _ in synchronize_upload_info.call_args_list:
+            assert len(args[0]) <= 50
+            remote_paths.extend(body["remotePath"] for body in args[0])
+        assert sorted(remote_paths) == sorted(data.path for data in data_list)
+
+    def test__upload_file(self, mocker, monkeypatch, tmp_path):
+        monkeypatch.setattr(config, "uploaded_objects_path", "")
+        mocker.patch.object(
+            self.segment_client._segment_client,
+            "_get_upload_permission",
+            return_value={
+                "result": {"policy": "POLICY"},
+                "extra": {"host": URL, "objectPrefix": "prefix/", "backendType": "oss"},
+            },
+        )
+        local_path = tmp_path / "upload.bin"
+        local_path.write_bytes(b"upload")
+        send_file = mocker.patch.object(self.segment_client._client, "send_file")
+
+        asyncio.run(self.segment_client._upload_file(Data(str(local_path))))
+        (method, url, path, get_form), _ = send_file.call_args
+        assert (method, url, path) == ("POST", URL, str(local_path))
+
+        forms = [get_form(), get_form()]
+        assert forms[0] is not forms[1]
+        for form in forms:
+            fields = form._fields
+            assert [field[0]["name"] for field in fields] == ["policy", "key", "file"]
+            assert fields[-1][2].read() == b"upload"
+            fields[-1][2].close()
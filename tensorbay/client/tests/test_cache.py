@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import get_ident
+
+import pytest
+
+from tensorbay.client.cache import FileCache, MetadataCache
+from tensorbay.dataset import RemoteData
+from tensorbay.utility import URL, RemoteFileMixin
+
+COMMIT_ID = "commit-1"
+SEGMENT_NAME = "segment-1"
+DATA_DETAILS = [{"remotePath": f"data{i}.png", "label": {}} for i in range(10)]
+
+
+class TestMetadataCache:
+    def test_data_details(self, tmp_path):
+        path = str(tmp_path / "metadata.db")
+        metadata_cache = MetadataCache(path)
+        assert metadata_cache.get_data_details(COMMIT_ID, SEGMENT_NAME, 0, 5) is None
+
+        metadata_cache.put_data_details(COMMIT_ID, SEGMENT_NAME, 0, DATA_DETAILS[:5], 10)
+        assert metadata_cache.get_data_details(COMMIT_ID, SEGMENT_NAME, 0, 5) == {
+            "dataDetails": DATA_DETAILS[:5],
+            "totalCount": 10,
+        }
+        assert metadata_cache.get_data_details(COMMIT_ID, SEGMENT_NAME, 0, 6) is None
+        assert metadata_cache.get_data_details("commit-2", SEGMENT_NAME, 0, 5) is None
+        assert metadata_cache.get_data_details(COMMIT_ID, "segment-2", 0, 5) is None
+
+        metadata_cache.put_data_details(COMMIT_ID, SEGMENT_NAME, 5, DATA_DETAILS[5:], 10)
+        reopened_cache = MetadataCache(path)
+        assert reopened_cache.get_data_details(COMMIT_ID, SEGMENT_NAME, 3, 128) == {
+            "dataDetails": DATA_DETAILS[3:],
+            "totalCount": 10,
+        }
+
+
+class TestFileCache:
+    @staticmethod
+    def _get_remote_data(index, checksum):
+        return RemoteData(
+            f"data{index}.png",
+            url=URL(f"https://example.com/{checksum}?token=1", lambda: ""),
+            cache_path="commit-1/segment-1",
+        )
+
+    def test_open(self, mocker, tmp_path):
+        def _write_cache(self, cache_path):
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "wb") as fp:
+                fp.write(bytes(4))
+
+        write_cache = mocker.patch.object(
+            RemoteFileMixin, "_write_cache", autospec=True, side_effect=_write_cache
+        )
+        file_cache = FileCache(str(tmp_path / "files"), max_size=8)
+        checksums = [f"{i:040x}" for i in range(3)]
+
+        # The files with the same checksum are stored and downloaded only once.
+        for index in range(2):
+            remote_data = self._get_remote_data(index, checksums[0])
+            with file_cache.open(remote_data) as fp:
+                assert fp.read() == bytes(4)
+        assert write_cache.call_count == 1
+        assert (file_cache.hits, file_cache.misses) == (0, 2)
+
+        with file_cache.open(self._get_remote_data(0, checksums[0])):
+            pass
+        assert (file_cache.hits, file_cache.misses) == (1, 2)
+
+        with file_cache.open(self._get_remote_data(2, checksums[1])):
+            pass
+        assert file_cache.size == 8
+
+        # The least recently used file is evicted when the byte budget is exceeded.
+        with file_cache.open(self._get_remote_data(0, checksums[0])):
+            pass
+        with file_cache.open(self._get_remote_data(3, checksums[2])):
+            pass
+        assert file_cache.size == 8
+        assert not (tmp_path / "files" / "objects" / "00" / checksums[1]).exists()
+
+        reopened_cache = FileCache(str(tmp_path / "files"), max_size=8)
+        with reopened_cache.open(self._get_remote_data(1, checksums[0])):
+            pass
+        assert (reopened_cache.hits, reopened_cache.misses) == (1, 0)
+
+    def test_concurrent_open(self, mocker, tmp_path):
+        def _write_cache(self, cache_path):
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(f"{cache_path}.tmp{get_ident()}", "wb") as fp:
+                fp.write(bytes(4))
+            os.replace(f"{cache_path}.tmp{get_ident()}", cache_path)
+
+        mocker.patch.object(
+            RemoteFileMixin, "_write_cache", autospec=True, side_effect=_write_cache
+        )
+        file_caches = [FileCache(str(tmp_path / "files"), max_size=8) for _ in range(2)]
+
+        def _open(index):
+            # The files are shared by the threads and the instances, and evicted by each other.
+            file_cache = file_caches[index % 2]
+            with file_cache.open(self._get_remote_data(index, f"{index % 5:040x}")) as fp:
+                return fp.read()
+
+        with ThreadPoolExecutor(8) as executor:
+            assert set(executor.map(_open, range(200))) == {bytes(4)}
+        assert file_caches[0].size == 8
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="The lock file is locked by msvcrt")
+    def test_directory_lock(self, tmp_path):
+        import fcntl  # pylint: disable=import-outside-toplevel
+
+        file_cache = FileCache(str(tmp_path / "files"))
+        with file_cache._directory_lock.hold():
+            # The lock file is locked for the other processes.
+            with open(tmp_path / "files" / "lock", "rb") as fp:
+                with pytest.raises(BlockingIOError):
+                    fcntl.flock(fp.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        with open(tmp_path / "files" / "lock", "rb") as fp:
+            fcntl.flock(fp.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def test_policy(self, tmp_path):
+        with pytest.raises(ValueError):
+            FileCache(str(tmp_path), policy="fifo")
@@ -6,6 +6,8 @@
 import logging
 import shutil
 import tempfile
+from hashlib import sha1
+from pathlib import Path
 
 import pytest
 from ulid import ULID, from_timestamp
@@ -21,7 +23,15 @@ from tensorbay.client.statistics import Statistics
 from tensorbay.client.status import Status
 from tensorbay.client.struct import ROOT_COMMIT_ID
 from tensorbay.client.tests.utility import mock_response
-from tensorbay.dataset import Data, Frame, FusionSegment, Notes, Segment
+from tensorbay.dataset import (
+    Data,
+    Frame,
+    FusionSegment,
+    Notes,
+    RemoteData,
+    Segment,
+    StreamSegment,
+)
 from tensorbay.exception import (
     InvalidParamsError,
     NameConflictError,
@@ -29,7 +39,7 @@ from tensorbay.exception import (
     StatusError,
 )
 from tensorbay.label import Catalog
-from tensorbay.utility import file
+from tensorbay.utility import URL, RemoteFileMixin, config, file
 
 
 class TestDatasetClientBase:
@@ -192,9 +202,16 @@ class TestDatasetClientBase:
         segment = self.dataset_client.get_segment(segment_name)
         mock_list_data_details(mocker)
         segment_data = segment.list_data()
+
+        def _mock_urlopen(*args):
+            chunks = iter([bytes(1)])
+            fp = mock_response(read=lambda *args: next(chunks, b""))
+            fp.response = mock_response()
+            fp.response.headers = {}
+            return fp
+
         urlopen = mocker.patch(
-            f"{file.__name__}.RemoteFileMixin._urlopen",
-            return_value=mock_response(read=lambda *args: bytes(1)),
+            f"{file.__name__}.RemoteFileMixin._urlopen", side_effect=_mock_urlopen
         )
 
         segment_cache_path = (
@@ -221,6 +238,20 @@ class TestDatasetClientBase:
         assert local_open.call_count == segment_length * epoch
         assert urlopen.call_count == segment_length
 
+        # List the segment again using cached data details.
+        open_api_do = mocker.patch(f"{gas.__name__}.Client.open_api_do")
+        for data in segment.list_data():
+            assert data.cache_path == str(segment_cache_path / data.path)
+        open_api_do.assert_not_called()
+
+        assert self.dataset_client.file_cache is None
+        mock_get_total_size(mocker)
+        self.dataset_client.enable_cache(cache_path, max_size=1024, policy="lfu")
+        file_cache = self.dataset_client.file_cache
+        assert file_cache.path == str(cache_path / "files")
+        assert (file_cache.max_size, file_cache.policy) == (1024, "lfu")
+        assert SegmentClient(segment_name, self.dataset_client)._file_cache is file_cache
+
         self.dataset_client._status.checkout(draft_number=1)
         assert self.dataset_client.cache_enabled == False
         assert self.dataset_client._cache_path == str(dataset_cache_path)
@@ -281,7 +312,7 @@ class TestDatasetClientBase:
                 {"name": "train", "description": ""},
             ],
         }
-        mocker.patch(
+        open_api_do = mocker.patch(
             f"{gas.__name__}.Client.open_api_do",
             return_value=mock_response(data=response_data),
         )
@@ -289,6 +320,9 @@ class TestDatasetClientBase:
             segment["name"] for segment in response_data["segments"]
         ]
 
+        list(self.dataset_client.list_segment_names(page_size=64))
+        assert open_api_do.call_args.kwargs["params"]["limit"] == 64
+
     def test_get_catelog(self, mocker):
         params = self.dataset_client._status.get_status_info()
         response_data = {"catalog": {"CLASSIFICATION": {"categories": [{"name": "cat"}]}}}
@@ -390,7 +424,7 @@ class TestDatasetClient(TestDatasetClientBase):
             f"{dataset.__name__}.DatasetClient._list_segments",
             return_value=response_data,
         )
-        segment_generator = ReturnGenerator(self.dataset_client._generate_segments())
+        segment_generator = ReturnGenerator(self.dataset_client._generate_segments(offset, limit))
         assert [segment.name for segment in segment_generator] == [
             item["name"] for item in response_data["segments"]
         ]
@@ -508,16 +542,21 @@ class TestDatasetClient(TestDatasetClientBase):
         get_or_create_segment = mocker.patch(
             f"{dataset.__name__}.DatasetClient.get_or_create_segment", return_value=segment_client
         )
-        list_data_paths = mocker.patch(
-            f"{segment.__name__}.SegmentClient.list_data_paths",
-            return_value=["data1.png", "data2.png"],
+
+        def _generate_data_paths(offset, limit):
+            yield from ["data1.png", "data2.png"][offset : offset + limit]
+            return 2
+
+        generate_data_paths = mocker.patch(
+            f"{segment.__name__}.SegmentClient._generate_data_paths",
+            side_effect=_generate_data_paths,
         )
         multithread_upload = mocker.patch(f"{dataset.__name__}.multithread_upload")
 
         with Tqdm(5, disable=False) as pbar:
             self.dataset_client._upload_segment(segment_test, skip_uploaded_files=True, pbar=pbar)
             get_or_create_segment.assert_called_once_with(segment_test.name)
-            list_data_paths.assert_called_once_with()
+            generate_data_paths.assert_called_once()
             args, keywords = multithread_upload.call_args
             assert args[0] == segment_client._upload_or_import_data
             assert [item.path for item in args[1]] == ["data0.png", "data3.png", "data4.png"]
@@ -528,7 +567,7 @@ class TestDatasetClient(TestDatasetClientBase):
         with Tqdm(5, disable=False) as pbar:
             self.dataset_client._upload_segment(segment_test, skip_uploaded_files=False, pbar=pbar)
             get_or_create_segment.assert_called_with(segment_test.name)
-            list_data_paths.assert_called_with()
+            generate_data_paths.assert_called_once()
             args, keywords = multithread_upload.call_args
             assert args[0] == segment_client._upload_or_import_data
             assert [item.path for item in args[1]] == [f"data{i}.png" for i in range(5)]
@@ -621,6 +660,139 @@ class TestDatasetClient(TestDatasetClientBase):
         assert not keywords["skip_uploaded_files"]
         upload_segment.assert_called_once()
 
+    def test_upload_segment_sync(self, mocker, tmp_path, caplog):
+        self.dataset_client._status.checkout(draft_number=1)
+        segment_test = Segment(name="test1")
+        for i in (0, 1, 2, 4):
+            path = tmp_path / f"data{i}.png"
+            path.write_bytes(bytes(i % 4))
+            segment_test.append(Data(str(path)))
+
+        mocker.patch(f"{dataset.__name__}.DatasetClient.list_segment_names", return_value=["test1"])
+        mocker.patch(
+            f"{segment.__name__}.SegmentClient._list_data_details",
+            return_value={
+                "dataDetails": [
+                    {"remotePath": "data0.png", "url": f"https://a/{sha1(bytes(0)).hexdigest()}"},
+                    {"remotePath": "data1.png", "url": f"https://a/{sha1(bytes(0)).hexdigest()}"},
+                    {"remotePath": "data3.png", "url": "url", "checksum": "0" * 40},
+                ],
+                "totalCount": 3,
+            },
+        )
+        upload_or_import_data = mocker.patch(
+            f"{segment.__name__}.SegmentClient._upload_or_import_data", return_value=None
+        )
+        synchronize_upload_info = mocker.patch(
+            f"{segment.__name__}.SegmentClient._synchronize_upload_info"
+        )
+        delete_data = mocker.patch(f"{segment.__name__}.SegmentClient.delete_data")
+
+        plan = self.dataset_client.get_sync_plan(segment_test, delete=True)
+        assert [data.target_remote_path for data in plan.uploads] == ["data2.png"]
+        assert [data.target_remote_path for data in plan.imports] == ["data4.png"]
+        assert [data.target_remote_path for data in plan.updates] == ["data1.png"]
+        assert (plan.deletes, plan.unchanged_count) == (["data3.png"], 1)
+
+        self.dataset_client.upload_segment(segment_test, sync=True, quiet=True)
+        uploaded = {args[0].target_remote_path for args, _ in upload_or_import_data.call_args_list}
+        assert uploaded == {"data1.png", "data2.png"}
+        imported = [
+            body["remotePath"]
+            for args, _ in synchronize_upload_info.call_args_list
+            for body in args[0]
+            if body
+        ]
+        assert imported == ["data4.png"]
+        delete_data.assert_not_called()
+
+        self.dataset_client.apply_sync_plan(plan, quiet=True)
+        delete_data.assert_called_once_with("data3.png")
+
+        with pytest.raises(ValueError):
+            self.dataset_client.upload_segment(segment_test, delete=True)
+
+        upload_or_import_data.side_effect = ValueError
+        with pytest.raises(ValueError):
+            self.dataset_client.upload_segment(segment_test, sync=True, quiet=True)
+        assert "This upload action was interrupted." in caplog.text
+
+    def test_upload_stream_segment(self, mocker):
+        self.dataset_client._status.checkout(draft_number=1)
+        segment_test = StreamSegment(
+            "test1", (Data(f"data{i}.png") for i in range(5)), count_hint=5
+        )
+        segment_client = SegmentClient(name="test1", data_client=self.dataset_client)
+        upload_segment = mocker.patch(
+            f"{dataset.__name__}.DatasetClient._upload_segment", return_value=segment_client
+        )
+        assert self.dataset_client.upload_segment(segment_test, quiet=True).name == "test1"
+        args, keywords = upload_segment.call_args
+        assert args[0] is segment_test
+        assert keywords["pbar"].total == 5
+        assert segment_test._loaded_data is None
+
+    def test_prefetch(self, mocker, tmp_path):
+        self.dataset_client._status.checkout(draft_number=1)
+        with pytest.raises(StatusError):
+            self.dataset_client.prefetch()
+
+        self.dataset_client._status.checkout(commit_id="commit-1")
+        self.dataset_client._cache_path = str(tmp_path)
+        remote_data = [
+            RemoteData(f"data{i}.png", url=URL("url", lambda: ""), cache_path=str(tmp_path))
+            for i in range(5)
+        ]
+        (tmp_path / "data0.png").write_bytes(bytes(4))
+        generate_remote_files = mocker.patch(
+            f"{dataset.__name__}.DatasetClient._generate_remote_files",
+            side_effect=lambda segment_name: iter(remote_data),
+        )
+        write_cache = mocker.patch.object(
+            RemoteFileMixin,
+            "_write_cache",
+            autospec=True,
+            side_effect=lambda _, cache_path: Path(cache_path).write_bytes(bytes(2)),
+        )
+
+        statistics = self.dataset_client.prefetch(["test"], jobs=2, quiet=True)
+        generate_remote_files.assert_called_once_with("test")
+        assert write_cache.call_count == 4
+        assert statistics.file_count == 5
+        assert (statistics.downloaded_count, statistics.downloaded_size) == (4, 8)
+
+    def test_download(self, mocker, tmp_path):
+        remote_data = [
+            RemoteData(path, url=URL("url", lambda: ""))
+            for path in ("a/0.png", "a/b/1.png", "2.png")
+        ]
+        mocker.patch(f"{dataset.__name__}.DatasetClient.list_segment_names", return_value=["test"])
+        mocker.patch(f"{segment.__name__}.SegmentClient.list_data", return_value=remote_data)
+        mocker.patch(f"{segment.__name__}.SegmentClient.get_data", return_value=remote_data[2])
+        download = mocker.patch.object(RemoteFileMixin, "download", autospec=True, return_value=2)
+
+        statistics = self.dataset_client.download(str(tmp_path), quiet=True)
+        assert (statistics.file_count, statistics.downloaded_size) == (3, 6)
+        assert {call.args[:2] for call in download.call_args_list} == {
+            (data, str(tmp_path.joinpath("test", *data.path.split("/")))) for data in remote_data
+        }
+
+        download.reset_mock()
+        self.dataset_client.download(
+            str(tmp_path), segment_name="test", remote_path="a/", incremental=True, quiet=True
+        )
+        assert {call.args[1] for call in download.call_args_list} == {
+            str(tmp_path / "0.png"),
+            str(tmp_path / "b" / "1.png"),
+        }
+        assert all(call.kwargs == {"incremental": True} for call in download.call_args_list)
+
+        download.reset_mock()
+        self.dataset_client.download(
+            str(tmp_path / "2.png"), segment_name="test", remote_path="2.png", quiet=True
+        )
+        download.assert_called_once_with(remote_data[2], str(tmp_path / "2.png"), incremental=False)
+
     @staticmethod
     def _mock_generate_segment_diffs():
         segment_diffs = {
@@ -675,6 +847,93 @@ class TestDatasetClient(TestDatasetClientBase):
         get_basehead.assert_called_once_with(None, None)
         generate_segment_diffs.assert_called_once_with(basehead, 0, 128)
 
+    @staticmethod
+    def _mock_file_changes(mocker, tmp_path):
+        def _generate_segment_diffs(basehead, offset, limit):
+            data_diffs = [
+                DataDiff.loads(
+                    {
+                        "remotePath": remote_path,
+                        "action": action,
+                        "file": {"action": file_action},
+                        "label": {"action": ""},
+                    }
+                )
+                for remote_path, action, file_action in (
+                    ("a.png", "delete", "delete"),
+                    ("b/b.png", "modify", "modify"),
+                    ("c.png", "modify", ""),
+                )
+            ]
+            yield SegmentDiff("segment1", "modify", data_diffs)
+            yield SegmentDiff("segment2", "delete", [])
+            return 2
+
+        mocker.patch(
+            f"{dataset.__name__}.DatasetClient.get_commit",
+            return_value=mocker.Mock(commit_id="commit-1"),
+        )
+        mocker.patch(
+            f"{dataset.__name__}.DatasetClient._generate_segment_diffs",
+            side_effect=_generate_segment_diffs,
+        )
+        list_data = mocker.patch(
+            f"{segment.__name__}.SegmentClient.list_data",
+            return_value=[RemoteData(path) for path in ("a.png", "b/b.png", "c.png", "d.png")],
+        )
+        for relpath in (
+            "segment1/a.png",
+            "segment1/b/b.png",
+            "segment1/c.png",
+            "segment1/semantic_mask/c.png",
+            "segment2/d.png",
+        ):
+            path = tmp_path.joinpath(*relpath.split("/"))
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(bytes(1))
+
+        return list_data
+
+    def test_download_diff(self, mocker, tmp_path):
+        list_data = self._mock_file_changes(mocker, tmp_path)
+        download = mocker.patch.object(RemoteFileMixin, "download", autospec=True, return_value=2)
+
+        statistics = self.dataset_client.download_diff(str(tmp_path), "v1.0", quiet=True)
+        assert list_data.call_args_list == [mocker.call(page_size=1), mocker.call()]
+        assert (statistics.file_count, statistics.downloaded_size) == (1, 2)
+        (data, local_path), _ = download.call_args
+        assert (data.path, local_path) == ("b/b.png", str(tmp_path / "segment1" / "b" / "b.png"))
+        assert not (tmp_path / "segment1" / "a.png").exists()
+        assert (tmp_path / "segment1" / "c.png").exists()
+        assert not (tmp_path / "segment2").exists()
+
+        # The changed data are got by their remote paths when the segment takes more pages.
+        mocker.patch.object(config, "page_size", 2)
+        get_data = mocker.patch(
+            f"{segment.__name__}.SegmentClient.get_data", side_effect=RemoteData
+        )
+        list_data.reset_mock()
+        statistics = self.dataset_client.download_diff(str(tmp_path), "v1.0", quiet=True)
+        list_data.assert_called_once_with(page_size=1)
+        get_data.assert_called_once_with("b/b.png")
+        assert download.call_args.args[1] == str(tmp_path / "segment1" / "b" / "b.png")
+
+    def test_update_cache(self, mocker, tmp_path):
+        self._mock_file_changes(mocker, tmp_path / "commit-1")
+        prefetch = mocker.patch.object(RemoteFileMixin, "prefetch", autospec=True, return_value=2)
+        self.dataset_client._status.checkout(commit_id="commit-2")
+        mocker.patch.object(self.dataset_client, "_cache_path", "")
+        mocker.patch.object(self.dataset_client, "_file_cache", None)
+        with pytest.raises(StatusError):
+            self.dataset_client.update_cache("v1.0")
+
+        self.dataset_client._cache_path = str(tmp_path)
+        statistics = self.dataset_client.update_cache("v1.0", quiet=True)
+        assert statistics.file_count == 1
+        assert prefetch.call_args.args[0].path == "b/b.png"
+        linked_files = {path.relative_to(tmp_path) for path in tmp_path.glob("commit-2/**/*.png")}
+        assert linked_files == {Path("commit-2", "segment1", "c.png")}
+
 
 class TestFusionDatasetClient(TestDatasetClientBase):
     gas_client = GAS("Accesskey-********************************")
@@ -766,7 +1025,9 @@ class TestFusionDatasetClient(TestDatasetClientBase):
             f"{dataset.__name__}.FusionDatasetClient._list_segments",
             return_value=response_data,
         )
-        segment_generator = ReturnGenerator(self.fusion_dataset_client._generate_segments())
+        segment_generator = ReturnGenerator(
+            self.fusion_dataset_client._generate_segments(offset, limit)
+        )
         assert [segment.name for segment in segment_generator] == [
             item["name"] for item in response_data["segments"]
         ]
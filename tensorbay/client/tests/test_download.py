@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+from tensorbay.client.download import multithread_download
+from tensorbay.utility import UserSession, config
+from tensorbay.utility import requests as utility_requests
+
+
+def test_multithread_download(monkeypatch):
+    session = UserSession()
+    monkeypatch.setattr(utility_requests, "get_session", lambda: session)
+    monkeypatch.setattr(config, "download_block_jobs", 4)
+
+    statistics = multithread_download(lambda size: size, range(10), jobs=8, quiet=True)
+    assert statistics.file_count == 10
+    assert (statistics.downloaded_count, statistics.downloaded_size) == (9, 45)
+
+    adapter = session.get_adapter("https://gas.graviti.com/")
+    assert adapter._pool_maxsize == 32
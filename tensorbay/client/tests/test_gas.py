@@ -14,10 +14,16 @@ from tensorbay.client.gas import DEFAULT_BRANCH, GAS
 from tensorbay.client.status import Status
 from tensorbay.client.struct import ROOT_COMMIT_ID, Draft, User
 from tensorbay.client.tests.utility import mock_response
-from tensorbay.dataset import Dataset
+from tensorbay.dataset import Data, Dataset, ParallelDataset, Segment
 from tensorbay.exception import DatasetTypeError, ResourceNotExistError
 
 
+def _load_segment(segment_name):
+    segment = Segment(segment_name)
+    segment.extend(Data(f"{segment_name}/{i}.png") for i in range(3))
+    return segment
+
+
 class TestGAS:
     gas_client = GAS("Accesskey-********************************")
 
@@ -560,6 +566,42 @@ class TestGAS:
         list_drafts.assert_called_once_with(branch_name="dev")
         checkout.assert_called_once_with(draft_number=1)
 
+    def test_upload_parallel_dataset(self, mocker):
+        dataset = ParallelDataset("test", _load_segment, ["train", "train", "test"])
+        mocker.patch(
+            f"{gas.__name__}.GAS.get_dataset",
+            return_value=DatasetClient(
+                "test",
+                "12345",
+                self.gas_client,
+                status=Status(DEFAULT_BRANCH, commit_id=ROOT_COMMIT_ID),
+                alias="",
+                is_public=False,
+            ),
+        )
+        mocker.patch(f"{gas.__name__}.DatasetClient.list_drafts", return_value=[])
+        mocker.patch(f"{gas.__name__}.DatasetClient.create_draft")
+        mocker.patch(f"{gas.__name__}.DatasetClient.update_notes")
+        uploaded = {}
+        _upload_segment = mocker.patch(
+            f"{gas.__name__}.DatasetClient._upload_segment",
+            side_effect=lambda segment, **_: uploaded.setdefault(segment.name, list(iter(segment))),
+        )
+
+        self.gas_client.upload_dataset(dataset, quiet=True)
+        assert [call.args[0].name for call in _upload_segment.call_args_list] == ["train", "test"]
+        assert [len(data) for data in uploaded.values()] == [6, 3]
+        assert _upload_segment.call_args.kwargs["pbar"].total == 9
+        assert not hasattr(dataset, "_segments")
+
+        dataset = ParallelDataset("test", _load_segment, ["train", "test", "train"])
+        with pytest.raises(ValueError):
+            self.gas_client.upload_dataset(dataset, quiet=True)
+        assert [call.args[0].name for call in _upload_segment.call_args_list[2:]] == [
+            "train",
+            "test",
+        ]
+
     def test_delete_dataset(self, mocker):
         response_data = {"id": "123456", "type": 1, "commitId": "4"}
         open_api_do = mocker.patch(f"{gas.__name__}.Client.open_api_do")
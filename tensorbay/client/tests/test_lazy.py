@@ -3,10 +3,18 @@
 # Copyright 2021 Graviti. Licensed under MIT License.
 #
 
+import time
 
 import pytest
 
-from tensorbay.client.lazy import InitPage, LazyPage, PagingList
+from tensorbay.client.lazy import (
+    AdaptivePagingGenerator,
+    InitPage,
+    LazyPage,
+    PagingList,
+    ReturnGenerator,
+)
+from tensorbay.utility import config
 
 TOTAL_COUNT = 1000
 MIDDLE = TOTAL_COUNT // 2
@@ -109,6 +117,23 @@ class TestPagingList:
         with pytest.raises(StopIteration):
             next(iterator)
 
+    def test_iter_prefetch(self, monkeypatch):
+        monkeypatch.setattr(config, "prefetch_pages", 4)
+        paging_list = PagingList(gen, LIMIT)
+        assert list(paging_list) == LIST
+
+        paging_list = PagingList(gen, LIMIT)
+        paging_list[MIDDLE] = -1
+        target = LIST.copy()
+        target[MIDDLE] = -1
+        assert list(paging_list) == target
+
+        paging_list = PagingList(gen, LIMIT)
+        iterator = iter(paging_list)
+        for i in LIST[:MIDDLE]:
+            assert next(iterator) == i
+        iterator.close()
+
     def test_reversed(self):
         paging_list = PagingList(gen, LIMIT)
         assert list(reversed(LIST)) == list(reversed(paging_list))
@@ -271,3 +296,50 @@ class TestPagingList:
         paging_list.extend([])
         target.extend([])
         assert list(paging_list) == target
+
+
+class TestAdaptivePagingGenerator:
+    def test_call(self):
+        requests = []
+
+        def recorded_gen(offset, limit):
+            requests.append((offset, limit))
+            return gen(offset, limit)
+
+        generator = AdaptivePagingGenerator(recorded_gen, 512)
+        elements = []
+        for offset, limit in PagingList._range(TOTAL_COUNT, LIMIT):
+            return_generator = ReturnGenerator(generator(offset, limit))
+            elements.extend(return_generator)
+            assert return_generator.value == TOTAL_COUNT
+
+        assert elements == LIST
+        assert len(requests) < len(list(PagingList._range(TOTAL_COUNT, LIMIT)))
+        assert max(limit for _, limit in requests) <= 512
+
+    def test_concurrent_call(self, monkeypatch):
+        requests = []
+
+        def recorded_gen(offset, limit):
+            requests.append((offset, limit))
+            time.sleep(0.01)
+            return gen(offset, limit)
+
+        monkeypatch.setattr(config, "adaptive_paging", True)
+        monkeypatch.setattr(config, "prefetch_pages", 4)
+        paging_list = PagingList(recorded_gen, LIMIT)
+        assert list(paging_list) == LIST
+
+        # Every element is requested exactly once although the pages are pulled concurrently.
+        requested = [
+            element
+            for offset, limit in sorted(requests)
+            for element in range(offset, min(offset + limit, TOTAL_COUNT))
+        ]
+        assert requested == LIST
+
+    def test_paging_list(self, monkeypatch):
+        monkeypatch.setattr(config, "adaptive_paging", True)
+        paging_list = PagingList(gen, LIMIT)
+        assert list(paging_list) == LIST
+        assert paging_list[MIDDLE] == LIST[MIDDLE]
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+import os
+
+from tensorbay.client import remote_paths
+from tensorbay.client.remote_paths import RemotePathSet
+from tensorbay.utility import config
+
+REMOTE_PATHS = [f"{index:04d}.png" for index in range(10)]
+
+
+def _generate_remote_paths(offset, limit):
+    yield from REMOTE_PATHS[offset : offset + limit]
+    return len(REMOTE_PATHS)
+
+
+class TestRemotePathSet:
+    def test_fetch(self, mocker, monkeypatch, tmp_path):
+        monkeypatch.setattr(config, "page_size", 3)
+        func = mocker.Mock(side_effect=_generate_remote_paths)
+        path = str(tmp_path / "remote_paths.bin")
+
+        remote_path_set = RemotePathSet.fetch(func, jobs=2, path=path)
+        assert func.call_count == 4
+        assert len(remote_path_set) == len(REMOTE_PATHS)
+        assert all(remote_path in remote_path_set for remote_path in REMOTE_PATHS)
+        assert "0010.png" not in remote_path_set
+
+        func.reset_mock()
+        remote_path_set = RemotePathSet.fetch(func, jobs=2, path=path)
+        assert func.call_count == 1
+        assert "0009.png" in remote_path_set
+
+    def test_fingerprint_collision(self, monkeypatch):
+        monkeypatch.setattr(remote_paths, "fingerprint", lambda remote_path: 0)
+
+        remote_path_set = RemotePathSet.fetch(_generate_remote_paths)
+        assert len(remote_path_set) == 1
+        assert all(remote_path in remote_path_set for remote_path in REMOTE_PATHS)
+        assert "0010.png" not in remote_path_set
+        assert "0000" not in remote_path_set
+
+    def test_record(self, tmp_path):
+        path = str(tmp_path / "remote_paths.bin")
+        RemotePathSet.fetch(_generate_remote_paths, path=path).record(["0010.png", "0011.png"])
+
+        remote_path_set = RemotePathSet.load(path)
+        assert len(remote_path_set) == len(REMOTE_PATHS) + 2
+        assert "0011.png" in remote_path_set
+        assert RemotePathSet.load(str(tmp_path / "missing.bin")) is None
+
+    def test_outdated_journal(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(config, "page_size", 3)
+        path = str(tmp_path / "remote_paths.bin")
+        RemotePathSet.fetch(_generate_remote_paths, path=path)
+
+        remote_paths = ["0010.png", *REMOTE_PATHS[1:]]
+
+        def _generate_replaced_paths(offset, limit):
+            yield from remote_paths[offset : offset + limit]
+            return len(remote_paths)
+
+        remote_path_set = RemotePathSet.fetch(_generate_replaced_paths, path=path)
+        assert "0010.png" in remote_path_set
+        assert "0000.png" not in remote_path_set
+
+        remote_path_set.close()
+        RemotePathSet.invalidate(path)
+        assert RemotePathSet.load(path) is None
+        assert not os.listdir(tmp_path)
+        RemotePathSet.invalidate(path)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+import pytest
+
+from tensorbay.client import requests
+from tensorbay.client.requests import multithread_upload
+from tensorbay.utility import Tqdm, UserSession, config
+from tensorbay.utility import requests as utility_requests
+
+
+class _Counter:
+    def __init__(self):
+        self._lock = Lock()
+        self.submitted = 0
+        self.finished = 0
+        self.max_in_flight = 0
+
+    def generate(self, total):
+        for i in range(total):
+            with self._lock:
+                self.submitted += 1
+                self.max_in_flight = max(self.max_in_flight, self.submitted - self.finished)
+            yield i
+
+    def work(self, argument):
+        with self._lock:
+            self.finished += 1
+        return {"index": argument}
+
+
+def test_multithread_upload():
+    counter = _Counter()
+    callback_bodies = []
+    with Tqdm(1000, disable=True) as pbar:
+        multithread_upload(
+            counter.work,
+            counter.generate(1000),
+            callback=callback_bodies.extend,
+            jobs=4,
+            pbar=pbar,
+        )
+
+    assert counter.finished == 1000
+    assert sorted(body["index"] for body in callback_bodies) == list(range(1000))
+    assert counter.max_in_flight <= 4 * requests._PENDING_FACTOR + 1
+
+
+def test_multithread_upload_exception():
+    consumed = []
+
+    def generate():
+        for i in range(1000):
+            consumed.append(i)
+            yield i
+
+    def work(argument):
+        if argument == 10:
+            raise ValueError("test")
+
+    with Tqdm(1000, disable=True) as pbar:
+        with pytest.raises(ValueError):
+            multithread_upload(work, generate(), jobs=2, pbar=pbar)
+
+    assert len(consumed) < 1000
+
+
+def test_multithread_upload_fit_pool(monkeypatch):
+    session = UserSession()
+    monkeypatch.setattr(utility_requests, "get_session", lambda: session)
+    monkeypatch.setattr(config, "upload_block_jobs", 2)
+
+    with Tqdm(4, disable=True) as pbar:
+        multithread_upload(lambda _: None, range(4), jobs=16, pbar=pbar)
+
+    adapter = session.get_adapter("https://gas.graviti.com/")
+    assert adapter._pool_maxsize == 32
+
+    session.fit_pool(8)
+    assert session.get_adapter("https://gas.graviti.com/") is adapter
+
+
+def test_fit_pool_close_replaced_adapters(mocker):
+    session = UserSession()
+    adapter = session.get_adapter("https://gas.graviti.com/")
+    close = mocker.patch.object(adapter, "close")
+
+    session.fit_pool(config.pool_maxsize + 1)
+    assert session.get_adapter("https://gas.graviti.com/") is not adapter
+    close.assert_called_once_with()
+
+
+def test_get_session_per_thread():
+    session = utility_requests.get_session()
+    assert utility_requests.get_session() is session
+
+    with ThreadPoolExecutor(1) as executor:
+        thread_session = executor.submit(utility_requests.get_session).result()
+    assert thread_session is not session
+
+    url = "https://gas.graviti.com/"
+    assert thread_session.get_adapter(url) is session.get_adapter(url)
+    thread_session.fit_pool(session.get_adapter(url)._pool_maxsize + 1)
+    assert thread_session.get_adapter(url) is session.get_adapter(url)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+import tempfile
+import time
+
+import pytest
+
+from tensorbay.client import requests
+from tensorbay.client.dataset import DatasetClient
+from tensorbay.client.gas import DEFAULT_BRANCH, GAS
+from tensorbay.client.journal import UploadedObjects, UploadJournal
+from tensorbay.client.segment import SegmentClient
+from tensorbay.client.status import Status
+from tensorbay.client.tests.utility import mock_response
+from tensorbay.dataset import Data, Segment
+from tensorbay.label import LabeledBox2D, LabelColumnsView
+from tensorbay.utility import config
+
+URL = "https://azure.blob/prefix/checksum?token"
+
+
+class TestSegmentClientBase:
+    gas_client = GAS("Accesskey-********************************")
+    dataset_client = DatasetClient(
+        "test_dataset",
+        "12345",
+        gas_client,
+        status=Status(DEFAULT_BRANCH, draft_number=1),
+        alias="",
+        is_public=False,
+    )
+    segment_client = SegmentClient("test_segment", dataset_client)
+
+    def test__put_blocks_to_azure(self, mocker, monkeypatch, tmp_path):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        monkeypatch.setattr(config, "upload_block_size", 4)
+        local_path = tmp_path / "file.bin"
+        local_path.write_bytes(bytes(range(10)))
+
+        do = mocker.patch(f"{requests.__name__}.Client.do", return_value=mock_response())
+        self.segment_client._put_binary_file_to_azure(URL, str(local_path), {})
+
+        blocks = {}
+        for args, kwargs in do.call_args_list[:-1]:
+            assert args[0] == "PUT"
+            assert "&comp=block&blockid=" in args[1]
+            blocks[args[1]] = kwargs["data"]
+        assert b"".join(blocks[url] for url in sorted(blocks)) == bytes(range(10))
+
+        args, kwargs = do.call_args_list[-1]
+        assert args[1] == f"{URL}&comp=blocklist"
+        assert kwargs["data"].count("<Latest>") == 3
+
+        journal = UploadJournal(URL.split("?", 1)[0], 4)
+        assert 0 not in journal
+
+        journal.add(0)
+        journal.add(2)
+        do.reset_mock()
+        self.segment_client._put_binary_file_to_azure(URL, str(local_path), {})
+        assert do.call_count == 2
+        assert 0 not in UploadJournal(URL.split("?", 1)[0], 4)
+
+        do.side_effect = [mock_response()] * 3 + [OSError()]
+        with pytest.raises(OSError):
+            self.segment_client._put_binary_file_to_azure(URL, str(local_path), {})
+        assert all(index in UploadJournal(URL.split("?", 1)[0], 4) for index in range(3))
+
+        do.reset_mock(side_effect=True)
+        self.segment_client._put_binary_file_to_azure(URL, str(local_path), {})
+        assert do.call_count == 1
+        assert 0 not in UploadJournal(URL.split("?", 1)[0], 4)
+
+        journal = UploadJournal(URL.split("?", 1)[0], 4)
+        journal.add(0)
+        monkeypatch.setattr(time, "time", lambda: journal._created_at + 7 * 24 * 60 * 60)
+        assert 0 not in UploadJournal(URL.split("?", 1)[0], 4)
+
+    def test__upload_file_deduplicated(self, mocker, monkeypatch, tmp_path):
+        monkeypatch.setattr(config, "uploaded_objects_path", str(tmp_path / "objects.db"))
+        monkeypatch.setattr(
+            self.segment_client,
+            "_permission",
+            {
+                "expireAt": int(time.time()) + 3600,
+                "result": {},
+                "extra": {"host": "https://host", "objectPrefix": "prefix/", "backendType": "oss"},
+            },
+        )
+        post = mocker.patch(f"{SegmentClient.__module__}.SegmentClient._post_multipart_formdata")
+
+        for name in ("a.bin", "b.bin"):
+            local_path = tmp_path / name
+            local_path.write_bytes(b"duplicated")
+            self.segment_client._upload_file(Data(str(local_path)))
+
+        assert post.call_count == 1
+
+    def test_list_data_label_columns(self, mocker):
+        box2d = {"box2d": {"xmin": 1.0, "ymin": 2.0, "xmax": 3.0, "ymax": 4.0}, "category": "car"}
+        classification = {"category": "cat"}
+        details = [
+            {
+                "remotePath": "a.jpg",
+                "url": URL,
+                "label": {"BOX2D": [box2d], "CLASSIFICATION": classification},
+            },
+            {"remotePath": "b.jpg", "url": URL, "label": {}},
+        ]
+        mocker.patch(
+            f"{SegmentClient.__module__}.SegmentClient._list_cached_data_details",
+            return_value=({"dataDetails": details, "totalCount": 2}, False),
+        )
+        loads = mocker.spy(LabeledBox2D, "loads")
+
+        data = self.segment_client.list_data(label_columns=["box2d"])
+        assert not loads.called
+        assert isinstance(data[0].label.box2d, LabelColumnsView)
+
+        segment = Segment("test_segment")
+        segment.extend(data)
+        assert segment.get_label_columns("box2d").mask(category="car").tolist() == [True]
+        assert not loads.called
+        assert data[0].label.dumps() == {"BOX2D": [box2d], "CLASSIFICATION": classification}
+        assert not hasattr(data[1].label, "box2d")
+        assert "BOX2D" in details[0]["label"]
+
+    def test_delete_data(self, mocker):
+        open_api_do = mocker.patch(f"{GAS.__module__}.Client.open_api_do")
+        status_info = self.dataset_client.status.get_status_info()
+
+        self.segment_client.delete_data("a.jpg")
+        open_api_do.assert_called_once_with(
+            "DELETE",
+            "data",
+            "12345",
+            json={"segmentName": "test_segment", "remotePath": "a.jpg", **status_info},
+        )
+
+
+class TestUploadedObjects:
+    def test_expired(self, tmp_path):
+        for path in ("", str(tmp_path / "objects.db")):
+            uploaded_objects = UploadedObjects(path, max_age=3600)
+            uploaded_objects.add("object")
+            assert "object" in uploaded_objects
+            assert "other" not in uploaded_objects
+
+            uploaded_objects = UploadedObjects(path, max_age=-1)
+            uploaded_objects.add("object")
+            assert "object" not in uploaded_objects
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+from hashlib import sha1
+
+from tensorbay.client.sync import SyncPlan, fetch_remote_checksums
+from tensorbay.dataset import AuthData, Data, RemoteData
+from tensorbay.utility import config
+
+REMOTE_CHECKSUMS = [(f"{index:04d}.png", f"{index:040x}") for index in range(10)]
+
+
+def _generate_remote_checksums(offset, limit):
+    yield from REMOTE_CHECKSUMS[offset : offset + limit]
+    return len(REMOTE_CHECKSUMS)
+
+
+def test_fetch_remote_checksums(mocker, monkeypatch):
+    monkeypatch.setattr(config, "page_size", 3)
+    func = mocker.Mock(side_effect=_generate_remote_checksums)
+
+    assert fetch_remote_checksums(func, jobs=2) == dict(REMOTE_CHECKSUMS)
+    assert func.call_count == 4
+
+
+class TestSyncPlan:
+    def test_create(self, tmp_path):
+        local_data = []
+        for name, content in (
+            ("unchanged", b"0"),
+            ("modified", b"1"),
+            ("new", b"2"),
+            ("renamed", b"3"),
+        ):
+            path = tmp_path / f"{name}.png"
+            path.write_bytes(content)
+            local_data.append(Data(str(path)))
+        local_data.append(AuthData("auth.png"))
+        local_data.append(RemoteData("remote.png"))
+
+        remote_checksums = {
+            "unchanged.png": sha1(b"0").hexdigest(),
+            "modified.png": sha1(b"0").hexdigest(),
+            "auth.png": None,
+            "remote.png": None,
+            "deleted.png": sha1(b"3").hexdigest(),
+        }
+
+        plan = SyncPlan.create("test", local_data, remote_checksums, jobs=2)
+        assert [data.target_remote_path for data in plan.uploads] == ["new.png"]
+        assert [data.target_remote_path for data in plan.imports] == ["renamed.png"]
+        assert [data.target_remote_path for data in plan.updates] == ["modified.png"]
+        assert (plan.delete_count, plan.unchanged_count) == (0, 2)
+
+        plan = SyncPlan.create("test", local_data, remote_checksums, delete=True)
+        assert plan.deletes == ["deleted.png"]
+        assert plan.get_preview() == (
+            'Segment "test": 1 to upload, 1 to import, 1 to update, 1 to delete, 2 unchanged\n'
+            "+ new.png\n"
+            "I renamed.png\n"
+            "M modified.png\n"
+            "- deleted.png"
+        )
+
+    def test_bool(self):
+        lists = {"uploads": [], "imports": [], "updates": [], "deletes": []}
+        assert not SyncPlan("test", **lists, unchanged_count=1)
+        assert SyncPlan("test", **{**lists, "imports": [Data("renamed.png")]}, unchanged_count=0)
+        assert SyncPlan("test", **{**lists, "deletes": ["deleted.png"]}, unchanged_count=0)
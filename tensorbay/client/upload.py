@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""The mixin of uploading files to the storage backends of TensorBay."""
+
+import os
+import time
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from typing import Any, Dict, Tuple
+from urllib.parse import quote
+
+import filetype
+from requests_toolbelt import MultipartEncoder
+
+from tensorbay.client.journal import UploadJournal, get_uploaded_objects
+from tensorbay.client.requests import Client
+from tensorbay.client.status import Status
+from tensorbay.exception import ResponseError
+from tensorbay.utility import FileMixin, config, fit_connection_pool, locked
+
+
+class UploadMixin:
+    """A mixin class supporting uploading files to the storage backends of a segment."""
+
+    _EXPIRED_IN_SECOND = 240
+
+    _name: str
+    _dataset_id: str
+    _client: Client
+    _status: Status
+    _permission: Dict[str, Any]
+
+    @locked
+    def _request_upload_permission(self) -> None:
+        params: Dict[str, Any] = {"expired": self._EXPIRED_IN_SECOND, "segmentName": self._name}
+        params.update(self._status.get_status_info())
+
+        if config.is_internal:
+            params["isInternal"] = True
+
+        _permission = self._client.open_api_do(
+            "GET", "policies", self._dataset_id, params=params
+        ).json()
+
+        result = _permission["result"]
+        del result["multipleUploadLimit"]
+
+        keys = [key for key, value in result.items() if value is None]
+        for key in keys:
+            del result[key]
+
+        self._permission = _permission
+
+    def _get_upload_permission(self) -> Dict[str, Any]:
+        if int(time.time()) >= self._permission["expireAt"]:
+            self._request_upload_permission()
+
+        return deepcopy(self._permission)
+
+    def _upload_file(self, data: FileMixin) -> None:
+        """Upload the file in the data to the draft.
+
+        Arguments:
+            data: The data instance needs to be uploaded.
+
+        """
+        permission = self._get_upload_permission()
+
+        local_path = data.path
+        checksum = data.get_checksum()
+
+        # Build the form of this call only, the permission may be shared by the uploading threads.
+        post_data = dict(permission["result"], key=permission["extra"]["objectPrefix"] + checksum)
+
+        host = permission["extra"]["host"]
+        backend_type = permission["extra"]["backendType"]
+
+        def _upload() -> None:
+            if backend_type == "azure":
+                url = (
+                    f'{permission["extra"]["host"]}{permission["extra"]["objectPrefix"]}'
+                    f'{checksum}?{permission["result"]["token"]}'
+                )
+
+                self._put_binary_file_to_azure(url, local_path, post_data)
+            elif backend_type == "fps":
+                self._post_multipart_formdata(
+                    host,
+                    local_path,
+                    post_data,
+                    checksum,
+                )
+            else:
+                self._post_multipart_formdata(
+                    host,
+                    local_path,
+                    post_data,
+                )
+
+        uploaded_objects = get_uploaded_objects(config.uploaded_objects_path)
+        uploaded_objects.upload(f"{host}/{post_data['key']}", _upload)
+
+    def _post_multipart_formdata(
+        self,
+        url: str,
+        local_path: str,
+        data: Dict[str, Any],
+        filename: str = "",
+    ) -> None:
+        with open(local_path, "rb") as fp:
+            file_type = filetype.guess_mime(local_path)
+            if "x-amz-date" in data:
+                data["Content-Type"] = file_type
+
+            try:
+                data["file"] = (filename, fp, file_type)
+                self._post_formdata(url, data)
+            except ResponseError as error:
+                if b"MalformedPOSTRequest" in error.response.content:
+                    data["file"] = ("workaroundForMalformedPostRequest", fp, file_type)
+                    self._post_formdata(url, data)
+                else:
+                    raise
+
+    def _post_formdata(self, url: str, data: Dict[str, Any]) -> None:
+        multipart = MultipartEncoder(data)
+        self._client.do(
+            "POST",
+            url,
+            data=multipart,
+            headers={"Content-Type": multipart.content_type},
+        )
+
+    def _put_binary_file_to_azure(
+        self,
+        url: str,
+        local_path: str,
+        data: Dict[str, Any],
+    ) -> None:
+        if os.path.getsize(local_path) > config.upload_block_size:
+            self._put_blocks_to_azure(url, local_path)
+            return
+
+        with open(local_path, "rb") as fp:
+            file_type = filetype.guess_mime(local_path)
+            request_headers = {
+                "x-ms-blob-content-type": file_type,
+                "x-ms-blob-type": data["x-ms-blob-type"],
+            }
+            self._client.do("PUT", url, data=fp, headers=request_headers)
+
+    def _put_blocks_to_azure(self, url: str, local_path: str) -> None:
+        """Upload a large file to azure block blob by blocks.
+
+        The blocks are uploaded concurrently and recorded in :class:`UploadJournal`,
+        so the interrupted or failed uploading will skip the uploaded blocks when it is resumed.
+        The journal is removed after the block list is committed.
+
+        Arguments:
+            url: The url of the blob, including the SAS token.
+            local_path: The local path of the file.
+
+        """
+        block_size = config.upload_block_size
+        block_count = -(-os.path.getsize(local_path) // block_size)
+        block_ids = [b64encode(f"{index:08d}".encode()).decode() for index in range(block_count)]
+        journal = UploadJournal(url.split("?", 1)[0], block_size)
+
+        def _put_block(index: int) -> None:
+            if index in journal:
+                return
+
+            with open(local_path, "rb") as fp:
+                fp.seek(index * block_size)
+                block = fp.read(block_size)
+
+            block_id = quote(block_ids[index], safe="")
+            self._client.do("PUT", f"{url}&comp=block&blockid={block_id}", data=block)
+            journal.add(index)
+
+        fit_connection_pool(config.upload_block_jobs)
+        with ThreadPoolExecutor(config.upload_block_jobs) as executor:
+            for _ in executor.map(_put_block, range(block_count)):
+                pass
+
+        block_list = "".join(f"<Latest>{block_id}</Latest>" for block_id in block_ids)
+        self._client.do(
+            "PUT",
+            f"{url}&comp=blocklist",
+            data=f'<?xml version="1.0" encoding="utf-8"?><BlockList>{block_list}</BlockList>',
+            headers={"x-ms-blob-content-type": filetype.guess_mime(local_path)},
+        )
+        # The journal is kept when the uploading failed, so the next uploading of the file resumes.
+        journal.remove()
+
+    def _synchronize_import_info(self, callback_bodies: Tuple[Dict[str, Any], ...]) -> None:
+        put_data: Dict[str, Any] = {
+            "segmentName": self._name,
+            "objects": callback_bodies,
+            "deleteSource": False,
+        }
+        put_data.update(self._status.get_status_info())
+
+        self._client.open_api_do("PUT", "multi/cloud-callback", self._dataset_id, json=put_data)
+
+    def _synchronize_upload_info(
+        self,
+        callback_bodies: Tuple[Dict[str, Any], ...],
+    ) -> None:
+        put_data: Dict[str, Any] = {
+            "segmentName": self._name,
+            "objects": callback_bodies,
+        }
+        put_data.update(self._status.get_status_info())
+
+        self._client.open_api_do("PUT", "multi/callback", self._dataset_id, json=put_data)
@@ -13,6 +13,7 @@ from tensorbay.client.requests import Client
 from tensorbay.client.status import Status
 from tensorbay.client.struct import Branch, Commit, Draft, Tag
 from tensorbay.exception import ResourceNotExistError, StatusError
+from tensorbay.utility import config
 
 _KEY_TO_TITLES = {
     "segment": "Segment",
@@ -66,9 +67,18 @@ class VersionControlMixin:  # pylint: disable=too-many-public-methods
         return response.json()["commitId"]  # type: ignore[no-any-return]
 
     def _generate_drafts(
-        self, status: Optional[str], branch_name: Optional[str], offset: int = 0, limit: int = 128
+        self,
+        status: Optional[str],
+        branch_name: Optional[str],
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> Generator[Draft, None, int]:
-        params = {"offset": offset, "limit": limit, "status": status, "branchName": branch_name}
+        params = {
+            "offset": offset,
+            "limit": limit or config.page_size,
+            "status": status,
+            "branchName": branch_name,
+        }
         response = self._client.open_api_do("GET", "drafts", self._dataset_id, params=params).json()
 
         for item in response["drafts"]:
@@ -81,9 +91,13 @@ class VersionControlMixin:  # pylint: disable=too-many-public-methods
         self._client.open_api_do("PATCH", f"drafts/{number}", self._dataset_id, json=patch_data)
 
     def _generate_commits(
-        self, revision: str, offset: int = 0, limit: int = 128
+        self, revision: str, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[Commit, None, int]:
-        params: Dict[str, Any] = {"offset": offset, "limit": limit, "commit": revision}
+        params: Dict[str, Any] = {
+            "offset": offset,
+            "limit": limit or config.page_size,
+            "commit": revision,
+        }
 
         response = self._client.open_api_do(
             "GET", "commits", self._dataset_id, params=params
@@ -95,9 +109,9 @@ class VersionControlMixin:  # pylint: disable=too-many-public-methods
         return response["totalCount"]  # type: ignore[no-any-return]
 
     def _generate_branches(
-        self, name: Optional[str] = None, offset: int = 0, limit: int = 128
+        self, name: Optional[str] = None, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[Branch, None, int]:
-        params: Dict[str, Any] = {"offset": offset, "limit": limit}
+        params: Dict[str, Any] = {"offset": offset, "limit": limit or config.page_size}
         if name:
             params["name"] = name
 
@@ -111,9 +125,9 @@ class VersionControlMixin:  # pylint: disable=too-many-public-methods
         return response["totalCount"]  # type: ignore[no-any-return]
 
     def _generate_tags(
-        self, name: Optional[str] = None, offset: int = 0, limit: int = 128
+        self, name: Optional[str] = None, offset: int = 0, limit: Optional[int] = None
     ) -> Generator[Tag, None, int]:
-        params: Dict[str, Any] = {"offset": offset, "limit": limit}
+        params: Dict[str, Any] = {"offset": offset, "limit": limit or config.page_size}
         if name:
             params["name"] = name
 
@@ -256,7 +270,11 @@ class VersionControlMixin:  # pylint: disable=too-many-public-methods
         raise ResourceNotExistError(resource="draft", identification=draft_number)
 
     def list_drafts(
-        self, status: Optional[str] = "OPEN", branch_name: Optional[str] = None
+        self,
+        status: Optional[str] = "OPEN",
+        branch_name: Optional[str] = None,
+        *,
+        page_size: Optional[int] = None,
     ) -> PagingList[Draft]:
         """List all the drafts.
 
@@ -264,6 +282,8 @@ class VersionControlMixin:  # pylint: disable=too-many-public-methods
             status: The draft status which includes "OPEN", "CLOSED", "COMMITTED", "ALL" and None.
                     where None means listing open drafts.
             branch_name: The branch name.
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
 
         Returns:
             The PagingList of :class:`drafts<.Draft>`.
@@ -271,7 +291,7 @@ class VersionControlMixin:  # pylint: disable=too-many-public-methods
         """
         return PagingList(
             lambda offset, limit: self._generate_drafts(status, branch_name, offset, limit),
-            128,
+            page_size,
         )
 
     def update_draft(
@@ -353,7 +373,9 @@ class VersionControlMixin:  # pylint: disable=too-many-public-methods
 
         return commit
 
-    def list_commits(self, revision: Optional[str] = None) -> PagingList[Commit]:
+    def list_commits(
+        self, revision: Optional[str] = None, *, page_size: Optional[int] = None
+    ) -> PagingList[Commit]:
         """List the commits.
 
         Arguments:
@@ -361,6 +383,8 @@ class VersionControlMixin:  # pylint: disable=too-many-public-methods
                 the branch name, or the tag name.
                 If is given, list the commits before the given commit.
                 If is not given, list the commits before the current commit.
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
 
         Raises:
             TypeError: When the given revision is illegal.
@@ -382,7 +406,7 @@ class VersionControlMixin:  # pylint: disable=too-many-public-methods
             lambda offset, limit: self._generate_commits(
                 revision, offset, limit  # type: ignore[arg-type]
             ),
-            128,
+            page_size,
         )
 
     def create_branch(self, name: str, revision: Optional[str] = None) -> None:
@@ -435,14 +459,20 @@ class VersionControlMixin:  # pylint: disable=too-many-public-methods
 
         return branch
 
-    def list_branches(self) -> PagingList[Branch]:
+    def list_branches(self, *, page_size: Optional[int] = None) -> PagingList[Branch]:
         """List the information of branches.
 
+        Arguments:
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
+
         Returns:
             The PagingList of :class:`branches<.Branch>`.
 
         """
-        return PagingList(lambda offset, limit: self._generate_branches(None, offset, limit), 128)
+        return PagingList(
+            lambda offset, limit: self._generate_branches(None, offset, limit), page_size
+        )
 
     def delete_branch(self, name: str) -> None:
         """Delete a branch.
@@ -507,14 +537,18 @@ class VersionControlMixin:  # pylint: disable=too-many-public-methods
 
         return tag
 
-    def list_tags(self) -> PagingList[Tag]:
+    def list_tags(self, *, page_size: Optional[int] = None) -> PagingList[Tag]:
         """List the information of tags.
 
+        Arguments:
+            page_size: The page size of each paging request,
+                use ``config.page_size`` if not given.
+
         Returns:
             The PagingList of :class:`tags<.Tag>`.
 
         """
-        return PagingList(lambda offset, limit: self._generate_tags(None, offset, limit), 128)
+        return PagingList(lambda offset, limit: self._generate_tags(None, offset, limit), page_size)
 
     def delete_tag(self, name: str) -> None:
         """Delete a tag.
@@ -597,7 +631,7 @@ class JobMixin:
         self,
         status: Optional[str] = None,
         offset: int = 0,
-        limit: int = 128,
+        limit: Optional[int] = None,
     ) -> Dict[str, Any]:
         """Get a dict containing the information of :class:`Job` list.
 
@@ -611,7 +645,12 @@ class JobMixin:
             A dict containing the information of Job list.
 
         """
-        params = {"jobType": self._JOB_TYPE, "status": status, "offset": offset, "limit": limit}
+        params = {
+            "jobType": self._JOB_TYPE,
+            "status": status,
+            "offset": offset,
+            "limit": limit or config.page_size,
+        }
 
         response: Dict[str, Any] = self._client.open_api_do(
             "GET", "jobs", self._dataset_id, params=params
@@ -661,7 +700,7 @@ class SquashAndMerge(JobMixin):
         self,
         status: Optional[str] = None,
         offset: int = 0,
-        limit: int = 128,
+        limit: Optional[int] = None,
     ) -> Generator[SquashAndMergeJob, None, int]:
         response = self._list_jobs(status, offset, limit)
         for item in response["jobs"]:
@@ -772,10 +811,7 @@ class SquashAndMerge(JobMixin):
             The PagingList of SquashAndMergeJob.
 
         """
-        return PagingList(
-            lambda offset, limit: self._generate_jobs(status, offset, limit),
-            128,
-        )
+        return PagingList(lambda offset, limit: self._generate_jobs(status, offset, limit))
 
 
 class BasicSearch(JobMixin):
@@ -801,7 +837,7 @@ class BasicSearch(JobMixin):
         self,
         status: Optional[str] = None,
         offset: int = 0,
-        limit: int = 128,
+        limit: Optional[int] = None,
     ) -> Generator[BasicSearchJob, None, int]:
         response = self._list_jobs(status, offset, limit)
         for item in response["jobs"]:
@@ -906,7 +942,4 @@ class BasicSearch(JobMixin):
             The PagingList of BasicSearchJob.
 
         """
-        return PagingList(
-            lambda offset, limit: self._generate_jobs(status, offset, limit),
-            128,
-        )
+        return PagingList(lambda offset, limit: self._generate_jobs(status, offset, limit))
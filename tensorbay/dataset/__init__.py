@@ -6,9 +6,9 @@
 """Dataset related classes."""
 
 from tensorbay.dataset.data import AuthData, Data, RemoteData
-from tensorbay.dataset.dataset import Dataset, FusionDataset, Notes
+from tensorbay.dataset.dataset import Dataset, FusionDataset, Notes, ParallelDataset
 from tensorbay.dataset.frame import Frame
-from tensorbay.dataset.segment import FusionSegment, Segment
+from tensorbay.dataset.segment import FusionSegment, Segment, StreamSegment
 
 __all__ = [
     "AuthData",
@@ -18,6 +18,8 @@ __all__ = [
     "FusionDataset",
     "FusionSegment",
     "Notes",
+    "ParallelDataset",
     "RemoteData",
     "Segment",
+    "StreamSegment",
 ]
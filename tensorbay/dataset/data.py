@@ -6,11 +6,14 @@
 """The implementation of the TensorBay data."""
 
 import os
-from typing import Any, Dict, Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, TypeVar, Union
 
 from tensorbay.label import Label
 from tensorbay.utility import URL, FileMixin, RemoteFileMixin, ReprMixin
 
+if TYPE_CHECKING:
+    from tensorbay.client.cache import FileCache
+
 
 class DataBase(ReprMixin):
     """DataBase is a base class for the file and label combination.
@@ -135,6 +138,7 @@ class RemoteData(DataBase, RemoteFileMixin):
         timestamp: The timestamp for the file.
         url: The URL instance used to get and update url.
         cache_path: The path to store the cache.
+        file_cache: The :class:`~tensorbay.client.cache.FileCache` storing the file.
 
     Attributes:
         path: The file remote path.
@@ -154,6 +158,7 @@ class RemoteData(DataBase, RemoteFileMixin):
         timestamp: Optional[float] = None,
         url: Optional[URL] = None,
         cache_path: str = "",
+        file_cache: Optional["FileCache"] = None,
     ) -> None:
         DataBase.__init__(self, timestamp)
         RemoteFileMixin.__init__(
@@ -161,6 +166,7 @@ class RemoteData(DataBase, RemoteFileMixin):
             remote_path,
             url=url,
             cache_path=cache_path,
+            file_cache=file_cache,
         )
 
     @classmethod
@@ -170,7 +176,8 @@ class RemoteData(DataBase, RemoteFileMixin):
         *,
         url: Optional[URL] = None,
         cache_path: str = "",
-    ) -> _T:  # noqa: DAR101
+        file_cache: Optional["FileCache"] = None,  # noqa: DAR101
+    ) -> _T:
         """Loads a :class:`RemoteData` object from a response body.
 
         Arguments:
@@ -193,6 +200,7 @@ class RemoteData(DataBase, RemoteFileMixin):
                     }
             url: The URL instance used to get and update url.
             cache_path: The path to store the cache.
+            file_cache: The :class:`~tensorbay.client.cache.FileCache` storing the file.
 
         Returns:
             The loaded :class:`RemoteData` object.
@@ -203,6 +211,7 @@ class RemoteData(DataBase, RemoteFileMixin):
             timestamp=body.get("timestamp"),
             url=url,
             cache_path=cache_path,
+            file_cache=file_cache,
         )
         data.label._loads(body["label"])  # pylint: disable=protected-access
         return data
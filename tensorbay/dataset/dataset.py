@@ -6,11 +6,17 @@
 """The implementation of the TensorBay dataset."""
 
 import json
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    Deque,
     Dict,
     Iterable,
+    Iterator,
     KeysView,
     List,
     Optional,
@@ -40,6 +46,9 @@ if TYPE_CHECKING:
     from tensorbay.client import GAS
 
 _T = TypeVar("_T", FusionSegment, Segment)
+_A = TypeVar("_A")
+
+_PENDING_FACTOR = 2
 
 
 class Notes(AttrsMixin, ReprMixin):
@@ -237,15 +246,19 @@ class DatasetBase(Sequence[_T], NameMixin):
         self._assert_remote()
         return self._client.cache_enabled
 
-    def enable_cache(self, cache_path: str = "") -> None:
+    def enable_cache(
+        self, cache_path: str = "", *, max_size: Optional[int] = None, policy: str = "lru"
+    ) -> None:
         """Enable cache when open the remote data of the dataset.
 
         Arguments:
             cache_path: The path to store the cache.
+            max_size: The byte budget of the files in the cache, None for no limit.
+            policy: The eviction policy of the files, "lru" or "lfu".
 
         """
         self._assert_remote()
-        self._client.enable_cache(cache_path)
+        self._client.enable_cache(cache_path, max_size=max_size, policy=policy)
 
     def keys(self) -> Tuple[str, ...]:
         """Get all segment names.
@@ -325,3 +338,95 @@ class FusionDataset(DatasetBase[FusionSegment]):
         segment = FusionSegment(segment_name)
         self._get_segments().add(segment)
         return segment
+
+
+class ParallelDataset(Dataset):
+    """This class defines the dataset whose segments are loaded in worker processes.
+
+    The segments, or the shards of the segments, are loaded by calling the loader with every
+    argument in a process pool. The loaded segments can be streamed by
+    :meth:`ParallelDataset.iter_segments` without holding all of them in memory, which is used by
+    :meth:`~tensorbay.client.gas.GAS.upload_dataset` to overlap the loading and the uploading.
+
+    The segments are only loaded into the dataset when they are accessed like a
+    :class:`Dataset`, and the shards with the same segment name are merged in the order of the
+    arguments. The shards of a segment must be consecutive in the arguments to be uploaded.
+
+    Arguments:
+        name: The name of the dataset.
+        loader: The picklable function loading a segment or a shard of a segment from an argument,
+            like a module level function or a :func:`functools.partial` of it.
+        arguments: The arguments of the loader, one for each segment or shard.
+        jobs: The number of the worker processes, the segments are loaded in the calling process
+            when it is 1.
+
+    Examples:
+        >>> dataset = ParallelDataset(
+        ...     "example", functools.partial(load_city, root_path), cities, jobs=8
+        ... )
+        >>> gas.upload_dataset(dataset, jobs=8)
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        loader: Callable[[_A], Segment],
+        arguments: Iterable[_A],
+        *,
+        jobs: int = 1,
+    ) -> None:
+        super().__init__(name)
+        # The segments are loaded on the first access.
+        del self._segments
+
+        self._loader = loader
+        self._arguments = list(arguments)
+        self._jobs = jobs
+
+    @locked
+    def _init_segments(self) -> None:
+        segments: SortedNameList[Segment] = SortedNameList()
+        for shard in self.iter_segments():
+            if shard.name in segments:
+                segments[shard.name].extend(shard)
+            else:
+                segments.add(shard)
+
+        self._segments = segments
+
+    def iter_segments(self) -> Iterator[Segment]:
+        """Iterate over the segments or shards in the order of the arguments.
+
+        The segments are loaded while they are consumed, at most ``jobs * 2`` of them are loaded
+        ahead, so the memory is bounded by the size of the segments in flight. When the segments
+        have been loaded into the dataset, they are iterated directly.
+
+        Yields:
+            The loaded segments or shards.
+
+        """
+        if hasattr(self, "_segments"):
+            yield from self._segments
+            return
+
+        if self._jobs <= 1:
+            yield from map(self._loader, self._arguments)
+            return
+
+        with ProcessPoolExecutor(self._jobs) as executor:
+            iterator = iter(self._arguments)
+            pending: Deque["Future[Segment]"] = deque(
+                executor.submit(self._loader, argument)
+                for argument in islice(iterator, self._jobs * _PENDING_FACTOR)
+            )
+            try:
+                while pending:
+                    segment = pending.popleft().result()
+                    pending.extend(
+                        executor.submit(self._loader, argument) for argument in islice(iterator, 1)
+                    )
+                    yield segment
+            finally:
+                for future in pending:
+                    future.cancel()
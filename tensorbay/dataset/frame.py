@@ -6,7 +6,7 @@
 """The implementation of the TensorBay frame."""
 
 import logging
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, TypeVar
 from uuid import UUID
 
 from ulid import ULID, from_str, from_uuid
@@ -15,6 +15,9 @@ from tensorbay.client.lazy import LazyPage
 from tensorbay.dataset.data import DataBase, RemoteData
 from tensorbay.utility import URL, UserMutableMapping
 
+if TYPE_CHECKING:
+    from tensorbay.client.cache import FileCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,7 +65,8 @@ class Frame(UserMutableMapping[str, "DataBase._Type"]):
         urls: LazyPage[Dict[str, str]],
         *,
         cache_path: str = "",
-    ) -> _T:
+        file_cache: Optional["FileCache"] = None,
+    ) -> _T:  # noqa: DAR101  # https://github.com/terrencepreilly/darglint/issues/120
         """Loads a :class:`Frame` object from a response body.
 
         Arguments:
@@ -86,11 +90,12 @@ class Frame(UserMutableMapping[str, "DataBase._Type"]):
             url_index: The index of the url.
             urls: A sequence of mappings which key is the sensor name and value is the url.
             cache_path: The path to store the cache.
+            file_cache: The :class:`~tensorbay.client.cache.FileCache` storing the files.
 
         Returns:
             The loaded :class:`Frame` object.
 
-        """  # noqa: DAR101  # https://github.com/terrencepreilly/darglint/issues/120
+        """
         try:
             frame_id = from_str(body["frameId"])
         except ValueError:
@@ -111,6 +116,7 @@ class Frame(UserMutableMapping[str, "DataBase._Type"]):
                 data_contents,
                 url=url,
                 cache_path=cache_path,
+                file_cache=file_cache,
             )
         return frame
 
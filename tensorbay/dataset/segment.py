@@ -5,9 +5,22 @@
 
 """The implementation of the TensorBay segment."""
 
-from typing import TYPE_CHECKING, Any, Callable, MutableSequence, Optional, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    MutableSequence,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from tensorbay.dataset.frame import Frame
+from tensorbay.label.columnar import LabelColumns
 from tensorbay.sensor import Sensors
 from tensorbay.utility import NameMixin, ReprType, UserMutableSequence
 
@@ -44,17 +57,28 @@ class Segment(NameMixin, UserMutableSequence["DataBase._Type"]):
     Arguments:
         name: The name of the segment, whose default value is an empty string.
         client: The DatasetClient if you want to read the segment from tensorbay.
+        label_columns: The label types loaded into :class:`~tensorbay.label.columnar.LabelColumns`
+            when reading the segment from tensorbay, like ``("box2d",)``,
+            the merged columns are got by :meth:`Segment.get_label_columns`.
 
     """
 
     _repr_type = ReprType.SEQUENCE
 
-    def __init__(self, name: str = "default", client: Optional["DatasetClient"] = None) -> None:
+    def __init__(
+        self,
+        name: str = "default",
+        client: Optional["DatasetClient"] = None,
+        *,
+        label_columns: Iterable[str] = (),
+    ) -> None:
         super().__init__(name)
 
         if client:
             self._client = client.get_segment(name)
-            self._data = self._client.list_data()  # type: ignore[assignment]
+            self._data = self._client.list_data(  # type: ignore[assignment]
+                label_columns=label_columns
+            )
             self._repr_non_empty = True
         else:
             self._data = []
@@ -76,6 +100,23 @@ class Segment(NameMixin, UserMutableSequence["DataBase._Type"]):
         segment._repr_non_empty = True
         return segment
 
+    def get_label_columns(self, label_type: str = "box2d") -> LabelColumns:
+        """Get the labels of the given type of all the data in the segment as columns.
+
+        The labels loaded into :class:`~tensorbay.label.columnar.LabelColumns` page by page with
+        ``label_columns`` are merged without creating the label objects, so the labels of the
+        segment read from TensorBay can be filtered in a vectorized way by
+        :meth:`~tensorbay.label.columnar.LabelColumns.mask`.
+
+        Arguments:
+            label_type: The type of the labels, like "box2d".
+
+        Returns:
+            The :class:`~tensorbay.label.columnar.LabelColumns` of the labels of every data.
+
+        """
+        return LabelColumns.from_labels((data.label for data in self), label_type)
+
     def sort(
         self,
         *,
@@ -105,6 +146,92 @@ class Segment(NameMixin, UserMutableSequence["DataBase._Type"]):
             ) from error
 
 
+class StreamSegment(Segment):
+    """This class defines the segment whose data are generated while they are consumed.
+
+    The data are not held in memory when the segment is iterated, like by
+    :meth:`~tensorbay.client.dataset.DatasetClient.upload_segment`, so a segment with an arbitrary
+    number of data can be uploaded in constant memory. The data are only loaded into a list when
+    the segment is accessed like a :class:`Segment`, like by ``len()`` or indexing.
+
+    The data can be given by an iterable, or a function returning an iterable. An iterator can
+    only be consumed once, while the function is called again every time the segment is iterated.
+
+    To initialize a :class:`StreamSegment` from a generator function:
+
+    .. code:: python
+
+        def generate_data():
+            for path in paths:
+                yield Data(path)
+
+        segment = StreamSegment(segment_name, generate_data, count_hint=len(paths))
+
+    Arguments:
+        name: The name of the segment, whose default value is an empty string.
+        data: The iterable of the data, or the function returning it.
+        count_hint: The estimated number of the data, which is used as the total of the upload
+            process bar, None for unknown.
+
+    """
+
+    _repr_type = ReprType.INSTANCE
+    _repr_attrs = ("count_hint",)
+
+    def __init__(
+        self,
+        name: str = "default",
+        data: Union[Iterable["DataBase._Type"], Callable[[], Iterable["DataBase._Type"]]] = (),
+        *,
+        count_hint: Optional[int] = None,
+    ) -> None:
+        # Skip the initialization of the data list in Segment.
+        super(Segment, self).__init__(name)  # pylint: disable=bad-super-call
+
+        self._source = data
+        self._count_hint = count_hint
+        self._is_consumed = False
+        self._loaded_data: Optional[List["DataBase._Type"]] = None
+
+    def __iter__(self) -> Iterator["DataBase._Type"]:
+        if self._loaded_data is not None:
+            return self._loaded_data.__iter__()
+
+        if callable(self._source):
+            return iter(self._source())
+
+        if isinstance(self._source, Iterator):
+            if self._is_consumed:
+                raise ValueError(f'The data iterator of segment "{self._name}" has been consumed')
+            self._is_consumed = True
+
+        return iter(self._source)
+
+    @property  # type: ignore[override]
+    def _data(self) -> List["DataBase._Type"]:
+        if self._loaded_data is None:
+            self._loaded_data = list(iter(self))
+
+        return self._loaded_data
+
+    @_data.setter
+    def _data(self, value: List["DataBase._Type"]) -> None:
+        self._loaded_data = value
+
+    @property
+    def count_hint(self) -> Optional[int]:
+        """Return the estimated number of the data.
+
+        Returns:
+            The number of the data when they are loaded, otherwise the given count hint.
+
+        """
+        if self._loaded_data is not None:
+            return len(self._loaded_data)
+
+        return self._count_hint
+
+
 class FusionSegment(NameMixin, UserMutableSequence[Frame]):
     """This class defines the concept of fusion segment.
 
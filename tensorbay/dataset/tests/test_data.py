@@ -4,12 +4,15 @@
 #
 
 import os
+from hashlib import sha1
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
 from tensorbay.dataset.data import Data, RemoteData
-from tensorbay.utility import URL
+from tensorbay.exception import ChecksumError
+from tensorbay.utility import URL, checksum, config, file
 
 _REMOTE_DATA = {
     "remotePath": "test.json",
@@ -19,6 +22,29 @@ _REMOTE_DATA = {
 }
 url = URL("url", lambda: "url")
 
+_CONTENT = bytes(range(100))
+
+
+class _RangeSession:
+    def __init__(self, fail_start=None):
+        self.ranges = []
+        self._fail_start = fail_start
+
+    def request(self, method, url, *, headers, **kwargs):
+        self.ranges.append(headers["Range"])
+        start, _, end = headers["Range"][len("bytes=") :].partition("-")
+        start = int(start)
+        if start == self._fail_start:
+            raise ConnectionError("Interrupted")
+
+        end = int(end) if end else len(_CONTENT) - 1
+        response = Mock()
+        response.status_code = 206
+        response.headers = {"Content-Range": f"bytes {start}-{end}/{len(_CONTENT)}"}
+        chunks = iter(_CONTENT[i : min(i + 7, end + 1)] for i in range(start, end + 1, 7))
+        response.iter_content = lambda *args: chunks
+        return response
+
 
 class TestData:
     def test_init(self):
@@ -46,6 +72,22 @@ class TestData:
             "timestamp": timestamp,
         }
 
+    def test_get_checksum_with_index(self, mocker, monkeypatch, tmp_path):
+        monkeypatch.setattr(config, "checksum_index_path", str(tmp_path / "checksums.db"))
+        local_path = tmp_path / "file"
+        local_path.write_text("CONTENT")
+        compute_checksum = mocker.spy(checksum, "compute_checksum")
+
+        for _ in range(2):
+            assert (
+                Data(str(local_path)).get_checksum() == "238a131a3e8eb98d1fc5b27d882ca40b7618fd2a"
+            )
+        compute_checksum.assert_called_once()
+
+        local_path.write_text("MODIFIED")
+        assert Data(str(local_path)).get_checksum() != "238a131a3e8eb98d1fc5b27d882ca40b7618fd2a"
+        assert compute_checksum.call_count == 2
+
     def test_target_remote_path(self):
         target_remote_path = "test2.json"
         data_object = Data("test.json")
@@ -80,3 +122,63 @@ class TestRemoteData:
         assert data.timestamp == _REMOTE_DATA["timestamp"]
         assert data.url.get() == "url"
         assert data.cache_path == os.path.join("cache_path", _REMOTE_DATA["remotePath"])
+
+    def test_open_with_cache(self, mocker, monkeypatch, tmp_path):
+        monkeypatch.setattr(config, "download_block_size", 16)
+        session = _RangeSession()
+        mocker.patch(f"{file.__name__}.get_session", return_value=session)
+
+        data = RemoteData("test.bin", url=url, cache_path=str(tmp_path))
+        with data.open() as fp:
+            assert fp.read() == _CONTENT
+        assert session.ranges[0] == "bytes=0-"
+        assert sorted(session.ranges[1:]) == sorted(
+            f"bytes={start}-{min(start + 16, 100) - 1}" for start in range(0, 100, 16)
+        )
+        assert os.listdir(tmp_path) == ["test.bin"]
+
+    def test_resume_download(self, mocker, monkeypatch, tmp_path):
+        monkeypatch.setattr(config, "download_block_size", 16)
+        monkeypatch.setattr(config, "download_block_jobs", 1)
+        mocker.patch(f"{file.__name__}.get_session", return_value=_RangeSession(fail_start=0))
+        data = RemoteData("test.bin", url=url, cache_path=str(tmp_path))
+        with pytest.raises(ConnectionError):
+            data.open()
+
+        partial_path = tmp_path / "test.bin.tensorbay.downloading"
+        partial_path.write_bytes(_CONTENT[:40])
+        session = _RangeSession()
+        mocker.patch(f"{file.__name__}.get_session", return_value=session)
+        with data.open() as fp:
+            assert fp.read() == _CONTENT
+        assert session.ranges == ["bytes=40-"]
+        assert not partial_path.exists()
+
+    def test_keep_downloaded_blocks(self, mocker, monkeypatch, tmp_path):
+        monkeypatch.setattr(config, "download_block_size", 16)
+        monkeypatch.setattr(config, "download_block_jobs", 2)
+        mocker.patch(f"{file.__name__}.get_session", return_value=_RangeSession(fail_start=48))
+        data = RemoteData("test.bin", url=url, cache_path=str(tmp_path))
+        with pytest.raises(ConnectionError):
+            data.open()
+
+        partial_content = (tmp_path / "test.bin.tensorbay.downloading").read_bytes()
+        assert _CONTENT.startswith(partial_content)
+        assert len(partial_content) == 48
+
+    def test_download(self, mocker, tmp_path):
+        session = _RangeSession()
+        mocker.patch(f"{file.__name__}.get_session", return_value=session)
+        content_checksum = sha1(_CONTENT).hexdigest()
+        data = RemoteData("test.bin", url=URL(f"https://host/{content_checksum}?token", lambda: ""))
+
+        local_path = tmp_path / "a" / "test.bin"
+        assert data.download(str(local_path)) == len(_CONTENT)
+        assert local_path.read_bytes() == _CONTENT
+        assert data.download(str(local_path), incremental=True) == 0
+        assert len(session.ranges) == 1
+
+        data.url = URL(f"https://host/{'0' * 40}?token", lambda: "")
+        with pytest.raises(ChecksumError):
+            data.download(str(local_path), incremental=True)
+        assert not local_path.exists()
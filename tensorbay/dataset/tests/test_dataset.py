@@ -9,7 +9,7 @@ from typing import KeysView
 
 import pytest
 
-from tensorbay.dataset import Dataset, FusionDataset, FusionSegment, Segment
+from tensorbay.dataset import Data, Dataset, FusionDataset, FusionSegment, ParallelDataset, Segment
 from tensorbay.dataset.dataset import DatasetBase, Notes
 
 _NOTES_DATA = {
@@ -52,6 +52,13 @@ class TestNotes:
         assert notes.dumps() == _NOTES_DATA
 
 
+def _load_shard(shard):
+    segment_name, index = shard
+    segment = Segment(segment_name)
+    segment.extend(Data(f"{segment_name}/{index}/{i}.png") for i in range(3))
+    return segment
+
+
 class TestDatasetBase:
     def test_len(self):
         dataset = DatasetBase("test_name")
@@ -156,6 +163,27 @@ class TestDataset:
         assert isinstance(segment, Segment)
 
 
+class TestParallelDataset:
+    _SHARDS = [("train", 0), ("test", 0), ("train", 1)]
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_iter_segments(self, jobs):
+        dataset = ParallelDataset("test_name", _load_shard, self._SHARDS, jobs=jobs)
+        shards = list(dataset.iter_segments())
+        assert [shard.name for shard in shards] == ["train", "test", "train"]
+        assert shards[2][0].path == "train/1/0.png"
+        assert not hasattr(dataset, "_segments")
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_getitem(self, jobs):
+        dataset = ParallelDataset("test_name", _load_shard, self._SHARDS, jobs=jobs)
+        assert dataset.keys() == ("test", "train")
+        assert [data.path for data in dataset["train"]] == [
+            f"train/{index}/{i}.png" for index in range(2) for i in range(3)
+        ]
+        assert [segment.name for segment in dataset.iter_segments()] == ["test", "train"]
+
+
 class TestFusionDataset:
     def test_create_fusion_segment(self):
         dataset = FusionDataset("test_name")
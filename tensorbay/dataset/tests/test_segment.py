@@ -3,7 +3,9 @@
 # Copyright 2021 Graviti. Licensed under MIT License.
 #
 
-from tensorbay.dataset import Data, Segment
+import pytest
+
+from tensorbay.dataset import Data, Segment, StreamSegment
 
 
 class TestSegment:
@@ -16,3 +18,27 @@ class TestSegment:
 
         segment.sort(key=lambda data: data.path, reverse=True)
         assert segment[0].path == "file2"
+
+
+class TestStreamSegment:
+    def test_iter(self):
+        segment = StreamSegment("train", (Data(f"file{i}") for i in range(3)), count_hint=3)
+        assert segment.count_hint == 3
+        assert [data.path for data in segment] == ["file0", "file1", "file2"]
+        with pytest.raises(ValueError):
+            iter(segment)
+
+        segment = StreamSegment("train", lambda: (Data(f"file{i}") for i in range(3)))
+        assert segment.count_hint is None
+        assert [data.path for data in segment] == ["file0", "file1", "file2"]
+        assert [data.path for data in segment] == ["file0", "file1", "file2"]
+
+    def test_sequence(self):
+        segment = StreamSegment("train", lambda: (Data(f"file{i}") for i in range(3)))
+        assert len(segment) == 3
+        assert segment.count_hint == 3
+
+        segment.append(Data("file3"))
+        segment.sort(reverse=True)
+        assert segment[0].path == "file3"
+        assert [data.path for data in segment] == ["file3", "file2", "file1", "file0"]
@@ -81,6 +81,10 @@ class FrameError(ClientError):
     """This class defines the exception for incorrect frame id."""
 
 
+class ChecksumError(ClientError):
+    """This class defines the exception for the mismatched checksum of a downloaded file."""
+
+
 class ResponseError(ClientError):
     """This class defines the exception for post response error.
 
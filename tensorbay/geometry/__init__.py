@@ -5,7 +5,7 @@
 
 """Geometry related classes."""
 
-from tensorbay.geometry.box import Box2D, Box3D
+from tensorbay.geometry.box import Box2D, Box3D, Box3DArray
 from tensorbay.geometry.keypoint import Keypoint2D, Keypoints2D
 from tensorbay.geometry.polygon import RLE, MultiPolygon, Polygon
 from tensorbay.geometry.polyline import MultiPolyline2D, Polyline2D
@@ -15,6 +15,7 @@ from tensorbay.geometry.vector import Vector, Vector2D, Vector3D
 __all__ = [
     "Box2D",
     "Box3D",
+    "Box3DArray",
     "Keypoint2D",
     "Keypoints2D",
     "Polygon",
@@ -7,7 +7,9 @@
 
 import math
 import warnings
-from typing import Dict, Iterable, Mapping, Optional, Tuple, Type, TypeVar
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Type, TypeVar, Union
+
+import numpy as np
 
 from tensorbay.geometry.transform import Transform3D
 from tensorbay.geometry.vector import Vector2D, Vector3D
@@ -15,7 +17,7 @@ from tensorbay.utility import MatrixType, ReprMixin, ReprType, UserSequence, com
 
 with warnings.catch_warnings():
     warnings.simplefilter("ignore")
-    from quaternion import quaternion
+    from quaternion import as_float_array, as_quat_array, as_rotation_matrix, quaternion
 
 
 _B2 = TypeVar("_B2", bound="Box2D")
@@ -41,6 +43,8 @@ class Box2D(UserSequence[float]):
 
     """
 
+    __slots__ = ()
+
     _repr_type = ReprType.INSTANCE
 
     _LENGTH = 4
@@ -116,6 +120,100 @@ class Box2D(UserSequence[float]):
         union = area1 + area2 - intersect
         return intersect / union
 
+    @staticmethod
+    def iou_matrix(
+        boxes1: Union[Iterable["Box2D"], np.ndarray], boxes2: Union[Iterable["Box2D"], np.ndarray]
+    ) -> np.ndarray:
+        """Calculate the pairwise intersection over union of two groups of 2D boxes.
+
+        Arguments:
+            boxes1: N 2D boxes, or an (N, 4) array of [xmin, ymin, xmax, ymax].
+            boxes2: M 2D boxes, or an (M, 4) array of [xmin, ymin, xmax, ymax].
+
+        Returns:
+            An (N, M) array of the intersection over union between each pair of the input boxes,
+            the value is 0 for the pairs whose union is empty.
+
+        Examples:
+            >>> boxes1 = [Box2D(1, 2, 3, 4)]
+            >>> boxes2 = [Box2D(2, 2, 3, 4), Box2D(5, 5, 6, 6)]
+            >>> Box2D.iou_matrix(boxes1, boxes2)
+            array([[0.5, 0. ]])
+
+        """
+        array1 = Box2D._as_array(boxes1)
+        array2 = Box2D._as_array(boxes2)
+
+        top_left = np.maximum(array1[:, np.newaxis, :2], array2[np.newaxis, :, :2])
+        bottom_right = np.minimum(array1[:, np.newaxis, 2:], array2[np.newaxis, :, 2:])
+        intersect = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+
+        area1 = np.prod(array1[:, 2:] - array1[:, :2], axis=1)
+        area2 = np.prod(array2[:, 2:] - array2[:, :2], axis=1)
+        union = area1[:, np.newaxis] + area2[np.newaxis, :] - intersect
+
+        return np.divide(  # type: ignore[no-any-return]
+            intersect, union, out=np.zeros_like(intersect), where=union > 0
+        )
+
+    @staticmethod
+    def _as_array(boxes: Union[Iterable["Box2D"], np.ndarray]) -> np.ndarray:
+        if isinstance(boxes, np.ndarray):
+            return boxes.astype(float, copy=False).reshape(-1, Box2D._LENGTH)
+
+        return Box2D.to_array(boxes)
+
+    @staticmethod
+    def to_array(boxes: Iterable["Box2D"]) -> np.ndarray:
+        """Convert the 2D boxes to an array.
+
+        Arguments:
+            boxes: The 2D boxes to convert.
+
+        Returns:
+            An (N, 4) array of [xmin, ymin, xmax, ymax].
+
+        Examples:
+            >>> Box2D.to_array([Box2D(1, 2, 3, 4), Box2D(2, 2, 3, 4)])
+            array([[1., 2., 3., 4.],
+                   [2., 2., 3., 4.]])
+
+        """
+        # pylint: disable=protected-access
+        return np.array([box._data for box in boxes], dtype=float).reshape(-1, Box2D._LENGTH)
+
+    @classmethod
+    def from_array(cls: Type[_B2], array: np.ndarray) -> List[_B2]:
+        """Create a list of :class:`Box2D` instances from an (N, 4) array.
+
+        The instances are created without calling ``__init__`` for each box, and the invalid boxes
+        are set to zeros in a batch.
+
+        Arguments:
+            array: An (N, 4) array of [xmin, ymin, xmax, ymax].
+
+        Returns:
+            The list of the created :class:`Box2D` instances.
+
+        Examples:
+            >>> Box2D.from_array(np.array([[1, 2, 3, 4], [3, 2, 1, 4]]))
+            [Box2D(1, 2, 3, 4), Box2D(0, 0, 0, 0)]
+
+        """
+        array = np.asarray(array).reshape(-1, Box2D._LENGTH)
+        invalid = (array[:, 0] >= array[:, 2]) | (array[:, 1] >= array[:, 3])
+        if invalid.any():
+            array = array.copy()
+            array[invalid] = 0
+
+        boxes = []
+        for row in array.tolist():
+            box: _B2 = object.__new__(cls)
+            box._data = tuple(row)
+            boxes.append(box)
+
+        return boxes
+
     @classmethod
     def from_xywh(cls: Type[_B2], x: float, y: float, width: float, height: float) -> _B2:
         """Create a :class:`Box2D` instance from the top-left vertex and the width and the height.
@@ -344,6 +442,8 @@ class Box3D(ReprMixin):
 
     """
 
+    __slots__ = ("_transform", "_size")
+
     _repr_type = ReprType.INSTANCE
     _repr_attrs: Tuple[str, ...] = ("size", "translation", "rotation")
 
@@ -371,7 +471,7 @@ class Box3D(ReprMixin):
             box._size = self._size
             return box
 
-        return NotImplemented  # type: ignore[unreachable]
+        return NotImplemented
 
     @staticmethod
     def _line_intersect(length1: float, length2: float, midpoint_distance: float) -> float:
@@ -554,3 +654,181 @@ class Box3D(ReprMixin):
         contents = self._transform.dumps()
         contents["size"] = self.size.dumps()
         return contents
+
+
+class Box3DArray(ReprMixin):
+    """This class defines the array-backed batch of 3D boxes.
+
+    :class:`Box3DArray` stores the translations, rotations and sizes of N 3D boxes in arrays,
+    so the transforms, volumes and the intersection over union of the boxes are calculated
+    in batches.
+
+    Arguments:
+        translations: An (N, 3) array of the translations in [x, y, z].
+        rotations: An (N, 4) array of the rotations in [w, x, y, z].
+        sizes: An (N, 3) array of the sizes in [x, y, z].
+
+    Raises:
+        ValueError: When the numbers of the translations, rotations and sizes are not equal.
+
+    Examples:
+        >>> boxes = Box3DArray.from_boxes([Box3D([1, 2, 3]), Box3D([2, 2, 2], [1, 0, 0])])
+        >>> boxes.volumes()
+        array([6., 8.])
+
+    """
+
+    _repr_type = ReprType.INSTANCE
+    _repr_attrs = ("translations", "rotations", "sizes")
+
+    def __init__(
+        self,
+        translations: Union[Iterable[Iterable[float]], np.ndarray],
+        rotations: Union[Iterable[Iterable[float]], np.ndarray],
+        sizes: Union[Iterable[Iterable[float]], np.ndarray],
+    ) -> None:
+        self.translations = np.array(translations, dtype=float).reshape(-1, 3)
+        self.rotations = np.array(rotations, dtype=float).reshape(-1, 4)
+        self.sizes = np.array(sizes, dtype=float).reshape(-1, 3)
+
+        if not len(self.translations) == len(self.rotations) == len(self.sizes):
+            raise ValueError("The numbers of the translations, rotations and sizes must be equal.")
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def __rmul__(self, other: Union[Transform3D, quaternion]) -> "Box3DArray":
+        if isinstance(other, Transform3D):
+            rotation = other.rotation
+            translation = np.array(other.translation, dtype=float)
+        elif isinstance(other, quaternion):
+            rotation = other
+            translation = np.zeros(3)
+        else:
+            return NotImplemented
+
+        rotations = rotation * as_quat_array(self.rotations)
+        return Box3DArray(
+            self.translations @ as_rotation_matrix(rotation).T + translation,
+            as_float_array(rotations),
+            self.sizes,
+        )
+
+    @classmethod
+    def from_boxes(cls, boxes: Iterable[Box3D]) -> "Box3DArray":
+        """Create a :class:`Box3DArray` from 3D boxes, such as a list of ``LabeledBox3D``.
+
+        Arguments:
+            boxes: The 3D boxes.
+
+        Returns:
+            The created :class:`Box3DArray`.
+
+        """
+        translations, rotations, sizes = [], [], []
+        for box in boxes:
+            translations.append(box.translation)
+            rotations.append(box.rotation)
+            sizes.append(box.size)
+
+        return cls(translations, as_float_array(np.array(rotations, dtype=quaternion)), sizes)
+
+    def to_boxes(self, box_type: Type[_B3] = Box3D) -> List[_B3]:  # type: ignore[assignment]
+        """Convert the batch to a list of 3D boxes.
+
+        Arguments:
+            box_type: The type of the created 3D boxes, a subclass of :class:`Box3D`
+                such as ``LabeledBox3D`` is also supported.
+
+        Returns:
+            The list of the created 3D boxes.
+
+        Examples:
+            >>> Box3DArray([[1, 2, 3]], [[1, 0, 0, 0]], [[1, 1, 1]]).to_boxes()
+            [Box3D(
+              (size): Vector3D(1.0, 1.0, 1.0),
+              (translation): Vector3D(1.0, 2.0, 3.0),
+              (rotation): quaternion(1, 0, 0, 0)
+            )]
+
+        """
+        boxes = []
+        for translation, rotation, size in zip(
+            self.translations.tolist(), self.rotations.tolist(), self.sizes.tolist()
+        ):
+            box: _B3 = object.__new__(box_type)
+            # pylint: disable=protected-access
+            box._transform = Transform3D._create(Vector3D(*translation), quaternion(*rotation))
+            box._size = Vector3D(*size)
+            boxes.append(box)
+
+        return boxes
+
+    def volumes(self) -> np.ndarray:
+        """Return the volumes of the 3D boxes.
+
+        Returns:
+            An (N,) array of the volumes.
+
+        """
+        return np.prod(self.sizes, axis=1)  # type: ignore[no-any-return]
+
+    @staticmethod
+    def iou_matrix(
+        boxes1: Union["Box3DArray", Iterable[Box3D]],
+        boxes2: Union["Box3DArray", Iterable[Box3D]],
+        angle_threshold: float = 5,
+    ) -> np.ndarray:
+        """Calculate the pairwise intersection over union of two groups of 3D boxes.
+
+        The result of each pair is the same as :meth:`Box3D.iou`.
+
+        Arguments:
+            boxes1: N 3D boxes.
+            boxes2: M 3D boxes.
+            angle_threshold: The threshold of the relative angles
+                between two input 3d boxes in degree.
+
+        Returns:
+            An (N, M) array of the intersection over union between each pair of the input boxes.
+
+        Examples:
+            >>> boxes1 = [Box3D(size=[1, 1, 1])]
+            >>> boxes2 = [Box3D(size=[2, 2, 2]), Box3D(size=[1, 1, 1], rotation=[0, 0, 0, 1])]
+            >>> Box3DArray.iou_matrix(boxes1, boxes2)
+            array([[0.125, 0.   ]])
+
+        """
+        if not isinstance(boxes1, Box3DArray):
+            boxes1 = Box3DArray.from_boxes(boxes1)
+        if not isinstance(boxes2, Box3DArray):
+            boxes2 = Box3DArray.from_boxes(boxes2)
+
+        # Transform the boxes2 into the coordinate systems of the boxes1.
+        inverses = np.reciprocal(as_quat_array(boxes1.rotations))
+        relative_rotations = as_float_array(
+            inverses[:, np.newaxis] * as_quat_array(boxes2.rotations)[np.newaxis, :]
+        )
+        relative_translations = np.einsum(
+            "nij,nmj->nmi",
+            as_rotation_matrix(inverses),
+            boxes2.translations[np.newaxis, :, :] - boxes1.translations[:, np.newaxis, :],
+        )
+
+        angles = 2 * np.arctan2(
+            np.linalg.norm(relative_rotations[..., 1:], axis=2), relative_rotations[..., 0]
+        )
+
+        half_sizes1 = boxes1.sizes[:, np.newaxis, :] / 2
+        half_sizes2 = boxes2.sizes[np.newaxis, :, :] / 2
+        intersect_sizes = np.minimum(half_sizes1, half_sizes2 + relative_translations) - np.maximum(
+            -half_sizes1, relative_translations - half_sizes2
+        )
+        intersect = np.prod(np.clip(intersect_sizes, 0, None), axis=2)
+        union = boxes1.volumes()[:, np.newaxis] + boxes2.volumes()[np.newaxis, :] - intersect
+
+        ious: np.ndarray = np.divide(
+            intersect, union, out=np.zeros_like(intersect), where=union > 0
+        )
+        ious[np.abs(np.degrees(angles)) > angle_threshold] = 0
+        return ious
@@ -48,6 +48,8 @@ class Keypoint2D(Vector2D):
 
     """
 
+    __slots__ = ()
+
     def __init__(  # pylint: disable=super-init-not-called
         self, x: float, y: float, v: Optional[int] = None
     ) -> None:
@@ -133,6 +135,8 @@ class Keypoints2D(PointList2D[Keypoint2D]):
 
     """
 
+    __slots__ = ()
+
     _P = TypeVar("_P", bound="Keypoints2D")
 
     _ElementType = Keypoint2D
@@ -5,7 +5,23 @@
 
 """The implementation of lists of the TensorBay 2D point."""
 
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Type, TypeVar
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+import numpy as np
 
 from tensorbay.geometry.box import Box2D
 from tensorbay.geometry.vector import Vector2D
@@ -14,6 +30,108 @@ from tensorbay.utility import UserMutableSequence, common_loads
 _T = TypeVar("_T", bound=Vector2D)
 
 
+def _vector2d(x: float, y: float) -> Vector2D:
+    vector: Vector2D = object.__new__(Vector2D)
+    vector._data = (x, y)  # pylint: disable=protected-access
+    return vector
+
+
+class _PackedPoints2D(MutableSequence[Vector2D]):
+    """The mutable sequence of 2D vectors packed in a flat float64 array.
+
+    It takes 16 bytes per point, the :class:`~tensorbay.geometry.vector.Vector2D` instances are
+    only created when the points are accessed.
+
+    Arguments:
+        coordinates: The flat coordinates of the points, in the order of x0, y0, x1, y1, ...
+
+    """
+
+    __slots__ = ("_array",)
+
+    def __init__(self, coordinates: Union[Iterable[float], bytes] = ()) -> None:
+        self._array = array("d")
+        if isinstance(coordinates, bytes):
+            self._array.frombytes(coordinates)
+        else:
+            self._array.extend(coordinates)
+
+    def __len__(self) -> int:
+        return len(self._array) // 2
+
+    @overload
+    def __getitem__(self, index: int) -> Vector2D:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Vector2D]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[List[Vector2D], Vector2D]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+
+        start = range(len(self))[index] * 2
+        return _vector2d(self._array[start], self._array[start + 1])
+
+    @overload
+    def __setitem__(self, index: int, value: Vector2D) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[Vector2D]) -> None:
+        ...
+
+    def __setitem__(
+        self, index: Union[int, slice], value: Union[Vector2D, Iterable[Vector2D]]
+    ) -> None:
+        if isinstance(index, slice):
+            points = self[:]
+            points[index] = value  # type: ignore[assignment]
+            self._array = array("d", (coordinate for point in points for coordinate in point))
+            return
+
+        start = range(len(self))[index] * 2
+        self._array[start : start + 2] = array("d", value)  # type: ignore[arg-type, type-var]
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        if isinstance(index, slice):
+            points = self[:]
+            del points[index]
+            self._array = array("d", (coordinate for point in points for coordinate in point))
+            return
+
+        start = range(len(self))[index] * 2
+        del self._array[start : start + 2]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _PackedPoints2D):
+            return self._array == other._array
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return False
+
+    def insert(self, index: int, value: Vector2D) -> None:
+        """Insert the point before the index.
+
+        Arguments:
+            index: Position of the point.
+            value: The point to be inserted.
+
+        """
+        start = min(max(index + len(self) if index < 0 else index, 0), len(self)) * 2
+        self._array[start:start] = array("d", value)
+
+    def to_array(self) -> np.ndarray:
+        """Convert the points into an array.
+
+        Returns:
+            The copied coordinates array in shape (N, 2).
+
+        """
+        return np.frombuffer(self._array, dtype=np.float64).reshape(-1, 2).copy()
+
+
 class PointList2D(UserMutableSequence[_T]):
     """This class defines the concept of PointList2D.
 
@@ -24,6 +142,8 @@ class PointList2D(UserMutableSequence[_T]):
 
     """
 
+    __slots__ = ()
+
     _P = TypeVar("_P", bound="PointList2D[_T]")
 
     _ElementType: Type[_T]
@@ -71,6 +191,44 @@ class PointList2D(UserMutableSequence[_T]):
         """
         return [point.dumps() for point in self._data]
 
+    @classmethod
+    def from_array(cls: Type[_P], array_: Any) -> _P:
+        """Create a :class:`PointList2D` from an array of the coordinates of the points.
+
+        The point lists made of :class:`~tensorbay.geometry.vector.Vector2D` hold the coordinates
+        in a packed float64 array, which takes 16 bytes per point, and create the vectors only
+        when the points are accessed. So the coordinates are converted to floats.
+
+        Arguments:
+            array_: The coordinates array in shape (N, 2), or (N, 3) for the keypoints with
+                visible status.
+
+        Returns:
+            The created :class:`PointList2D` object.
+
+        """
+        obj = object.__new__(cls)
+        if cls._ElementType is Vector2D:
+            coordinates = np.ascontiguousarray(array_, dtype=np.float64).reshape(-1, 2)
+            obj._data = _PackedPoints2D(coordinates.tobytes())  # type: ignore[assignment]
+        else:
+            obj._data = [cls._ElementType(*point) for point in np.asarray(array_).tolist()]
+        return obj
+
+    def to_array(self) -> np.ndarray:
+        """Convert the coordinates of the points into an array.
+
+        Returns:
+            The coordinates array in shape (N, 2).
+
+        """
+        if isinstance(self._data, _PackedPoints2D):
+            return self._data.to_array()
+
+        return np.array([(point.x, point.y) for point in self._data], dtype=np.float64).reshape(
+            -1, 2
+        )
+
     def bounds(self) -> Box2D:
         """Calculate the bounds of point list.
 
@@ -78,6 +236,12 @@ class PointList2D(UserMutableSequence[_T]):
             The bounds of point list.
 
         """
+        if isinstance(self._data, _PackedPoints2D):
+            coordinates = self._data.to_array()
+            x_min, y_min = coordinates.min(axis=0).tolist()
+            x_max, y_max = coordinates.max(axis=0).tolist()
+            return Box2D(x_min, y_min, x_max, y_max)
+
         x_min = x_max = self._data[0].x
         y_min = y_max = self._data[0].y
 
@@ -108,6 +272,8 @@ class MultiPointList2D(UserMutableSequence[_L]):
 
     """
 
+    __slots__ = ()
+
     _P = TypeVar("_P", bound="MultiPointList2D[_L]")
 
     _ElementType: Type[_L]
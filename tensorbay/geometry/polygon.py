@@ -28,6 +28,8 @@ class Polygon(PointList2D[Vector2D]):
 
     """
 
+    __slots__ = ()
+
     _P = TypeVar("_P", bound="Polygon")
 
     _ElementType = Vector2D
@@ -98,6 +100,8 @@ class MultiPolygon(MultiPointList2D[Polygon]):
 
     """
 
+    __slots__ = ()
+
     _P = TypeVar("_P", bound="MultiPolygon")
     _ElementType = Polygon
 
@@ -166,6 +170,8 @@ class RLE(UserMutableSequence[int]):
 
     """
 
+    __slots__ = ()
+
     _data: List[int]
 
     def __init__(self, rle: Optional[Iterable[int]] = None):
@@ -38,6 +38,8 @@ class Polyline2D(PointList2D[Vector2D]):
 
     """
 
+    __slots__ = ()
+
     _P = TypeVar("_P", bound="Polyline2D")
 
     _ElementType = Vector2D
@@ -218,6 +220,8 @@ class MultiPolyline2D(MultiPointList2D[Polyline2D]):
 
     """
 
+    __slots__ = ()
+
     _P = TypeVar("_P", bound="MultiPolyline2D")
 
     _ElementType = Polyline2D
@@ -3,10 +3,11 @@
 # Copyright 2021 Graviti. Licensed under MIT License.
 #
 
+import numpy as np
 import pytest
 from quaternion import quaternion
 
-from tensorbay.geometry import Box2D, Box3D, Transform3D, Vector2D, Vector3D
+from tensorbay.geometry import Box2D, Box3D, Box3DArray, Transform3D, Vector2D, Vector3D
 from tensorbay.utility import UserSequence
 
 _DATA_2D = {"xmin": 1.0, "ymin": 2.0, "xmax": 3.0, "ymax": 4.0}
@@ -74,6 +75,25 @@ class TestBox2D:
         box2d_2 = Box2D(2, 2, 3, 4)
         assert Box2D.iou(box2d_1, box2d_2) == 0.5
 
+    def test_iou_matrix(self):
+        boxes1 = [Box2D(1, 2, 3, 4), Box2D(0, 0, 0, 0), Box2D(0, 0, 10, 10)]
+        boxes2 = [Box2D(2, 2, 3, 4), Box2D(5, 5, 6, 6)]
+        expected = [
+            [Box2D.iou(box1, box2) if box1.area() else 0 for box2 in boxes2] for box1 in boxes1
+        ]
+
+        assert np.allclose(Box2D.iou_matrix(boxes1, boxes2), expected)
+        assert np.allclose(Box2D.iou_matrix(Box2D.to_array(boxes1), boxes2), expected)
+        assert Box2D.iou_matrix([], boxes2).shape == (0, 2)
+
+    def test_array(self):
+        boxes = [Box2D(1, 2, 3, 4), Box2D(2, 2, 3, 4)]
+        array = Box2D.to_array(boxes)
+        assert array.shape == (2, 4)
+        assert Box2D.from_array(array) == boxes
+        assert Box2D.from_array(np.array([[3, 2, 1, 4]])) == [Box2D(0, 0, 0, 0)]
+        assert Box2D.to_array([]).shape == (0, 4)
+
     def test_from_xywh(self):
         assert Box2D.from_xywh(x=1, y=2, width=3, height=4) == Box2D(1, 2, 4, 6)
         assert Box2D.from_xywh(x=1, y=2, width=-1, height=2) == Box2D(0, 0, 0, 0)
@@ -141,3 +161,38 @@ class TestBox3D:
         box3d_1 = Box3D(size=[1, 1, 1])
         box3d_2 = Box3D(size=[2, 2, 2])
         assert Box3D.iou(box3d_1, box3d_2) == 0.125
+
+
+class TestBox3DArray:
+    boxes = [
+        Box3D(size=[1, 1, 1]),
+        Box3D(size=[2, 2, 2], translation=[0.5, 0, 0]),
+        Box3D(size=[1, 2, 3], translation=[1, 2, 3], rotation=[0, 1, 0, 0]),
+    ]
+
+    def test_init(self):
+        boxes = Box3DArray([[1, 2, 3]], [[1, 0, 0, 0]], [[1, 1, 1]])
+        assert len(boxes) == 1
+        assert boxes.translations.shape == (1, 3)
+        assert boxes.rotations.shape == (1, 4)
+
+        with pytest.raises(ValueError):
+            Box3DArray([[1, 2, 3]], [[1, 0, 0, 0]], [[1, 1, 1], [2, 2, 2]])
+
+    def test_boxes(self):
+        boxes = Box3DArray.from_boxes(self.boxes)
+        assert np.allclose(boxes.volumes(), [1, 8, 6])
+        assert boxes.to_boxes() == self.boxes
+
+    def test_rmul(self):
+        transform = Transform3D([1, 2, 3], [0, 1, 0, 0])
+        boxes = transform * Box3DArray.from_boxes(self.boxes)
+        assert boxes.to_boxes() == [transform * box for box in self.boxes]
+
+        rotation = quaternion(0, 0, 1, 0)
+        boxes = rotation * Box3DArray.from_boxes(self.boxes)
+        assert boxes.to_boxes() == [rotation * box for box in self.boxes]
+
+    def test_iou_matrix(self):
+        expected = [[Box3D.iou(box1, box2) for box2 in self.boxes] for box1 in self.boxes]
+        assert np.allclose(Box3DArray.iou_matrix(self.boxes, self.boxes), expected)
@@ -58,3 +58,8 @@ class TestKeypoints2D:
     def test_bounds(self):
         keypoints = Keypoints2D([[1, 2], [2, 3]])
         assert keypoints.bounds() == Box2D(1, 2, 2, 3)
+
+    def test_from_array(self):
+        keypoints = Keypoints2D.from_array(np.array([[1, 1, 1], [2, 2, 2]]))
+        assert keypoints == Keypoints2D([[1, 1, 1], [2, 2, 2]])
+        assert keypoints.to_array().tolist() == [[1, 1], [2, 2]]
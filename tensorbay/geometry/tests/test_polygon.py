@@ -47,6 +47,29 @@ class TestPolygon:
     def test_bounds(self):
         polygon = Polygon([[1, 2], [2, 4], [2, 3]])
         assert polygon.bounds() == Box2D(1, 2, 2, 4)
+        assert Polygon.from_array(polygon.to_array()).bounds() == Box2D(1, 2, 2, 4)
+
+    def test_from_array(self):
+        sequence = [[1, 2], [2, 3], [2, 2]]
+        polygon = Polygon.from_array(np.array(sequence))
+        assert not hasattr(polygon, "__dict__")
+        assert polygon == Polygon(sequence)
+        assert Polygon(sequence) == polygon
+        assert polygon.dumps() == Polygon(sequence).dumps()
+        assert polygon.area() == Polygon(sequence).area()
+        assert polygon.to_array().tolist() == sequence
+
+        polygon.append(Vector2D(3, 3))
+        polygon[0] = Vector2D(0, 0)
+        polygon.insert(-1, Vector2D(4, 4))
+        del polygon[1]
+        assert polygon == Polygon([[0, 0], [2, 2], [4, 4], [3, 3]])
+        assert polygon[-1] == Vector2D(3, 3)
+        assert polygon[1:3] == [Vector2D(2, 2), Vector2D(4, 4)]
+
+        polygon[1:3] = [Vector2D(5, 5)]
+        del polygon[:1]
+        assert polygon == Polygon([[5, 5], [3, 3]])
 
 
 class TestMultiPolygon:
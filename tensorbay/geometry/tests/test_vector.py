@@ -11,6 +11,10 @@ _DATA = [{"x": 1.0, "y": 2.0}, {"x": 1.0, "y": 2.0, "z": 3.0}]
 
 
 class TestVector:
+    def test_slots(self):
+        assert not hasattr(Vector2D(1, 2), "__dict__")
+        assert not hasattr(Vector3D(1, 2, 3), "__dict__")
+
     def test_new_class(self):
         with pytest.raises(TypeError):
             Vector([1, 2])
@@ -63,6 +63,8 @@ class Transform3D(ReprMixin):
 
     """
 
+    __slots__ = ("_translation", "_rotation")
+
     _repr_type = ReprType.INSTANCE
     _repr_attrs = ("translation", "rotation")
 
@@ -48,6 +48,8 @@ class Vector(UserSequence[float]):
 
     """
 
+    __slots__ = ()
+
     _data: Tuple[float, ...]
 
     _repr_type = ReprType.INSTANCE
@@ -211,6 +213,8 @@ class Vector2D(Vector):
 
     """
 
+    __slots__ = ()
+
     _DIMENSION = 2
 
     def __new__(  # pylint: disable=unused-argument
@@ -314,6 +318,8 @@ class Vector3D(Vector):
 
     """
 
+    __slots__ = ()
+
     _DIMENSION = 3
 
     def __new__(  # pylint: disable=unused-argument
@@ -7,6 +7,7 @@
 
 from tensorbay.label.attributes import AttributeInfo, Items
 from tensorbay.label.catalog import Catalog
+from tensorbay.label.columnar import LabelColumns, LabelColumnsView
 from tensorbay.label.label import Label
 from tensorbay.label.label_box import Box2DSubcatalog, Box3DSubcatalog, LabeledBox2D, LabeledBox3D
 from tensorbay.label.label_classification import Classification, ClassificationSubcatalog
@@ -50,6 +51,8 @@ __all__ = [
     "Keypoints2DSubcatalog",
     "KeypointsInfo",
     "Label",
+    "LabelColumns",
+    "LabelColumnsView",
     "LabeledBox2D",
     "LabeledBox3D",
     "LabeledKeypoints2D",
@@ -0,0 +1,688 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""The columnar, array-backed label store of the labels in a segment."""
+
+from itertools import chain
+from math import isnan
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+import numpy as np
+
+from tensorbay.label.basic import _LabelBase
+from tensorbay.label.label import Label
+from tensorbay.label.label_box import LabeledBox2D
+from tensorbay.label.label_keypoints import LabeledKeypoints2D
+from tensorbay.label.label_polygon import LabeledPolygon
+from tensorbay.utility import ReprMixin, ReprType, UserSequence
+
+
+class _Schema(NamedTuple):
+    label_class: Type[Union[LabeledBox2D, LabeledPolygon, LabeledKeypoints2D]]
+    key: str
+    fields: Tuple[str, ...]
+    is_sequence: bool
+
+
+_SCHEMAS = {
+    "box2d": _Schema(LabeledBox2D, "box2d", ("xmin", "ymin", "xmax", "ymax"), False),
+    "polygon": _Schema(LabeledPolygon, "polygon", ("x", "y"), True),
+    "keypoints2d": _Schema(LabeledKeypoints2D, "keypoints2d", ("x", "y", "v"), True),
+}
+
+_MISSING = -1
+
+
+def _freeze(value: Any) -> Hashable:
+    # bool, int and float with equal values share the same hash, the type is part of the key.
+    if isinstance(value, list):
+        return (list, tuple(map(_freeze, value)))
+    return (type(value), value)
+
+
+def _get_offsets(counts: Iterable[int], length: int) -> np.ndarray:
+    offsets = np.zeros(length + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(counts, np.int64, length), out=offsets[1:])
+    return offsets
+
+
+class _Interner:  # pylint: disable=too-few-public-methods
+    """Intern the values to the ids in the order they first appear."""
+
+    def __init__(self) -> None:
+        self.values: List[Any] = []
+        self._ids: Dict[Hashable, int] = {}
+
+    def intern(self, value: Any) -> int:
+        """Get the id of the given value, a new id is assigned to the unseen value.
+
+        Arguments:
+            value: The value to intern.
+
+        Returns:
+            The id of the value.
+
+        """
+        key = _freeze(value)
+        index = self._ids.get(key)
+        if index is None:
+            index = len(self.values)
+            self._ids[key] = index
+            self.values.append(value)
+        return index
+
+
+def _intern_all(values: Iterable[Any], length: int) -> Tuple[np.ndarray, List[Any]]:
+    interner = _Interner()
+    ids = np.fromiter(
+        (_MISSING if value is None else interner.intern(value) for value in values),
+        np.int32,
+        length,
+    )
+    return ids, interner.values
+
+
+def _concatenate_offsets(offsets_list: Iterable[np.ndarray]) -> np.ndarray:
+    arrays = [np.zeros(1, dtype=np.int64)]
+    base = 0
+    for offsets in offsets_list:
+        arrays.append(offsets[1:] + base)
+        base += int(offsets[-1])
+    return np.concatenate(arrays)
+
+
+def _remap_all(parts: Iterable[Tuple[np.ndarray, List[Any]]]) -> Tuple[np.ndarray, List[Any]]:
+    interner = _Interner()
+    arrays = []
+    for ids, values in parts:
+        # The missing id -1 takes the last element of the mapping, which stays missing.
+        mapping = np.fromiter(
+            chain(map(interner.intern, values), (_MISSING,)), np.int32, len(values) + 1
+        )
+        arrays.append(mapping[ids])
+    return np.concatenate(arrays), interner.values
+
+
+class LabelColumnsView(UserSequence[_LabelBase]):
+    """This class defines the lazy view of the labels of one data in :class:`LabelColumns`.
+
+    The labels are only created when they are accessed, so the view can be assigned to the
+    :class:`~tensorbay.label.label.Label` accessors without loading all the labels.
+
+    Arguments:
+        columns: The :class:`LabelColumns` the view belongs to.
+        start: The index of the first label of the data in the columns.
+        stop: The index after the last label of the data in the columns.
+
+    """
+
+    def __init__(self, columns: "LabelColumns", start: int, stop: int) -> None:
+        self._columns = columns
+        self._range = range(start, stop)
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    @overload
+    def __getitem__(self, index: int) -> _LabelBase:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[_LabelBase]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[List[_LabelBase], _LabelBase]:
+        if isinstance(index, slice):
+            return [self._columns.get_label(i) for i in self._range[index]]
+        return self._columns.get_label(self._range[index])
+
+    def __iter__(self) -> Iterator[_LabelBase]:
+        return map(self._columns.get_label, self._range)
+
+    def __reversed__(self) -> Iterator[_LabelBase]:
+        return map(self._columns.get_label, reversed(self._range))
+
+    def __contains__(self, value: Any) -> bool:
+        return any(label == value for label in self)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LabelColumnsView):
+            return list(self) == list(other)
+        return bool(list(self) == other)
+
+    @property
+    def columns(self) -> "LabelColumns":
+        """Return the columns the view belongs to.
+
+        Returns:
+            The :class:`LabelColumns` the view belongs to.
+
+        """
+        return self._columns
+
+    @property
+    def indices(self) -> range:
+        """Return the indices of the labels of the data in the columns.
+
+        Returns:
+            The indices of the labels in the columns.
+
+        """
+        return self._range
+
+
+class LabelColumns(ReprMixin):  # pylint: disable=too-many-instance-attributes
+    """This class defines the columnar, array-backed store of one type of labels in a segment.
+
+    Instead of one Python object for every label, the labels of all the data in a segment are
+    stored in a few NumPy arrays:
+
+        - ``points``: The coordinates of all the labels, one row per point.
+        - ``categories``: The interned category ids, ``-1`` for the labels without category.
+        - ``instances``: The interned instance ids, ``-1`` for the labels without instance.
+        - ``attributes``: One interned value id column per attribute name, ``-1`` for missing.
+
+    The labels of a data can be viewed lazily by :meth:`LabelColumns.__getitem__`, and the labels
+    can be filtered by category and attributes in a vectorized way by :meth:`LabelColumns.mask`.
+
+    Supported label types are "box2d", "polygon" and "keypoints2d". The coordinates are stored as
+    float64, so the integer coordinates are dumped as floats.
+
+    Arguments:
+        label_type: The type of the labels, the name of the accessor in
+            :class:`~tensorbay.label.label.Label`, like "box2d".
+
+    Raises:
+        TypeError: When the label type is not supported.
+
+    Examples:
+        >>> columns = LabelColumns.from_labels(data.label for data in segment)
+        >>> columns.mask(category="car", attributes={"occluded": False})
+        array([ True, False, ...])
+        >>> columns.bind(data.label for data in segment)
+
+    """
+
+    _T = TypeVar("_T", bound="LabelColumns")
+
+    _repr_type = ReprType.INSTANCE
+    _repr_attrs = ("label_type", "category_names", "attribute_names")
+
+    points: np.ndarray
+    point_offsets: np.ndarray
+    label_offsets: np.ndarray
+    categories: np.ndarray
+    instances: np.ndarray
+    attributes: Dict[str, np.ndarray]
+
+    def __init__(self, label_type: str = "box2d") -> None:
+        try:
+            self._schema = _SCHEMAS[label_type]
+        except KeyError:
+            raise TypeError(
+                f"Unsupported label type '{label_type}', "
+                f"supported types are: {', '.join(_SCHEMAS)}"
+            ) from None
+
+        self.label_type = label_type
+        self.points = np.empty((0, len(self._schema.fields)))
+        self.point_offsets = np.zeros(1, dtype=np.int64)
+        self.label_offsets = np.zeros(1, dtype=np.int64)
+        self.categories = np.empty(0, dtype=np.int32)
+        self.instances = np.empty(0, dtype=np.int32)
+        self.attributes = {}
+        self.category_names: List[str] = []
+        self.instance_names: List[str] = []
+        self._attribute_values: Dict[str, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.label_offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> LabelColumnsView:
+        ...
+
+    @overload
+    def __getitem__(self: _T, index: slice) -> _T:
+        ...
+
+    def __getitem__(self: _T, index: Union[int, slice]) -> Union[LabelColumnsView, _T]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("LabelColumns slice step must be 1")
+            return self._get_data_range(start, max(start, stop))
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("LabelColumns index out of range")
+
+        return LabelColumnsView(
+            self, int(self.label_offsets[index]), int(self.label_offsets[index + 1])
+        )
+
+    @property
+    def attribute_names(self) -> List[str]:
+        """Return the names of the attribute columns.
+
+        Returns:
+            The names of the attribute columns.
+
+        """
+        return list(self.attributes)
+
+    @property
+    def label_count(self) -> int:
+        """Return the number of the labels of all the data.
+
+        Returns:
+            The number of the labels.
+
+        """
+        return len(self.categories)
+
+    @property
+    def data_indices(self) -> np.ndarray:
+        """Return the index of the data which every label belongs to.
+
+        Returns:
+            The data indices array in shape (label_count,).
+
+        """
+        return np.repeat(np.arange(len(self)), np.diff(self.label_offsets))
+
+    @property
+    def nbytes(self) -> int:
+        """Return the number of bytes consumed by the arrays.
+
+        Returns:
+            The number of bytes of the arrays.
+
+        """
+        arrays = (self.points, self.point_offsets, self.label_offsets, self.categories)
+        return sum(
+            array.nbytes for array in chain(arrays, [self.instances], self.attributes.values())
+        )
+
+    def _get_data_range(self: _T, start: int, stop: int) -> _T:
+        columns = self.__class__(self.label_type)
+        label_start, label_stop = self.label_offsets[start], self.label_offsets[stop]
+        point_start, point_stop = self.point_offsets[label_start], self.point_offsets[label_stop]
+
+        columns.points = self.points[point_start:point_stop]
+        columns.point_offsets = self.point_offsets[label_start : label_stop + 1] - point_start
+        columns.label_offsets = self.label_offsets[start : stop + 1] - label_start
+
+        columns.categories = self.categories[label_start:label_stop]
+        columns.instances = self.instances[label_start:label_stop]
+        columns.attributes = {
+            name: column[label_start:label_stop] for name, column in self.attributes.items()
+        }
+        columns.category_names = self.category_names
+        columns.instance_names = self.instance_names
+        columns._attribute_values = self._attribute_values  # pylint: disable=protected-access
+        return columns
+
+    @classmethod
+    def concatenate(
+        cls: Type[_T], columns_list: Iterable["LabelColumns"], label_type: str = "box2d"
+    ) -> _T:
+        """Concatenate the columns of the consecutive data into one.
+
+        The arrays are concatenated, and the category, instance and attribute value ids of every
+        columns are mapped to the ids in the concatenated columns.
+
+        Arguments:
+            columns_list: The :class:`LabelColumns` to concatenate, in the order of the data.
+            label_type: The type of the labels.
+
+        Raises:
+            TypeError: When the label type of the columns is not the given type.
+
+        Returns:
+            The concatenated :class:`LabelColumns`.
+
+        """
+        columns = cls(label_type)
+        parts = list(columns_list)
+        for part in parts:
+            if part.label_type != label_type:
+                raise TypeError(f"Cannot concatenate '{part.label_type}' columns to '{label_type}'")
+        if not parts:
+            return columns
+
+        columns.points = np.concatenate([part.points for part in parts])
+        columns.point_offsets = _concatenate_offsets(part.point_offsets for part in parts)
+        columns.label_offsets = _concatenate_offsets(part.label_offsets for part in parts)
+        columns.categories, columns.category_names = _remap_all(
+            (part.categories, part.category_names) for part in parts
+        )
+        columns.instances, columns.instance_names = _remap_all(
+            (part.instances, part.instance_names) for part in parts
+        )
+
+        names = dict.fromkeys(chain.from_iterable(part.attributes for part in parts))
+        for name in names:
+            columns.attributes[name], columns._attribute_values[name] = _remap_all(
+                (
+                    # pylint: disable=protected-access
+                    (part.attributes[name], part._attribute_values[name])
+                    if name in part.attributes
+                    else (np.full(part.label_count, _MISSING, np.int32), [])
+                )
+                for part in parts
+            )
+
+        return columns
+
+    @classmethod
+    def _build(  # pylint: disable=too-many-locals
+        cls: Type[_T],
+        label_type: str,
+        labels_of_data: Iterable[Iterable[Any]],
+        get_points: Callable[[Any], Sequence[Any]],
+        get_coordinate: Callable[[Any, int, str], float],
+        get_field: Callable[[Any, str], Any],
+    ) -> _T:
+        columns = cls(label_type)
+        fields = columns._schema.fields
+
+        labels_list = [list(labels) for labels in labels_of_data]
+        all_labels = list(chain.from_iterable(labels_list))
+        points_list = [get_points(label) for label in all_labels]
+        all_points = list(chain.from_iterable(points_list))
+        label_count = len(all_labels)
+        point_count = len(all_points)
+
+        # The arrays are filled column by column, no intermediate object is created per point.
+        columns.points = np.empty((point_count, len(fields)), dtype=np.float64)
+        for index, field in enumerate(fields):
+            columns.points[:, index] = np.fromiter(
+                (get_coordinate(point, index, field) for point in all_points),
+                np.float64,
+                point_count,
+            )
+        columns.point_offsets = _get_offsets(map(len, points_list), label_count)
+        columns.label_offsets = _get_offsets(map(len, labels_list), len(labels_list))
+
+        columns.categories, columns.category_names = _intern_all(
+            (get_field(label, "category") for label in all_labels), label_count
+        )
+        columns.instances, columns.instance_names = _intern_all(
+            (get_field(label, "instance") for label in all_labels), label_count
+        )
+
+        attribute_interners: Dict[str, _Interner] = {}
+        for index, label in enumerate(all_labels):
+            for name, value in (get_field(label, "attributes") or {}).items():
+                column = columns.attributes.get(name)
+                if column is None:
+                    column = columns.attributes[name] = np.full(label_count, _MISSING, np.int32)
+                    attribute_interners[name] = _Interner()
+                column[index] = attribute_interners[name].intern(value)
+
+        for name, interner in attribute_interners.items():
+            columns._attribute_values[name] = interner.values
+
+        return columns
+
+    @classmethod
+    def from_contents(
+        cls: Type[_T], contents: Iterable[Sequence[Mapping[str, Any]]], label_type: str = "box2d"
+    ) -> _T:
+        """Build the columns from the dumped labels of every data.
+
+        The arrays are filled from the dumped contents directly, so no label object is created.
+        It is used by :meth:`~tensorbay.client.segment.SegmentClient.list_data` to load the labels
+        from the response of TensorBay.
+
+        Arguments:
+            contents: The dumped labels list of every data, like the ``"BOX2D"`` value of the
+                dumped :class:`~tensorbay.label.label.Label`.
+            label_type: The type of the labels.
+
+        Returns:
+            The built :class:`LabelColumns`.
+
+        """
+        schema = cls(label_type)._schema
+        key = schema.key
+        return cls._build(
+            label_type,
+            contents,
+            (lambda label: label[key]) if schema.is_sequence else (lambda label: (label[key],)),
+            lambda point, _, field: point.get(field, np.nan),
+            lambda label, name: label.get(name),
+        )
+
+    @classmethod
+    def from_labels(cls: Type[_T], labels: Iterable[Label], label_type: str = "box2d") -> _T:
+        """Build the columns from the labels of every data.
+
+        The coordinates are read from the label objects directly without dumping them, and the
+        labels bound by :meth:`LabelColumns.bind` are copied from their columns by the ranges of
+        the consecutive data, so the label objects are not created for them. To load the labels
+        from TensorBay without creating the label objects, use :meth:`LabelColumns.from_contents`
+        instead.
+
+        Arguments:
+            labels: The :class:`~tensorbay.label.label.Label` of every data.
+            label_type: The type of the labels.
+
+        Returns:
+            The built :class:`LabelColumns`.
+
+        """
+        parts: List[LabelColumns] = []
+        unbound: List[Label] = []
+        bound_columns: Optional[LabelColumns] = None
+        start = stop = 0
+        for label in labels:
+            view = getattr(label, label_type, None)
+            if not isinstance(view, LabelColumnsView) or not view:
+                unbound.append(label)
+                continue
+
+            columns = view.columns
+            index = int(np.searchsorted(columns.label_offsets, view.indices.start, "right")) - 1
+            if (
+                columns is bound_columns
+                and stop + len(unbound) == index
+                and columns.label_offsets[stop] == columns.label_offsets[index]
+                and not any(getattr(item, label_type, None) for item in unbound)
+            ):
+                # The data between are the data without labels in the same columns.
+                unbound.clear()
+            else:
+                if bound_columns is not None:
+                    parts.append(bound_columns[start:stop])
+                if unbound:
+                    parts.append(cls._from_label_objects(unbound, label_type))
+                    unbound = []
+                bound_columns, start = columns, index
+            stop = index + 1
+
+        if bound_columns is None:
+            return cls._from_label_objects(unbound, label_type)
+
+        parts.append(bound_columns[start:stop])
+        if unbound:
+            parts.append(cls._from_label_objects(unbound, label_type))
+        return cls.concatenate(parts, label_type)
+
+    @classmethod
+    def _from_label_objects(cls: Type[_T], labels: Iterable[Label], label_type: str) -> _T:
+        is_sequence = cls(label_type)._schema.is_sequence
+        return cls._build(
+            label_type,
+            (getattr(label, label_type, None) or () for label in labels),
+            (lambda label: label) if is_sequence else (lambda label: (label,)),
+            lambda point, index, _: point[index] if index < len(point) else np.nan,
+            lambda label, name: getattr(label, name, None),
+        )
+
+    def get_label(self, index: int) -> _LabelBase:
+        """Create the label object of the given index in the columns.
+
+        Arguments:
+            index: The index of the label in the columns.
+
+        Returns:
+            The created label object.
+
+        """
+        schema = self._schema
+        rows = self.points[self.point_offsets[index] : self.point_offsets[index + 1]].tolist()
+        points = [
+            {field: value for field, value in zip(schema.fields, row) if not isnan(value)}
+            for row in rows
+        ]
+        if "v" in schema.fields:
+            for point in points:
+                if "v" in point:
+                    point["v"] = int(point["v"])
+
+        contents: Dict[str, Any] = {schema.key: points if schema.is_sequence else points[0]}
+        category = self.categories[index]
+        if category != _MISSING:
+            contents["category"] = self.category_names[category]
+        instance = self.instances[index]
+        if instance != _MISSING:
+            contents["instance"] = self.instance_names[instance]
+
+        attributes = {}
+        for name, column in self.attributes.items():
+            value = column[index]
+            if value != _MISSING:
+                attributes[name] = self._attribute_values[name][value]
+        if attributes:
+            contents["attributes"] = attributes
+
+        return schema.label_class.loads(contents)
+
+    def mask(
+        self,
+        category: Union[None, str, Iterable[str]] = None,
+        attributes: Optional[Mapping[str, Any]] = None,
+    ) -> np.ndarray:
+        """Get the mask of the labels matching the given category and attributes.
+
+        Arguments:
+            category: The category or the categories to match, None for any category.
+            attributes: The attribute names and values to match, the labels must match all of them.
+
+        Returns:
+            The boolean mask array in shape (label_count,).
+
+        """
+        mask = np.ones(self.label_count, dtype=bool)
+        if category is not None:
+            names = {category} if isinstance(category, str) else set(category)
+            ids = [index for index, name in enumerate(self.category_names) if name in names]
+            mask &= np.isin(self.categories, ids)
+
+        for name, value in (attributes or {}).items():
+            column = self.attributes.get(name)
+            if column is None:
+                mask[:] = False
+                break
+
+            key = _freeze(value)
+            ids = [
+                index
+                for index, item in enumerate(self._attribute_values[name])
+                if _freeze(item) == key
+            ]
+            mask &= np.isin(column, ids)
+
+        return mask
+
+    def filter(self: _T, mask: np.ndarray) -> _T:
+        """Get the columns with only the labels selected by the given mask.
+
+        The number of the data is not changed, the data without selected labels get empty views.
+
+        Arguments:
+            mask: The boolean mask array in shape (label_count,), like the one from
+                :meth:`LabelColumns.mask`.
+
+        Returns:
+            The filtered :class:`LabelColumns`.
+
+        """
+        columns = self.__class__(self.label_type)
+        point_counts = np.diff(self.point_offsets)
+        point_mask = np.repeat(mask, point_counts)
+
+        columns.points = self.points[point_mask]
+        columns.point_offsets = np.concatenate(([0], np.cumsum(point_counts[mask])))
+        label_counts = np.bincount(self.data_indices[mask], minlength=len(self))
+        columns.label_offsets = np.concatenate(([0], np.cumsum(label_counts)))
+
+        columns.categories = self.categories[mask]
+        columns.instances = self.instances[mask]
+        columns.attributes = {name: column[mask] for name, column in self.attributes.items()}
+        columns.category_names = self.category_names
+        columns.instance_names = self.instance_names
+        columns._attribute_values = self._attribute_values  # pylint: disable=protected-access
+        return columns
+
+    def bind(self, labels: Iterable[Label]) -> None:
+        """Assign the lazy views of the columns to the accessors of the given labels.
+
+        The accessors of the data without labels in the columns are not assigned.
+
+        Arguments:
+            labels: The :class:`~tensorbay.label.label.Label` of every data, in the same order as
+                the columns are built.
+
+        """
+        for index, label in enumerate(labels):
+            view = self[index]
+            if view:
+                setattr(label, self.label_type, view)
+
+
+def split_label_columns(
+    contents: Sequence[Mapping[str, Any]], label_types: Iterable[str]
+) -> Tuple[List[Dict[str, Any]], List[LabelColumns]]:
+    """Split the labels of the given types out of the dumped labels of every data into columns.
+
+    Arguments:
+        contents: The dumped :class:`~tensorbay.label.label.Label` of every data.
+        label_types: The types of the labels to store in columns, like ``("box2d",)``.
+
+    Returns:
+        The dumped labels of every data without the split types, and the
+        :class:`LabelColumns` of every given type.
+
+    """
+    columns = [
+        LabelColumns.from_contents((content.get(key.upper(), ()) for content in contents), key)
+        for key in label_types
+    ]
+    keys = {column.label_type.upper() for column in columns}
+    remains = [
+        {key: value for key, value in content.items() if key not in keys} for content in contents
+    ]
+    return remains, columns
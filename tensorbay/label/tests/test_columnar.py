@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+import numpy as np
+import pytest
+
+from tensorbay.label import Label, LabelColumns, LabeledBox2D, LabeledKeypoints2D, LabeledPolygon
+from tensorbay.label.columnar import split_label_columns
+
+_BOX2D_CONTENTS = [
+    [
+        {
+            "box2d": {"xmin": 1.0, "ymin": 2.0, "xmax": 3.0, "ymax": 4.0},
+            "category": "car",
+            "attributes": {"occluded": False, "color": "red"},
+            "instance": "1",
+        },
+        {
+            "box2d": {"xmin": 5.0, "ymin": 6.0, "xmax": 7.0, "ymax": 8.0},
+            "category": "person",
+            "attributes": {"occluded": True},
+        },
+    ],
+    [],
+    [
+        {
+            "box2d": {"xmin": 0.0, "ymin": 0.0, "xmax": 1.0, "ymax": 1.0},
+            "category": "car",
+            "attributes": {"occluded": 0},
+        },
+        {"box2d": {"xmin": 2.0, "ymin": 2.0, "xmax": 4.0, "ymax": 4.0}},
+    ],
+]
+
+
+class TestLabelColumns:
+    def test_init(self):
+        with pytest.raises(TypeError):
+            LabelColumns("sentence")
+
+        columns = LabelColumns()
+        assert len(columns) == 0
+        assert columns.label_count == 0
+
+    def test_from_contents(self):
+        columns = LabelColumns.from_contents(_BOX2D_CONTENTS)
+        assert len(columns) == 3
+        assert columns.label_count == 4
+        assert columns.points.shape == (4, 4)
+        assert columns.category_names == ["car", "person"]
+        assert columns.categories.tolist() == [0, 1, 0, -1]
+        assert columns.instances.tolist() == [0, -1, -1, -1]
+        assert columns.attribute_names == ["occluded", "color"]
+        assert columns.attributes["occluded"].tolist() == [0, 1, 2, -1]
+        assert columns.data_indices.tolist() == [0, 0, 2, 2]
+
+    def test_getitem(self):
+        columns = LabelColumns.from_contents(_BOX2D_CONTENTS)
+        labels = [[LabeledBox2D.loads(label) for label in data] for data in _BOX2D_CONTENTS]
+
+        for index, data in enumerate(labels):
+            view = columns[index]
+            assert len(view) == len(data)
+            assert view == data
+            assert list(view) == data
+
+        assert columns[-1][1] == labels[2][1]
+        assert columns[0][:1] == labels[0][:1]
+        with pytest.raises(IndexError):
+            columns[3]
+
+    def test_mask(self):
+        columns = LabelColumns.from_contents(_BOX2D_CONTENTS)
+        assert columns.mask().tolist() == [True, True, True, True]
+        assert columns.mask(category="car").tolist() == [True, False, True, False]
+        assert columns.mask(category=["car", "person"]).tolist() == [True, True, True, False]
+        assert columns.mask(attributes={"occluded": False}).tolist() == [True, False, False, False]
+        assert columns.mask(attributes={"occluded": 0}).tolist() == [False, False, True, False]
+        assert columns.mask("car", {"color": "red"}).tolist() == [True, False, False, False]
+        assert not columns.mask(attributes={"truncated": True}).any()
+
+    def test_filter(self):
+        columns = LabelColumns.from_contents(_BOX2D_CONTENTS)
+        filtered = columns.filter(columns.mask(category="car"))
+
+        assert len(filtered) == 3
+        assert filtered.label_count == 2
+        assert filtered.label_offsets.tolist() == [0, 1, 1, 2]
+        assert filtered[0] == [LabeledBox2D.loads(_BOX2D_CONTENTS[0][0])]
+        assert filtered[2] == [LabeledBox2D.loads(_BOX2D_CONTENTS[2][0])]
+
+    def test_from_labels_and_bind(self):
+        labels = [Label.loads({"BOX2D": data} if data else {}) for data in _BOX2D_CONTENTS]
+        columns = LabelColumns.from_labels(labels)
+        assert columns.label_count == 4
+
+        new_labels = [Label() for _ in labels]
+        columns.bind(new_labels)
+        assert new_labels == labels
+        assert [label.dumps() for label in new_labels] == [label.dumps() for label in labels]
+
+    def test_slice_and_concatenate(self):
+        columns = LabelColumns.from_contents(_BOX2D_CONTENTS)
+        head, tail = columns[:1], columns[1:]
+        assert (len(head), len(tail)) == (1, 2)
+        assert tail[1] == [LabeledBox2D.loads(content) for content in _BOX2D_CONTENTS[2]]
+
+        concatenated = LabelColumns.concatenate([tail, head])
+        assert concatenated.label_offsets.tolist() == [0, 0, 2, 4]
+        assert concatenated.category_names == ["car", "person"]
+        assert concatenated.mask(category="car").tolist() == [True, False, True, False]
+        assert concatenated.mask(attributes={"color": "red"}).tolist() == [0, 0, 1, 0]
+        assert concatenated[2] == [LabeledBox2D.loads(content) for content in _BOX2D_CONTENTS[0]]
+
+        with pytest.raises(TypeError):
+            LabelColumns.concatenate([columns], "polygon")
+
+    def test_from_bound_labels(self, mocker):
+        pages = [_BOX2D_CONTENTS, _BOX2D_CONTENTS[::-1]]
+        labels = []
+        for contents in pages:
+            page_labels = [Label() for _ in contents]
+            LabelColumns.from_contents(contents).bind(page_labels)
+            labels.extend(page_labels)
+        labels.insert(4, Label.loads({"BOX2D": _BOX2D_CONTENTS[0]}))
+        loads = mocker.spy(LabeledBox2D, "loads")
+
+        columns = LabelColumns.from_labels(labels)
+        assert not loads.called
+        assert columns.label_offsets.tolist() == [0, 2, 2, 4, 6, 8, 8, 10]
+        expected = [*_BOX2D_CONTENTS, *_BOX2D_CONTENTS[::-1]]
+        expected.insert(4, _BOX2D_CONTENTS[0])
+        assert [columns[index] for index in range(len(columns))] == [
+            [LabeledBox2D.loads(content) for content in contents] for contents in expected
+        ]
+
+    def test_split_label_columns(self):
+        contents = [
+            {"BOX2D": data, "CLASSIFICATION": {"category": "cat"}} for data in _BOX2D_CONTENTS
+        ]
+        remains, (columns,) = split_label_columns(contents, ["box2d"])
+        assert remains == [{"CLASSIFICATION": {"category": "cat"}}] * 3
+        assert columns.label_type == "box2d"
+        assert columns.label_count == 4
+        assert "BOX2D" in contents[0]
+
+    def test_polygon(self):
+        contents = [
+            [{"polygon": [{"x": 1.0, "y": 2.0}, {"x": 3.0, "y": 4.0}, {"x": 5.0, "y": 2.0}]}],
+            [{"polygon": [{"x": 0.0, "y": 0.0}, {"x": 1.0, "y": 1.0}, {"x": 1.0, "y": 0.0}]}],
+        ]
+        columns = LabelColumns.from_contents(contents, "polygon")
+        assert columns.points.shape == (6, 2)
+        assert columns.point_offsets.tolist() == [0, 3, 6]
+        assert columns[1] == [LabeledPolygon.loads(contents[1][0])]
+
+        filtered = columns.filter(np.array([False, True]))
+        assert filtered.points.tolist() == [[0, 0], [1, 1], [1, 0]]
+        assert filtered[1] == [LabeledPolygon.loads(contents[1][0])]
+
+        labels = [Label.loads({"POLYGON": data}) for data in contents]
+        assert (
+            LabelColumns.from_labels(labels, "polygon").points.tolist() == columns.points.tolist()
+        )
+
+    def test_keypoints2d(self):
+        contents = [
+            [
+                {
+                    "keypoints2d": [{"x": 1.0, "y": 1.0, "v": 2}, {"x": 2.0, "y": 2.0}],
+                    "category": "person",
+                }
+            ]
+        ]
+        columns = LabelColumns.from_contents(contents, "keypoints2d")
+        label = columns[0][0]
+        assert label == LabeledKeypoints2D.loads(contents[0][0])
+        assert label.dumps() == contents[0][0]
+
+        labels = [Label.loads({"KEYPOINTS2D": data}) for data in contents]
+        columns = LabelColumns.from_labels(labels, "keypoints2d")
+        assert columns.points[1, 2] != columns.points[1, 2]
+        assert columns[0][0] == label
@@ -67,3 +67,23 @@ class TestLabel:
         label.classification = Classification.loads(contents["CLASSIFICATION"])
         label.box2d = [LabeledBox2D.loads(contents["BOX2D"][0])]
         assert label.dumps() == contents
+
+    def test_compiled_operators(self):
+        contents = {
+            "CLASSIFICATION": {"category": "cat"},
+            "BOX2D": [
+                {
+                    "box2d": {"xmin": 1, "ymin": 1, "xmax": 2, "ymax": 2},
+                    "category": "dog",
+                    "attributes": {"gender": "female"},
+                    "instance": "1",
+                }
+            ],
+        }
+
+        label = Label.loads(contents)
+        generic_label = Label()
+        generic_label._generic_loads(contents)
+        assert label == generic_label
+        assert label.dumps() == label._generic_dumps() == contents
+        assert label.box2d[0].dumps() == label.box2d[0]._generic_dumps()
@@ -6,7 +6,7 @@
 import pytest
 from quaternion import quaternion
 
-from tensorbay.geometry import Transform3D, Vector3D
+from tensorbay.geometry import Box3DArray, Transform3D, Vector3D
 from tensorbay.label import Box2DSubcatalog, Box3DSubcatalog, LabeledBox2D, LabeledBox3D
 
 
@@ -49,6 +49,16 @@ class TestLabeledBox2D:
         assert box2d1 == box2d2
         assert box2d1 != box2d3
 
+    def test_array(self):
+        labeledbox2ds = [LabeledBox2D(1, 1, 3, 3, category="cat"), LabeledBox2D(1, 1, 4, 4)]
+        array = LabeledBox2D.to_array(labeledbox2ds)
+        assert array.tolist() == [[1, 1, 3, 3], [1, 1, 4, 4]]
+
+        loaded = LabeledBox2D.from_array(array)
+        assert all(isinstance(label, LabeledBox2D) for label in loaded)
+        assert loaded[1] == labeledbox2ds[1]
+        assert loaded[0].dumps() == {"box2d": {"xmin": 1, "ymin": 1, "xmax": 3, "ymax": 3}}
+
     def test_from_xywh(self):
         x, y, width, height = 1, 2, 3, 4
         xmin, xmax, ymin, ymax = 1, 2, 4, 6
@@ -217,6 +227,18 @@ class TestLabeledBox3D:
         assert labeledbox3d.rotation == quaternion(1, 2, 3, 4)
         assert labeledbox3d.size == Vector3D(1, 2, 3)
 
+    def test_box3d_array(self):
+        labeledbox3ds = [
+            LabeledBox3D(size=[1, 2, 3], translation=[1, 2, 3], category="cat"),
+            LabeledBox3D(size=[2, 2, 2], rotation=[0, 1, 0, 0]),
+        ]
+        boxes = Box3DArray.from_boxes(labeledbox3ds)
+        assert boxes.volumes().tolist() == [6, 8]
+
+        loaded = boxes.to_boxes(LabeledBox3D)
+        assert all(isinstance(label, LabeledBox3D) for label in loaded)
+        assert loaded[1] == labeledbox3ds[1]
+
     def test_dumps(self):
         translation = [1, 2, 3]
         rotation = quaternion(1, 2, 3, 4)
@@ -8,7 +8,7 @@
 
 import json
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 from warnings import warn
 
 import numpy as np
@@ -23,7 +23,7 @@ from tensorbay.label import (
     PanopticMask,
     SemanticMask,
 )
-from tensorbay.opendataset._utility import glob
+from tensorbay.opendataset._utility import glob, iter_json_array
 
 try:
     from PIL import Image
@@ -290,7 +290,7 @@ def _add_poly2d_label_10k(label_info: Dict[str, Any], polygon: List[LabeledPolyg
 
 
 def _read_label_file_100k(label_dir: str, segment_name: str) -> Dict[str, Any]:
-    source_label_contents = []
+    label_contents: Dict[str, Any] = {}
     label_filenames = glob(os.path.join(label_dir, "**", f"*_{segment_name}.json"), recursive=True)
 
     label_prefixes = set(_LABEL_TYPE_INFO_100K)
@@ -306,8 +306,7 @@ def _read_label_file_100k(label_dir: str, segment_name: str) -> Dict[str, Any]:
 
         label_description = _LABEL_TYPE_INFO_100K[label_prefix][0]
         print(f"Reading '{label_description}' labels to segment '{segment_name}'...")
-        with open(label_filename, encoding="utf-8") as fp:
-            source_label_contents.append(json.load(fp))
+        _merge_label(label_contents, iter_json_array(label_filename))
         print(f"Finished reading '{label_description}' labels to segment '{segment_name}'...")
 
     for missing_label_prefix in label_prefixes:
@@ -318,34 +317,26 @@ def _read_label_file_100k(label_dir: str, segment_name: str) -> Dict[str, Any]:
         )
         warn(warn_message)
 
-    print(f"Merging '{segment_name}' labels...")
-    label_contents = _merge_label(source_label_contents)
-    print(f"Finished merging '{segment_name}' labels")
     return label_contents
 
 
 def _read_label_file_10k(label_dir: str, segment_name: str) -> Dict[str, Any]:
-    source_label_contents = []
+    label_contents: Dict[str, Any] = {}
     label_filename = os.path.join(label_dir, "pan_seg", "polygons", f"pan_seg_{segment_name}.json")
-    with open(label_filename, encoding="utf-8") as fp:
-        source_label_contents.append(json.load(fp))
 
-    print(f"Merging '{segment_name}' labels...")
-    label_contents = _merge_label(source_label_contents)
-    print(f"Finished merging '{segment_name}' labels")
+    print(f"Reading labels to segment '{segment_name}'...")
+    _merge_label(label_contents, iter_json_array(label_filename))
+    print(f"Finished reading labels to segment '{segment_name}'")
     return label_contents
 
 
-def _merge_label(source_label_contents: List[List[Dict[str, Any]]]) -> Dict[str, Any]:
-    label_contents: Dict[str, Any] = {}
-    for source_label_content in source_label_contents:
-        for image_info in source_label_content:
-            image_name = image_info["name"]
-            image_label = label_contents.setdefault(image_name, {})
-            image_label.setdefault("labels", []).extend(image_info.get("labels", []))
-            image_label.setdefault("attributes", {}).update(image_info.get("attributes", {}))
-
-    return label_contents
+def _merge_label(label_contents: Dict[str, Any], image_infos: Iterable[Dict[str, Any]]) -> None:
+    # The label files are merged while being parsed, so only the merged labels are kept in memory.
+    for image_info in image_infos:
+        image_name = image_info["name"]
+        image_label = label_contents.setdefault(image_name, {})
+        image_label.setdefault("labels", []).extend(image_info.get("labels", []))
+        image_label.setdefault("attributes", {}).update(image_info.get("attributes", {}))
 
 
 def _get_instance_mask(stem: str, original_mask_dir: str, mask_dir: str) -> InstanceMask:
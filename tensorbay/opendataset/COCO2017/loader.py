@@ -9,11 +9,12 @@
 import json
 import os
 from collections import defaultdict
+from functools import partial
 from typing import Any, DefaultDict, Dict, List, Tuple
 
 import numpy as np
 
-from tensorbay.dataset import Data, Dataset
+from tensorbay.dataset import Data, Dataset, ParallelDataset, Segment
 from tensorbay.label import (
     Label,
     LabeledBox2D,
@@ -35,7 +36,7 @@ _LABELED_SEGMENT_NAMES = ("train", "val")
 _UNLABELED_SEGMENT_NAMES = ("test", "unlabeled")
 
 
-def COCO2017(path: str) -> Dataset:
+def COCO2017(path: str, *, jobs: int = 1) -> Dataset:
     """`COCO2017 <https://cocodataset.org/#home>`_ dataset.
 
     The file structure should be like::
@@ -63,52 +64,59 @@ def COCO2017(path: str) -> Dataset:
 
     Arguments:
         path: The root directory of the dataset.
+        jobs: The number of the worker processes loading the segments.
 
     Returns:
         Loaded :class: `~tensorbay.dataset.dataset.Dataset` instance.
 
     """
     root_path = os.path.abspath(os.path.expanduser(path))
-    dataset = Dataset(DATASET_NAME)
+    dataset = ParallelDataset(
+        DATASET_NAME,
+        partial(_load_segment, root_path),
+        _LABELED_SEGMENT_NAMES + _UNLABELED_SEGMENT_NAMES,
+        jobs=jobs,
+    )
     dataset.load_catalog(os.path.join(os.path.dirname(__file__), "catalog.json"))
 
-    for segment_name in _LABELED_SEGMENT_NAMES:
-        segment = dataset.create_segment(segment_name)
-        annotation_path = os.path.join(root_path, "annotations")
-        task_information = _get_information(annotation_path, segment_name)
-        categories = task_information["categories"]
-        for image_path in glob(os.path.join(root_path, f"{segment_name}2017", "*.jpg")):
-            data = Data(image_path)
-            image_stem = os.path.splitext(os.path.basename(image_path))[0]
-            image_id = int(image_stem)
-
-            label = _get_instance_label(
-                task_information["instances_annotations"], image_id, categories
-            )
-            label.keypoints2d = _get_keypoints2d(
-                task_information["person_keypoints_annotations"], image_id, categories
-            )
-            label.box2d.extend(
-                _get_panoptic_box2d(task_information["panoptic_annotations"], image_id, categories)
-            )
-            label.panoptic_mask = _get_panoptic_mask(
-                annotation_path,
-                segment_name,
-                image_stem,
-                task_information["panoptic_annotations"],
-                image_id,
-            )
-            data.label = label
-            segment.append(data)
-
-    for segment_name in _UNLABELED_SEGMENT_NAMES:
-        segment = dataset.create_segment(segment_name)
-        for image_path in glob(os.path.join(root_path, f"{segment_name}2017", "*.jpg")):
-            segment.append(Data(image_path))
-
     return dataset
 
 
+def _load_segment(root_path: str, segment_name: str) -> Segment:
+    segment = Segment(segment_name)
+    image_paths = glob(os.path.join(root_path, f"{segment_name}2017", "*.jpg"))
+    if segment_name in _UNLABELED_SEGMENT_NAMES:
+        segment.extend(map(Data, image_paths))
+        return segment
+
+    annotation_path = os.path.join(root_path, "annotations")
+    task_information = _get_information(annotation_path, segment_name)
+    categories = task_information["categories"]
+    for image_path in image_paths:
+        data = Data(image_path)
+        image_stem = os.path.splitext(os.path.basename(image_path))[0]
+        image_id = int(image_stem)
+
+        label = _get_instance_label(task_information["instances_annotations"], image_id, categories)
+        label.keypoints2d = _get_keypoints2d(
+            task_information["person_keypoints_annotations"], image_id, categories
+        )
+        label.box2d.extend(
+            _get_panoptic_box2d(task_information["panoptic_annotations"], image_id, categories)
+        )
+        label.panoptic_mask = _get_panoptic_mask(
+            annotation_path,
+            segment_name,
+            image_stem,
+            task_information["panoptic_annotations"],
+            image_id,
+        )
+        data.label = label
+        segment.append(data)
+
+    return segment
+
+
 def _get_information(annotation_path: str, segment_name: str) -> Dict[str, Any]:
     task_information: Dict[str, Any] = {}
     for task in ("instances", "person_keypoints", "panoptic"):
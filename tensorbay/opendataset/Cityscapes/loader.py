@@ -8,10 +8,11 @@
 
 import json
 import os
+from functools import partial
 from glob import glob
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 
-from tensorbay.dataset import Data, Dataset
+from tensorbay.dataset import Data, Dataset, ParallelDataset, Segment
 from tensorbay.label import InstanceMask, LabeledPolygon, SemanticMask
 
 DATASET_NAME_GTCOARSE = "CityscapesGTCoarse"
@@ -21,7 +22,7 @@ _SEGMENT_NAMES_GTCOARSE = ("train", "train_extra", "val")
 _SEGMENT_NAMES_GTFINE = ("train", "test", "val")
 
 
-def CityscapesGTCoarse(path: str) -> Dataset:
+def CityscapesGTCoarse(path: str, *, jobs: int = 1) -> Dataset:
     """`CityscapesGTCoarse <https://www.cityscapes-dataset.com/>`_ dataset.
 
     The file structure should be like::
@@ -70,24 +71,16 @@ def CityscapesGTCoarse(path: str) -> Dataset:
 
     Arguments:
         path: The root directory of the dataset.
+        jobs: The number of the worker processes loading the segments, one city at a time.
 
     Returns:
         Loaded :class:`~tensorbay.dataset.dataset.Dataset` instance.
 
     """
-    root_path = os.path.join(os.path.abspath(os.path.expanduser(path)))
-
-    dataset = Dataset(DATASET_NAME_GTCOARSE)
-    dataset.load_catalog(os.path.join(os.path.dirname(__file__), "catalog.json"))
-
-    for segment_name in _SEGMENT_NAMES_GTCOARSE:
-        segment = dataset.create_segment(segment_name)
-        for image_path in glob(os.path.join(root_path, "leftImg8bit", segment_name, "*", "*.png")):
-            segment.append(_get_data(image_path, root_path, segment_name, "gtCoarse"))
-    return dataset
+    return _load_dataset(DATASET_NAME_GTCOARSE, path, _SEGMENT_NAMES_GTCOARSE, "gtCoarse", jobs)
 
 
-def CityscapesGTFine(path: str) -> Dataset:
+def CityscapesGTFine(path: str, *, jobs: int = 1) -> Dataset:
     """`CityscapesGTFine <https://www.cityscapes-dataset.com/>`_ dataset.
 
     The file structure should be like::
@@ -136,23 +129,48 @@ def CityscapesGTFine(path: str) -> Dataset:
 
     Arguments:
         path: The root directory of the dataset.
+        jobs: The number of the worker processes loading the segments, one city at a time.
 
     Returns:
         Loaded :class:`~tensorbay.dataset.dataset.Dataset` instance.
 
     """
+    return _load_dataset(DATASET_NAME_GTFINE, path, _SEGMENT_NAMES_GTFINE, "gtFine", jobs)
+
+
+def _load_dataset(
+    dataset_name: str, path: str, segment_names: Iterable[str], folder_name: str, jobs: int
+) -> Dataset:
     root_path = os.path.join(os.path.abspath(os.path.expanduser(path)))
 
-    dataset = Dataset(DATASET_NAME_GTFINE)
+    shards: List[Tuple[str, Optional[str]]] = []
+    for segment_name in segment_names:
+        image_dir = os.path.join(root_path, "leftImg8bit", segment_name)
+        cities = sorted(os.listdir(image_dir)) if os.path.isdir(image_dir) else []
+        if cities:
+            shards.extend((segment_name, city) for city in cities)
+        else:
+            # The segment of a missing split is still created, empty.
+            shards.append((segment_name, None))
+
+    dataset = ParallelDataset(
+        dataset_name, partial(_load_shard, root_path, folder_name), shards, jobs=jobs
+    )
     dataset.load_catalog(os.path.join(os.path.dirname(__file__), "catalog.json"))
-
-    for segment_name in _SEGMENT_NAMES_GTFINE:
-        segment = dataset.create_segment(segment_name)
-        for image_path in glob(os.path.join(root_path, "leftImg8bit", segment_name, "*", "*.png")):
-            segment.append(_get_data(image_path, root_path, segment_name, "gtFine"))
     return dataset
 
 
+def _load_shard(root_path: str, folder_name: str, shard: Tuple[str, Optional[str]]) -> Segment:
+    segment_name, city = shard
+    segment = Segment(segment_name)
+    if city is None:
+        return segment
+
+    for image_path in glob(os.path.join(root_path, "leftImg8bit", segment_name, city, "*.png")):
+        segment.append(_get_data(image_path, root_path, segment_name, folder_name))
+    return segment
+
+
 def _get_data(image_path: str, root_path: str, segment_name: str, folder_name: str) -> Data:
     filename = os.path.basename(image_path)
     city = filename.split("_", 1)[0]
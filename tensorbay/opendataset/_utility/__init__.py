@@ -7,6 +7,19 @@
 
 from tensorbay.opendataset._utility.coco import coco
 from tensorbay.opendataset._utility.glob import glob
+from tensorbay.opendataset._utility.json_stream import (
+    iter_json_array,
+    iter_json_object_arrays,
+    load_json,
+)
 from tensorbay.opendataset._utility.voc import get_boolean_attributes, get_voc_detection_data
 
-__all__ = ["coco", "glob", "get_voc_detection_data", "get_boolean_attributes"]
+__all__ = [
+    "coco",
+    "glob",
+    "get_voc_detection_data",
+    "get_boolean_attributes",
+    "iter_json_array",
+    "iter_json_object_arrays",
+    "load_json",
+]
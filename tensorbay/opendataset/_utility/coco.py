@@ -5,9 +5,10 @@
 
 """Coco method for open dataset."""
 
-import json
 from collections import defaultdict
-from typing import Any, Dict, List, NamedTuple
+from typing import Any, DefaultDict, Dict, List, NamedTuple
+
+from tensorbay.opendataset._utility.json_stream import iter_json_object_arrays
 
 
 class COCO(NamedTuple):
@@ -19,13 +20,6 @@ class COCO(NamedTuple):
     image_annotations_map: Dict[int, List[int]]
 
 
-def _generate_image_annotations_map(dataset: Dict[str, Any]) -> Dict[int, List[int]]:
-    image_annotations_map = defaultdict(list)
-    for annotation in dataset["annotations"]:
-        image_annotations_map[annotation["image_id"]].append(annotation["id"])
-    return image_annotations_map
-
-
 def coco(path: str) -> COCO:
     """Parse the coco-like label files.
 
@@ -44,14 +38,18 @@ def coco(path: str) -> COCO:
             images_annotations_map  image id       annotation id
             ======================  =============  ==========================
 
-    """
-    with open(path, encoding="utf-8") as fp:
-        info = json.load(fp)
-
-    images = {image["id"]: image for image in info["images"]}
-    annotations = {annotation["id"]: annotation for annotation in info["annotations"]}
-    categories = {category["id"]: category for category in info["categories"]}
+    The label file is parsed incrementally, so the whole file is never held in memory.
 
-    image_annotations_map = _generate_image_annotations_map(info)
+    """
+    images: Dict[int, Dict[str, Any]] = {}
+    annotations: Dict[int, Dict[str, Any]] = {}
+    categories: Dict[int, Dict[str, Any]] = {}
+    image_annotations_map: DefaultDict[int, List[int]] = defaultdict(list)
+    tables = {"images": images, "annotations": annotations, "categories": categories}
+
+    for key, item in iter_json_object_arrays(path, tables):
+        tables[key][item["id"]] = item
+        if key == "annotations":
+            image_annotations_map[item["image_id"]].append(item["id"])
 
     return COCO(images, annotations, categories, image_annotations_map)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""Streaming and fast JSON reading methods for open dataset."""
+
+import re
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, Container, Iterator, TextIO, Tuple
+
+try:
+    from orjson import loads as _loads
+except ModuleNotFoundError:
+    # pylint: disable=ungrouped-imports
+    from json import loads as _loads  # type: ignore[assignment]
+
+_CHUNK_SIZE = 1 << 20
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = re.compile(r"[0-9eE.+-]*")
+_DECODER = JSONDecoder()
+
+
+def load_json(path: str) -> Any:
+    """Load the whole JSON file, by orjson when it is installed.
+
+    Only this function uses orjson. The streaming functions parse the values by the standard
+    :mod:`json` module, because orjson can not parse a value from a part of the buffer.
+
+    Arguments:
+        path: The path of the JSON file.
+
+    Returns:
+        The loaded JSON contents.
+
+    """
+    with open(path, "rb") as fp:
+        return _loads(fp.read())
+
+
+def iter_json_array(path: str, chunk_size: int = _CHUNK_SIZE) -> Iterator[Any]:
+    """Iterate over the items of the top-level array in the JSON file incrementally.
+
+    Only one item is parsed at a time, so the memory is bounded by the size of the largest item
+    instead of the size of the file. The items are parsed by the standard :mod:`json` module even
+    if orjson is installed, use :func:`load_json` for the small files.
+
+    Arguments:
+        path: The path of the JSON file whose top-level value is an array.
+        chunk_size: The number of characters read from the file at a time.
+
+    Yields:
+        The items of the top-level array.
+
+    """
+    with open(path, encoding="utf-8") as fp:
+        yield from _JSONStream(fp, chunk_size).iter_array()
+
+
+def iter_json_object_arrays(
+    path: str, keys: Container[str], chunk_size: int = _CHUNK_SIZE
+) -> Iterator[Tuple[str, Any]]:
+    """Iterate over the items of the arrays under the given keys of the top-level object.
+
+    The items of the arrays are parsed one at a time, and the values of the other keys are
+    parsed and dropped one by one, like the "images" and "annotations" of a COCO file.
+
+    Arguments:
+        path: The path of the JSON file whose top-level value is an object.
+        keys: The keys of the arrays to iterate over.
+        chunk_size: The number of characters read from the file at a time.
+
+    Yields:
+        The key and the item of the arrays, in the order of the file.
+
+    """
+    with open(path, encoding="utf-8") as fp:
+        stream = _JSONStream(fp, chunk_size)
+        for key in stream.iter_object_keys():
+            if key in keys:
+                for item in stream.iter_array():
+                    yield key, item
+            else:
+                stream.decode()
+
+
+class _JSONStream:
+    """The incremental JSON parser reading from a text file.
+
+    The containers on the path to the values are parsed by this class, and the values are parsed
+    by :meth:`json.JSONDecoder.raw_decode` from the buffer, which is refilled when a value is not
+    complete.
+
+    Arguments:
+        fp: The text file to read.
+        chunk_size: The number of characters read from the file at a time.
+
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int) -> None:
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._index = 0
+        self._eof = False
+
+    def _read(self) -> bool:
+        if self._eof:
+            return False
+
+        # Read at least the size of the unparsed buffer to keep reparsing a large value linear.
+        chunk = self._fp.read(max(self._chunk_size, len(self._buffer) - self._index))
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buffer = self._buffer[self._index :] + chunk
+        self._index = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            match = _WHITESPACE.match(self._buffer, self._index)
+            self._index = match.end()  # type: ignore[union-attr]
+            if self._index < len(self._buffer):
+                return self._buffer[self._index]
+            if not self._read():
+                raise JSONDecodeError("Unexpected end of JSON", self._buffer, self._index)
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if char not in chars:
+            expecting = " or ".join(f"'{c}'" for c in chars)
+            raise JSONDecodeError(f"Expecting {expecting}", self._buffer, self._index)
+
+        self._index += 1
+        return char
+
+    def decode(self) -> Any:
+        """Parse the next value.
+
+        Returns:
+            The parsed value.
+
+        Raises:
+            JSONDecodeError: When the value is invalid.
+
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._index)
+            except JSONDecodeError:
+                if self._read():
+                    continue
+                raise
+
+            # A number followed by only the number characters in the buffer may be cut by the
+            # chunk, like "1.5e" of "1.5e10".
+            if (
+                type(value) in (int, float)  # pylint: disable=unidiomatic-typecheck
+                and _NUMBER_TAIL.match(self._buffer, end).end()  # type: ignore[union-attr]
+                == len(self._buffer)
+                and self._read()
+            ):
+                continue
+
+            self._index = end
+            return value
+
+    def iter_array(self) -> Iterator[Any]:
+        """Iterate over the items of the next array.
+
+        Yields:
+            The items of the array.
+
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self._index += 1
+            return
+
+        while True:
+            yield self.decode()
+            if self._expect(",]") == "]":
+                return
+
+    def iter_object_keys(self) -> Iterator[str]:
+        """Iterate over the keys of the next object.
+
+        The value of the key must be consumed before the next key is read.
+
+        Yields:
+            The keys of the object.
+
+        Raises:
+            JSONDecodeError: When the key is not a string.
+
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._index += 1
+            return
+
+        while True:
+            if self._peek() != '"':
+                raise JSONDecodeError("Expecting property name", self._buffer, self._index)
+
+            key = self.decode()
+            self._expect(":")
+            yield key
+            if self._expect(",}") == "}":
+                return
@@ -6,12 +6,12 @@
 
 """Methods for open datasets of nuScenes format."""
 
-import json
 import os
 from bisect import bisect
 from itertools import accumulate
 from typing import Any, Dict, List, Union
 
+from tensorbay.opendataset._utility.json_stream import iter_json_array
 from tensorbay.sensor import Camera, Lidar, Radar
 
 _SENSOR_TYPE_CLASS = {
@@ -33,9 +33,7 @@ def get_info_with_token(info_path: str, annotation_part: str) -> Dict[str, Any]:
 
     """
     filepath = os.path.join(info_path, f"{annotation_part}.json")
-    with open(filepath, encoding="utf-8") as fp:
-        info = json.load(fp)
-    return {item.pop("token"): item for item in info}
+    return {item.pop("token"): item for item in iter_json_array(filepath)}
 
 
 def get_info_with_determined_token(
@@ -57,10 +55,8 @@ def get_info_with_determined_token(
 
     """
     filepath = os.path.join(info_path, f"{annotation_part}.json")
-    with open(filepath, encoding="utf-8") as fp:
-        info = json.load(fp)
     info_with_keys: Dict[str, List[Any]] = {}
-    for item in info:
+    for item in iter_json_array(filepath):
         if no_key_frame or item["is_key_frame"]:
             info_with_keys.setdefault(item.pop(determined_token), []).append(item)
     return info_with_keys
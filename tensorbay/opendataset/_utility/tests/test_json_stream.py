@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+import json
+from json import JSONDecodeError
+
+import pytest
+
+from tensorbay.opendataset._utility.json_stream import (
+    iter_json_array,
+    iter_json_object_arrays,
+    load_json,
+)
+
+_ITEMS = [
+    {"name": 'a \\" é [ { , \\u0041', "values": [1, -2.5, 1.5e10, 3e-7, 0]},
+    [],
+    {},
+    True,
+    False,
+    None,
+    123456789,
+    -0.125,
+    'string with spaces and "quotes"',
+    [[], [{}], {"nested": [1, 2, [3]]}],
+]
+
+_OBJECT = {
+    "info": {"description": "skipped", "numbers": [1, 2.5, 3e8], "flags": [True, None]},
+    "images": [{"id": 1, "file_name": "1.jpg"}, {"id": 2, "file_name": "2.jpg"}],
+    "licenses": [],
+    "annotations": [{"id": 1, "bbox": [1.5, 2, 3, 4e2]}],
+    "categories": [{"id": 1, "name": "car"}],
+}
+
+
+def _write(tmp_path, text):
+    path = tmp_path / "test.json"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+class TestIterJsonArray:
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_chunk_boundaries(self, tmp_path, indent):
+        text = json.dumps(_ITEMS, indent=indent, ensure_ascii=False)
+        path = _write(tmp_path, text)
+        # Every chunk size cuts the strings, numbers and literals at every possible position.
+        for chunk_size in range(1, len(text) + 2):
+            assert list(iter_json_array(path, chunk_size)) == _ITEMS
+
+    @pytest.mark.parametrize("text", ["[]", " [ ] ", "\n[\n]\n"])
+    def test_empty(self, tmp_path, text):
+        path = _write(tmp_path, text)
+        for chunk_size in (1, 2, 1024):
+            assert list(iter_json_array(path, chunk_size)) == []
+
+    def test_large_item(self, tmp_path):
+        items = ["x" * 10000, list(range(1000))]
+        path = _write(tmp_path, json.dumps(items))
+        assert list(iter_json_array(path, 7)) == items
+
+    @pytest.mark.parametrize(
+        "text",
+        ["", "{}", "[1, 2", "[1 2]", "[1,]", "[tru]", '["unterminated]', "[1.5e]", "[-]"],
+    )
+    def test_malformed(self, tmp_path, text):
+        path = _write(tmp_path, text)
+        for chunk_size in (1, 3, 1024):
+            with pytest.raises(JSONDecodeError):
+                list(iter_json_array(path, chunk_size))
+
+
+class TestIterJsonObjectArrays:
+    def test_chunk_boundaries(self, tmp_path):
+        text = json.dumps(_OBJECT)
+        path = _write(tmp_path, text)
+        expected = [("images", item) for item in _OBJECT["images"]]
+        expected.extend(("annotations", item) for item in _OBJECT["annotations"])
+        for chunk_size in range(1, len(text) + 2):
+            assert list(iter_json_object_arrays(path, {"images", "annotations"}, chunk_size)) == (
+                expected
+            )
+
+    def test_skipped_keys(self, tmp_path):
+        path = _write(tmp_path, json.dumps(_OBJECT, indent=4))
+        assert list(iter_json_object_arrays(path, {"licenses"}, 5)) == []
+        assert list(iter_json_object_arrays(path, {"categories"}, 5)) == [
+            ("categories", {"id": 1, "name": "car"})
+        ]
+        assert list(iter_json_object_arrays(path, (), 5)) == []
+
+    @pytest.mark.parametrize("text", ["{}", " { } "])
+    def test_empty(self, tmp_path, text):
+        path = _write(tmp_path, text)
+        assert list(iter_json_object_arrays(path, {"images"}, 1)) == []
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "[]",
+            '{"images": {}}',
+            '{"images": [1, 2}',
+            "{images: []}",
+            '{"images" []}',
+            '{"info": 1 "images": []}',
+            '{"info": [1, 2], ',
+            '{"info": "skipped", "images": [],}',
+        ],
+    )
+    def test_malformed(self, tmp_path, text):
+        path = _write(tmp_path, text)
+        for chunk_size in (1, 4, 1024):
+            with pytest.raises(JSONDecodeError):
+                list(iter_json_object_arrays(path, {"images"}, chunk_size))
+
+
+def test_load_json(tmp_path):
+    path = _write(tmp_path, json.dumps(_OBJECT))
+    assert load_json(path) == _OBJECT
@@ -7,13 +7,13 @@
 """Dataloader of nuScenes dataset."""
 
 
-import json
 import os
 from typing import Any, Dict, Iterator, List
 
 from tensorbay.dataset import Data, Frame, FusionDataset, FusionSegment
 from tensorbay.geometry import Transform3D
 from tensorbay.label import LabeledBox3D
+from tensorbay.opendataset._utility.json_stream import load_json
 from tensorbay.opendataset._utility.nuScenes import (
     get_info_with_determined_token,
     get_info_with_token,
@@ -140,8 +140,7 @@ def _get_annotation_info(info_path: str, is_test: bool = False) -> Dict[str, Any
         "ego_poses": get_info_with_token(info_path, "ego_pose"),
         "sensor": get_info_with_token(info_path, "sensor"),
     }
-    with open(os.path.join(info_path, "scene.json"), encoding="utf-8") as file:
-        annotation_info["scenes"] = json.load(file)
+    annotation_info["scenes"] = load_json(os.path.join(info_path, "scene.json"))
     if not is_test:
         annotation_info["sample_annotations"] = get_info_with_determined_token(
             info_path, "sample_annotation", no_key_frame=True
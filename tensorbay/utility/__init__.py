@@ -17,7 +17,14 @@ from tensorbay.utility.file import URL, FileMixin, RemoteFileMixin
 from tensorbay.utility.itertools import chunked
 from tensorbay.utility.name import NameList, NameMixin, SortedNameList
 from tensorbay.utility.repr import ReprMixin, ReprType, repr_config
-from tensorbay.utility.requests import Tqdm, UserResponse, UserSession, config, get_session
+from tensorbay.utility.requests import (
+    Tqdm,
+    UserResponse,
+    UserSession,
+    config,
+    fit_connection_pool,
+    get_session,
+)
 from tensorbay.utility.type import TypeEnum, TypeMixin, TypeRegister
 from tensorbay.utility.user import (
     UserMapping,
@@ -58,6 +65,7 @@ __all__ = [
     "chunked",
     "common_loads",
     "config",
+    "fit_connection_pool",
     "locked",
     "repr_config",
     "get_session",
@@ -9,11 +9,13 @@ from sys import version_info
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Dict,
     List,
     Optional,
     Sequence,
     Tuple,
+    Type,
     TypeVar,
     Union,
     no_type_check,
@@ -26,9 +28,12 @@ from tensorbay.exception import AttrError
 _T = TypeVar("_T")
 _Callable = Callable[[Any], Any]
 _KeyConverter = Callable[[str], str]
+_Loader = Callable[[Any, Any], None]
+_Dumper = Callable[[Any], Dict[str, Any]]
 _BUILTINS = {"builtins", None, "typing"}
 _DEFAULT_ERROR_MESSAGE = "'{class_name}' object has no attribute '{attr_name}'"
 _ATTRS_BASE = "_attrs_base"
+_SPECIAL_SLOTS = {"__dict__", "__weakref__"}
 
 
 class _A(Protocol):
@@ -108,7 +113,10 @@ class AttrsMixin:
     """
 
     _attrs_fields: Dict[str, Field]
+    _attrs_slots: Tuple[str, ...]
     _attrs_base: Any
+    _attrs_loader: ClassVar[_Loader]
+    _attrs_dumper: ClassVar[_Dumper]
 
     def __init_subclass__(cls) -> None:
         type_ = cls.__annotations__.pop(_ATTRS_BASE, None)
@@ -138,12 +146,22 @@ class AttrsMixin:
                 attrs_fields[name] = field
                 delattr(cls, name)
         cls._attrs_fields = attrs_fields
+        # The slot-based geometry bases store their data outside "__dict__".
+        cls._attrs_slots = tuple(
+            name
+            for class_ in cls.__mro__
+            for name in getattr(class_, "__slots__", ())
+            if name not in _SPECIAL_SLOTS
+        )
+        cls._attrs_loader, cls._attrs_dumper = _compile_operators(cls)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
             return False
 
-        return self.__dict__ == other.__dict__
+        return self.__dict__ == other.__dict__ and all(
+            getattr(self, name) == getattr(other, name) for name in self._attrs_slots
+        )
 
     @no_type_check
     def __getattr__(self, name: str) -> NoReturn:
@@ -170,6 +188,18 @@ class AttrsMixin:
             contents: A dict containing all data.
 
         """
+        self._attrs_loader(contents)
+
+    def _dumps(self) -> Dict[str, Any]:
+        """Dumps all the information of attrs into a dict.
+
+        Returns:
+            contents: A dict containing all data of attrs.
+
+        """
+        return self._attrs_dumper()
+
+    def _generic_loads(self, contents: Any) -> None:
         base = getattr(self, _ATTRS_BASE, None)
         if base:
             value = contents if base.key is None else contents[base.key]
@@ -188,13 +218,7 @@ class AttrsMixin:
 
             setattr(self, name, field.loader(value))
 
-    def _dumps(self) -> Dict[str, Any]:
-        """Dumps all the information of attrs into a dict.
-
-        Returns:
-            contents: A dict containing all data of attrs.
-
-        """
+    def _generic_dumps(self) -> Dict[str, Any]:
         contents: Dict[str, Any] = {}
         base = getattr(self, _ATTRS_BASE, None)
         if base:
@@ -290,6 +314,115 @@ def camel(name: str) -> str:
     return f"{mixed[0].lower()}{mixed[1:]}"
 
 
+def _compile_operators(cls: Type[AttrsMixin]) -> Tuple[_Loader, _Dumper]:
+    """Compile the load and dump functions specialized for the attr fields of the given class.
+
+    The field tables are computed once for the class, so loading and dumping an instance does not
+    look up the field information, convert the keys or dispatch on the field types again.
+
+    Arguments:
+        cls: The class to compile the operators for.
+
+    Returns:
+        The compiled load function and dump function of the class.
+
+    """
+    # The generic methods are used when a class attribute (like a property) shadows an attr,
+    # since the compiled methods access the instance "__dict__" directly.
+    if any(hasattr(cls, name) for name in cls._attrs_fields):  # pylint: disable=protected-access
+        return cls._generic_loads, cls._generic_dumps  # pylint: disable=protected-access
+
+    fields = cls._attrs_fields  # pylint: disable=protected-access
+    base = getattr(cls, _ATTRS_BASE, None)
+    return _compile_loader(fields, base), _compile_dumper(fields, base)
+
+
+def _get_operator(operator: _Callable) -> Optional[_Callable]:
+    return None if operator is _builtin_operator else operator
+
+
+def _compile_loader(fields: Dict[str, Field], base: Optional[BaseField]) -> _Loader:
+    base_key = base.key if base else None
+    base_loader: Optional[Callable[..., None]] = base.loader if base else None
+
+    # The tables of (name, key, loader), the defaults table has the default before the loader.
+    whole: List[Tuple[str, Optional[_Callable]]] = []
+    required: List[Tuple[str, str, Optional[_Callable]]] = []
+    defaults: List[Tuple[str, str, Any, Optional[_Callable]]] = []
+    dynamic: List[Tuple[str, Optional[str], Optional[_Callable]]] = []
+    for name, field in fields.items():
+        loader = _get_operator(field.loader)
+        if field.is_dynamic:
+            dynamic.append((name, field.key, loader))
+        elif field.key is None:
+            whole.append((name, loader))
+        elif field.default is not ...:
+            defaults.append((name, field.key, field.default, loader))
+        else:
+            required.append((name, field.key, loader))
+
+    def _loader(obj: Any, contents: Any) -> None:
+        if base_loader is not None:
+            base_loader(obj, contents if base_key is None else contents[base_key])
+
+        attrs = obj.__dict__
+        for name, loader in whole:
+            attrs[name] = contents if loader is None else loader(contents)
+        for name, key, loader in required:
+            value = contents[key]
+            attrs[name] = value if loader is None else loader(value)
+        for name, key, default, loader in defaults:
+            value = contents.get(key, default)
+            attrs[name] = value if loader is None else loader(value)
+        for name, dynamic_key, loader in dynamic:
+            if dynamic_key in contents:
+                value = contents[dynamic_key]
+                attrs[name] = value if loader is None else loader(value)
+
+    return _loader
+
+
+def _compile_dumper(fields: Dict[str, Field], base: Optional[BaseField]) -> _Dumper:
+    base_key = base.key if base else None
+    base_dumper: Optional[_Callable] = base.dumper if base else None
+
+    # The table of (name, key, is_dynamic, has_default, default, dumper).
+    table = [
+        (
+            name,
+            field.key,
+            field.is_dynamic,
+            field.default is not ...,
+            field.default,
+            _get_operator(field.dumper),
+        )
+        for name, field in fields.items()
+    ]
+
+    def _dumper(obj: Any) -> Dict[str, Any]:
+        contents: Dict[str, Any] = {}
+        if base_dumper is not None:
+            _key_dumper(base_key, contents, base_dumper(obj))
+
+        attrs = obj.__dict__
+        for name, key, is_dynamic, has_default, default, dumper in table:
+            if name in attrs:
+                value = attrs[name]
+            elif is_dynamic:
+                continue
+            else:
+                # Raise the AttributeError with the custom error message.
+                value = getattr(obj, name)
+
+            if has_default and value == default:
+                continue
+
+            _key_dumper(key, contents, value if dumper is None else dumper(value))
+        return contents
+
+    return _dumper
+
+
 def _key_dumper(key: Optional[str], contents: Dict[str, Any], value: Any) -> None:
     if key is None:
         contents.update(value)
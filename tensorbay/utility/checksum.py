@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""The implementation of the checksum computation and the persistent checksum index."""
+
+import os
+import re
+from hashlib import sha1
+from threading import Lock
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from tensorbay.utility.sqlite import Database
+
+_BUFFER_SIZE = 1024 * 1024
+_CHECKSUM = re.compile(r"[0-9a-f]{40}")
+
+
+def compute_checksum(path: str) -> str:
+    """Compute the sha1 checksum of the given file.
+
+    The file is read into a reused buffer by large blocks, hashlib releases the GIL when hashing
+    large blocks, so the checksums of different files can be computed concurrently in threads.
+
+    Arguments:
+        path: The path of the file.
+
+    Returns:
+        The sha1 checksum of the file.
+
+    """
+    sha1_object = sha1()
+    buffer = bytearray(_BUFFER_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as fp:
+        while True:
+            size = fp.readinto(buffer)
+            if not size:
+                break
+            sha1_object.update(view[:size])
+
+    return sha1_object.hexdigest()
+
+
+def get_url_checksum(url: str) -> Optional[str]:
+    """Get the sha1 checksum of the remote file from its url.
+
+    The files on TensorBay are stored under the keys ending with their checksums,
+    so the checksum is the last component of the url path.
+
+    Arguments:
+        url: The url of the remote file.
+
+    Returns:
+        The sha1 checksum of the file, None if the url is not addressed by the checksum.
+
+    """
+    name = os.path.basename(urlparse(url).path)
+    return name if _CHECKSUM.fullmatch(name) else None
+
+
+class ChecksumIndex:
+    """This class defines the persistent index of the checksums of local files.
+
+    The checksums are stored in a SQLite database and keyed by the absolute path of the file,
+    the index entry is only valid when the size, modification time and inode of the file are
+    not changed.
+
+    Arguments:
+        path: The path of the SQLite database file.
+
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = os.path.abspath(os.path.expanduser(path))
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        self._database = Database(self._path)
+
+        with self._database.connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS checksums ("
+                "path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, inode INTEGER, checksum TEXT)"
+            )
+
+    def get_checksum(self, path: str) -> str:
+        """Get the sha1 checksum of the given file from the index or compute it.
+
+        Arguments:
+            path: The path of the file.
+
+        Returns:
+            The sha1 checksum of the file.
+
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+        with self._database.connect() as connection:
+            row = connection.execute(
+                "SELECT size, mtime, inode, checksum FROM checksums WHERE path = ?", (path,)
+            ).fetchone()
+
+        if row and tuple(row[:3]) == key:
+            return row[3]  # type: ignore[no-any-return]
+
+        checksum = compute_checksum(path)
+        with self._database.connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO checksums VALUES (?, ?, ?, ?, ?)", (path, *key, checksum)
+            )
+
+        return checksum
+
+
+_INDEXES: Dict[str, ChecksumIndex] = {}
+_LOCK = Lock()
+
+
+def get_checksum_index(path: str) -> Optional[ChecksumIndex]:
+    """Get the checksum index stored in the given path.
+
+    Arguments:
+        path: The path of the SQLite database file, empty for disabling the index.
+
+    Returns:
+        The :class:`ChecksumIndex` stored in the path, None if the path is empty.
+
+    """
+    if not path:
+        return None
+
+    with _LOCK:
+        if path not in _INDEXES:
+            _INDEXES[path] = ChecksumIndex(path)
+
+        return _INDEXES[path]
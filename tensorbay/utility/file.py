@@ -6,16 +6,60 @@
 """Basic concepts of local file and remote file."""
 
 import os
-from hashlib import sha1
-from typing import Any, Callable, Dict, Optional, Union
+from _io import BufferedReader
+from concurrent.futures import ThreadPoolExecutor
+from threading import get_ident
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin
 from urllib.request import pathname2url
 
-from _io import BufferedReader
+from requests.models import Response
+from typing_extensions import Protocol
 
-from tensorbay.exception import ResponseError
+from tensorbay.exception import ChecksumError, ResponseError
+from tensorbay.utility.checksum import compute_checksum, get_checksum_index, get_url_checksum
 from tensorbay.utility.repr import ReprMixin
-from tensorbay.utility.requests import UserResponse, config, get_session
+from tensorbay.utility.requests import UserResponse, config, fit_connection_pool, get_session
+
+# The suffix of the partial files left by the interrupted downloading, which are resumed later.
+DOWNLOADING_SUFFIX = ".tensorbay.downloading"
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _get_checksum(path: str) -> str:
+    checksum_index = get_checksum_index(config.checksum_index_path)
+    return checksum_index.get_checksum(path) if checksum_index else compute_checksum(path)
+
+
+def _get_content_range(response: Response, offset: int) -> Tuple[int, Optional[int]]:
+    """Get the start and the total size of the content in the response of a range request.
+
+    Arguments:
+        response: The response of the request with the "Range" header.
+        offset: The start of the requested range.
+
+    Returns:
+        The start of the content, which is 0 when the range is ignored by the server, and the
+        total size of the file, None for unknown.
+
+    """
+    if response.status_code == 206:
+        # The "Content-Range" header is like "bytes 100-199/1000".
+        total = response.headers.get("Content-Range", "").rpartition("/")[2]
+        return offset, int(total) if total.isdigit() else None
+
+    length = response.headers.get("Content-Length", "")
+    return 0, int(length) if length.isdigit() else None
+
+
+def _write_content(fp: UserResponse, path: str, offset: int) -> None:
+    with open(path, "r+b") as cache:
+        cache.seek(offset)
+        while True:
+            chunk = fp.read(_DOWNLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            cache.write(chunk)
 
 
 class URL:
@@ -78,7 +122,6 @@ class FileMixin(ReprMixin):
     _checksum: str
 
     _repr_maxlevel = 3
-    _BUFFER_SIZE = 65536
 
     def __init__(self, local_path: str) -> None:
         self.path = local_path
@@ -92,20 +135,15 @@ class FileMixin(ReprMixin):
     def get_checksum(self) -> str:
         """Get and cache the sha1 checksum of the local data.
 
+        The checksum is read from the persistent checksum index if ``config.checksum_index_path``
+        is set and the file is not changed.
+
         Returns:
             The sha1 checksum of the local data.
 
         """
         if not hasattr(self, "_checksum"):
-            sha1_object = sha1()
-            with open(self.path, "rb") as fp:
-                while True:
-                    data = fp.read(self._BUFFER_SIZE)
-                    if not data:
-                        break
-                    sha1_object.update(data)
-
-            self._checksum = sha1_object.hexdigest()
+            self._checksum = _get_checksum(self.path)
 
         return self._checksum
 
@@ -130,6 +168,26 @@ class FileMixin(ReprMixin):
         return open(self.path, "rb")
 
 
+class _FileCache(Protocol):
+    """The protocol of the file cache, like :class:`~tensorbay.client.cache.FileCache`."""
+
+    def open(self, file: "RemoteFileMixin") -> BufferedReader:
+        """Open the remote file from the cache.
+
+        Arguments:
+            file: The remote file.
+
+        """
+
+    def fetch(self, file: "RemoteFileMixin") -> int:
+        """Download the remote file into the cache if it is missing.
+
+        Arguments:
+            file: The remote file.
+
+        """
+
+
 class RemoteFileMixin(ReprMixin):
     """RemoteFileMixin is a mixin class to mixin file related methods for remote file.
 
@@ -137,29 +195,37 @@ class RemoteFileMixin(ReprMixin):
         local_path: The file local path.
         url: The URL instance used to get and update url.
         cache_path: The path to store the cache.
+        file_cache: The :class:`~tensorbay.client.cache.FileCache` storing the file, the cache
+            path is used as the location of the file in it.
 
     Attributes:
         path: The file local path.
+        file_cache: The :class:`~tensorbay.client.cache.FileCache` storing the file.
 
     """
 
     _repr_maxlevel = 3
 
+    file_cache: Optional[_FileCache] = None
+
     def __init__(
         self,
         remote_path: str,
         *,
         url: Optional[URL] = None,
         cache_path: str = "",
+        file_cache: Optional[_FileCache] = None,
     ) -> None:
         self.path = remote_path
         self.url = url
         self.cache_path = os.path.join(cache_path, remote_path) if cache_path else ""
+        if file_cache:
+            self.file_cache = file_cache
 
     def _repr_head(self) -> str:
         return f'{self.__class__.__name__}("{self.path}")'
 
-    def _urlopen(self) -> UserResponse:
+    def _urlopen(self, headers: Optional[Dict[str, str]] = None) -> UserResponse:
 
         if not self.url:
             raise ValueError(f"The file cannot open because {self._repr_head()} has no url")
@@ -167,14 +233,16 @@ class RemoteFileMixin(ReprMixin):
         try:
             session = get_session()
             return UserResponse(
-                session.request("GET", self.get_url(), timeout=config.timeout, stream=True)
+                session.request(
+                    "GET", self.get_url(), headers=headers, timeout=config.timeout, stream=True
+                )
             )
         except ResponseError as error:
             if error.response.status_code == 403:
                 self.url.update()
                 return UserResponse(
                     get_session().request(
-                        "GET", self.get_url(), timeout=config.timeout, stream=True
+                        "GET", self.get_url(), headers=headers, timeout=config.timeout, stream=True
                     )
                 )
             raise
@@ -182,11 +250,74 @@ class RemoteFileMixin(ReprMixin):
     def _write_cache(self, cache_path: str) -> None:
         dirname = os.path.dirname(cache_path)
         os.makedirs(dirname, exist_ok=True)
-        temp_path = f"{cache_path}.tensorbay.downloading.{os.getpid()}"
-        with self._urlopen() as fp:
-            with open(temp_path, "wb") as cache:
-                cache.write(fp.read())
-        os.rename(temp_path, cache_path)
+
+        # The partial file left by an interrupted downloading is taken over to be resumed.
+        partial_path = f"{cache_path}{DOWNLOADING_SUFFIX}"
+        temp_path = f"{partial_path}.{os.getpid()}.{get_ident()}"
+        try:
+            os.rename(partial_path, temp_path)
+        except OSError:
+            with open(temp_path, "wb"):
+                pass
+
+        try:
+            self._download(temp_path)
+        except BaseException:
+            os.replace(temp_path, partial_path)
+            raise
+
+        os.replace(temp_path, cache_path)
+
+    def _download(self, path: str) -> None:
+        offset = os.path.getsize(path)
+        try:
+            fp = self._urlopen({"Range": f"bytes={offset}-"})
+        except ResponseError as error:
+            # The range is not satisfiable when the partial file is not from the same file.
+            if error.response.status_code != 416 or not offset:
+                raise
+            offset = 0
+            fp = self._urlopen({"Range": "bytes=0-"})
+
+        with fp:
+            offset, total = _get_content_range(fp.response, offset)
+            with open(path, "r+b") as cache:
+                cache.truncate(offset)
+
+            if (
+                fp.response.status_code != 206
+                or total is None
+                or config.download_block_jobs <= 1
+                or total - offset <= config.download_block_size
+            ):
+                _write_content(fp, path, offset)
+                return
+
+        self._download_blocks(path, offset, total)
+
+    def _download_blocks(self, path: str, offset: int, total: int) -> None:
+        block_size = config.download_block_size
+        starts = range(offset, total, block_size)
+        is_done: List[bool] = [False] * len(starts)
+
+        def _download_block(index: int) -> None:
+            start = starts[index]
+            end = min(start + block_size, total) - 1
+            with self._urlopen({"Range": f"bytes={start}-{end}"}) as fp:
+                _write_content(fp, path, start)
+            is_done[index] = True
+
+        fit_connection_pool(config.download_block_jobs)
+        try:
+            with ThreadPoolExecutor(config.download_block_jobs) as executor:
+                for _ in executor.map(_download_block, range(len(starts))):
+                    pass
+        except BaseException:
+            # Only the leading downloaded blocks are kept to be resumed.
+            done_count = is_done.index(False) if False in is_done else len(is_done)
+            with open(path, "r+b") as cache:
+                cache.truncate(offset + done_count * block_size)
+            raise
 
     def get_url(self) -> str:
         """Return the url of the data hosted by tensorbay.
@@ -216,11 +347,67 @@ class RemoteFileMixin(ReprMixin):
         if not cache_path:
             return self._urlopen()
 
+        if self.file_cache:
+            return self.file_cache.open(self)
+
         if not os.path.exists(cache_path):
             self._write_cache(cache_path)
 
         return open(cache_path, "rb")
 
+    def prefetch(self) -> int:
+        """Download the file into the cache ahead of opening it.
+
+        Returns:
+            The number of the downloaded bytes, 0 when the file is already in the cache.
+
+        Raises:
+            ValueError: When the cache is not enabled for the file.
+
+        """
+        cache_path = self.cache_path
+        if not cache_path:
+            raise ValueError(f"{self._repr_head()} cannot be prefetched without cache enabled")
+
+        if self.file_cache:
+            return self.file_cache.fetch(self)
+
+        if os.path.exists(cache_path):
+            return 0
+
+        self._write_cache(cache_path)
+        return os.path.getsize(cache_path)
+
+    def download(self, path: str, *, incremental: bool = False) -> int:
+        """Download the file to the given local path.
+
+        The file is streamed into a partial file, which is resumed if the downloading is
+        interrupted, and verified by the checksum in the url when it is available.
+
+        Arguments:
+            path: The local path to store the file.
+            incremental: Whether to skip downloading when the local file has the same checksum.
+
+        Returns:
+            The number of the downloaded bytes, 0 when the downloading is skipped.
+
+        Raises:
+            ChecksumError: When the checksum of the downloaded file does not match.
+
+        """
+        checksum = get_url_checksum(self.get_url())
+        if incremental and checksum and os.path.isfile(path) and _get_checksum(path) == checksum:
+            return 0
+
+        self._write_cache(path)
+        if checksum and compute_checksum(path) != checksum:
+            os.remove(path)
+            raise ChecksumError(
+                f'The checksum of "{path}" downloaded from {self._repr_head()} does not match'
+            )
+
+        return os.path.getsize(path)
+
     def get_callback_body(self) -> Dict[str, Any]:
         """Not support ``get_callback_body`` function.
 
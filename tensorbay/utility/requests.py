@@ -7,12 +7,13 @@
 
 import logging
 import os
-from collections import defaultdict
-from typing import Any, DefaultDict, Optional
+from collections import OrderedDict, defaultdict
+from threading import Lock, local
+from typing import Any, DefaultDict, Dict, Optional
 
 import urllib3
 from requests import Session
-from requests.adapters import HTTPAdapter
+from requests.adapters import BaseAdapter, HTTPAdapter
 from requests.exceptions import RequestException, StreamConsumedError
 from requests.models import PreparedRequest, Response
 from tqdm import tqdm
@@ -38,7 +39,8 @@ def _get_allowed_methods_keyword() -> str:
 _ALLOWED_METHODS = _get_allowed_methods_keyword()
 
 
-class Config:
+# The settings are kept as plain attributes, so they can be set directly by the users.
+class Config:  # pylint: disable=too-many-instance-attributes
     """This is a base class defining the concept of Request Config.
 
     Attributes:
@@ -49,6 +51,29 @@ class Config:
         verify_tls_certificate: Whether to verify the server's TLS certificate.
         timeout: Timeout value of the request in seconds.
         is_internal: Whether the request is from internal.
+        prefetch_pages: The number of pages pulled ahead concurrently when iterating a paging list,
+            0 for disabling the prefetching.
+        page_size: The default number of elements requested by a single paging request.
+        adaptive_paging: Whether to grow the size of paging requests while the latency per element
+            drops.
+        max_page_size: The max number of elements requested by a single adaptive paging request.
+        upload_block_size: The size of the blocks in bytes when uploading large files by blocks,
+            files larger than it are uploaded by blocks.
+        upload_block_jobs: The number of the blocks of a single file uploaded concurrently.
+        download_block_size: The size of the blocks in bytes when downloading large files by
+            ranges, files larger than it are downloaded by blocks concurrently.
+        download_block_jobs: The number of the blocks of a single file downloaded concurrently,
+            1 for downloading by a single stream.
+        pool_connections: The number of the hosts whose connection pools are kept.
+        pool_maxsize: The min number of the connections kept alive per host, the pools are enlarged
+            to the number of the concurrent requests when uploading or listing concurrently.
+        checksum_index_path: The path of the persistent index of the local file checksums,
+            empty for disabling the index.
+        uploaded_objects_path: The path of the persistent record of the objects uploaded to
+            TensorBay, files whose content has been uploaded are not sent again,
+            empty for recording in memory of the current process only.
+        persist_remote_paths: Whether to store the remote paths listed for skipping the uploaded
+            files locally, so resumed uploadings do not list them again.
 
     """
 
@@ -61,6 +86,19 @@ class Config:
 
         self.timeout = 30
         self.is_internal = False
+        self.prefetch_pages = 0
+        self.page_size = 128
+        self.adaptive_paging = False
+        self.max_page_size = 1024
+        self.upload_block_size = 8 * 1024 * 1024
+        self.upload_block_jobs = 4
+        self.download_block_size = 8 * 1024 * 1024
+        self.download_block_jobs = 4
+        self.pool_connections = 20
+        self.pool_maxsize = 20
+        self.checksum_index_path = ""
+        self.uploaded_objects_path = ""
+        self.persist_remote_paths = False
         self._x_source = "PYTHON-SDK"
 
 
@@ -110,22 +148,74 @@ class TimeoutHTTPAdapter(HTTPAdapter):
         return super().send(request, stream, timeout, verify, cert, proxies)
 
 
-class UserSession(Session):
-    """This class defines UserSession."""
+class _ConnectionPools:
+    """This class defines the connection pools shared by the sessions in a process."""
 
     def __init__(self) -> None:
-        super().__init__()
-        # self.session.hooks["response"] = [logging_hook]
-
-        retry_strategy = Retry(
+        self._retry_strategy = Retry(
             total=config.max_retries,
             status_forcelist=config.allowed_retry_status,
             raise_on_status=False,
             **{_ALLOWED_METHODS: config.allowed_retry_methods},  # type: ignore[arg-type]
         )
+        self._lock = Lock()
+        self._maxsize = 0
+        self.adapters: "OrderedDict[str, BaseAdapter]" = OrderedDict()
+        self.fit(config.pool_maxsize)
+
+    def fit(self, maxsize: int) -> None:
+        """Enlarge the connection pools to keep the given number of connections alive per host.
+
+        Arguments:
+            maxsize: The number of connections kept alive per host.
+
+        """
+        with self._lock:
+            if maxsize <= self._maxsize:
+                return
+
+            self._maxsize = maxsize
+            for prefix in ("https://", "http://"):
+                replaced_adapter = self.adapters.get(prefix)
+                self.adapters[prefix] = TimeoutHTTPAdapter(
+                    config.pool_connections, maxsize, self._retry_strategy
+                )
+                # The idle connections are closed, the ones in use are closed when released.
+                if replaced_adapter is not None:
+                    replaced_adapter.close()
+
+
+class UserSession(Session):
+    """This class defines UserSession.
+
+    The adapters of the session are the given connection pools, which can be shared with the
+    sessions of the other threads, so the connections kept alive are reused by all of them.
+
+    Arguments:
+        pools: The connection pools of the session, new pools are created if not given.
+
+    """
+
+    def __init__(self, pools: Optional[_ConnectionPools] = None) -> None:
+        super().__init__()
+        # self.session.hooks["response"] = [logging_hook]
 
-        self.mount("http://", TimeoutHTTPAdapter(20, 20, retry_strategy))
-        self.mount("https://", TimeoutHTTPAdapter(20, 20, retry_strategy))
+        for adapter in self.adapters.values():
+            adapter.close()
+        self._pools = _ConnectionPools() if pools is None else pools
+        self.adapters = self._pools.adapters
+
+    def fit_pool(self, maxsize: int) -> None:
+        """Enlarge the connection pools to keep the given number of connections alive per host.
+
+        The pools are only enlarged, so the concurrent requests sharing the pools do not
+        discard the connections when they are returned to the pools.
+
+        Arguments:
+            maxsize: The number of connections kept alive per host.
+
+        """
+        self._pools.fit(maxsize)
 
     def request(  # type: ignore[override]
         self, method: str, url: str, *args: Any, **kwargs: Any
@@ -153,7 +243,7 @@ class UserSession(Session):
                 verify=config.verify_tls_certificate,  # type: ignore[misc]
                 **kwargs,
             )
-            if response.status_code not in (200, 201):
+            if response.status_code not in (200, 201, 206):
                 logger.error(
                     "Unexpected status code(%d)!%s", response.status_code, ResponseLogging(response)
                 )
@@ -173,16 +263,36 @@ class UserSession(Session):
             raise
 
 
-SESSIONS: DefaultDict[int, UserSession] = defaultdict(UserSession)
+_POOLS: DefaultDict[int, _ConnectionPools] = defaultdict(_ConnectionPools)
+_LOCAL = local()
 
 
 def get_session() -> UserSession:
-    """Create and return a session per PID so each sub-processes will use their own session.
+    """Create and return a session per thread so the threads do not share the session states.
+
+    The sessions of the threads in a process share the connection pools, so the connections kept
+    alive are reused by the other threads, including the short-lived threads of the executors.
+    Each sub-process uses its own sessions and pools.
 
     Returns:
-        The session corresponding to the process.
+        The session corresponding to the thread.
+    """
+    pid = os.getpid()
+    sessions: Dict[int, UserSession] = _LOCAL.__dict__.setdefault("sessions", {})
+    session = sessions.get(pid)
+    if session is None:
+        session = sessions[pid] = UserSession(_POOLS[pid])
+    return session
+
+
+def fit_connection_pool(concurrency: int) -> None:
+    """Enlarge the connection pools of the session to fit the given number of concurrent requests.
+
+    Arguments:
+        concurrency: The number of the requests sent concurrently.
+
     """
-    return SESSIONS[os.getpid()]
+    get_session().fit_pool(max(concurrency, config.pool_maxsize))
 
 
 class UserResponse:
@@ -234,13 +344,32 @@ class Tqdm(tqdm):  # type: ignore[misc]
     """A wrapper class of tqdm for showing the process bar.
 
     Arguments:
-        total: The number of excepted iterations.
+        total: The number of excepted iterations, None for unknown.
         disable: Whether to disable the entire progress bar.
+        desc: The description of the progress bar.
 
     """
 
-    def __init__(self, total: int, disable: bool = False) -> None:
-        super().__init__(desc="Uploading", total=total, disable=disable)
+    total: Optional[int]
+
+    def __init__(
+        self, total: Optional[int], disable: bool = False, desc: str = "Uploading"
+    ) -> None:
+        super().__init__(desc=desc, total=total, disable=disable)
+
+    def add_total(self, count: Optional[int]) -> None:
+        """Add the number of the iterations which are only known during the process.
+
+        Arguments:
+            count: The number of the iterations to add to the total, None for unknown, which is
+                not added.
+
+        """
+        if count is None:
+            return
+
+        self.total = (self.total or 0) + count
+        self.refresh()
 
     def update_callback(self, _: Any) -> None:
         """Callback function for updating process bar when multithread task is done."""
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""The helpers of the SQLite databases which store the local caches and records."""
+
+import sqlite3
+from contextlib import contextmanager
+from threading import local
+from typing import Iterator
+
+_TIMEOUT = 30.0
+
+
+class Database:
+    """This class defines the SQLite database whose connections are reused in each thread.
+
+    SQLite connections can not be shared across threads, so every thread opens its own connection
+    on the first use and keeps it until the thread or the database object is gone.
+    The connections wait for the locks held by the other connections up to the busy timeout.
+
+    Arguments:
+        path: The path of the SQLite database file.
+        timeout: The busy timeout of the connections in seconds.
+
+    """
+
+    def __init__(self, path: str, timeout: float = _TIMEOUT) -> None:
+        self._path = path
+        self._timeout = timeout
+        self._local = local()
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """Get the connection of the current thread in a transaction.
+
+        The transaction is committed when the block exits normally and rolled back on exception,
+        the connection is kept open for the next use in the same thread.
+
+        Yields:
+            The connection to the database.
+
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self._path, timeout=self._timeout)
+            self._local.connection = connection
+
+        with connection:
+            yield connection
@@ -33,6 +33,8 @@ _V = TypeVar("_V")
 class UserSequence(Sequence[_T], ReprMixin):
     """UserSequence is a user-defined wrapper around sequence objects."""
 
+    __slots__ = ("_data",)
+
     _data: Sequence[_T]
 
     _repr_type = ReprType.SEQUENCE
@@ -96,6 +98,8 @@ class UserSequence(Sequence[_T], ReprMixin):
 class UserMutableSequence(MutableSequence[_T], UserSequence[_T]):
     """UserMutableSequence is a user-defined wrapper around mutable sequence objects."""
 
+    __slots__ = ()
+
     _data: MutableSequence[_T]
 
     _repr_type = ReprType.SEQUENCE
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+#
+# Copyright 2021 Graviti. Licensed under MIT License.
+#
+
+"""The implementation of the parallel directory walker."""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from fnmatch import fnmatchcase
+from typing import Iterable, Iterator, List, Set, Tuple
+
+_Entries = Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]
+
+
+def _match(relpath: str, name: str, patterns: Iterable[str]) -> bool:
+    # The pattern without "/" matches the name, otherwise it matches the whole relative path.
+    return any(fnmatchcase(relpath if "/" in pattern else name, pattern) for pattern in patterns)
+
+
+class _Scanner:  # pylint: disable=too-few-public-methods
+    """Scan one directory and filter its entries by the include and exclude patterns.
+
+    Arguments:
+        include: The glob patterns of the files to include, empty for all files.
+        exclude: The glob patterns of the files and directories to exclude.
+
+    """
+
+    def __init__(self, include: Tuple[str, ...], exclude: Tuple[str, ...]) -> None:
+        self._include = include
+        self._exclude = exclude
+
+    def scan(self, directory: Tuple[str, str]) -> _Entries:
+        """Scan the given directory.
+
+        The directory which can not be scanned is skipped like :func:`os.walk`.
+
+        Arguments:
+            directory: The path of the directory and its relative path to the root.
+
+        Returns:
+            The paths and relative paths of the files and the subdirectories in the directory.
+
+        """
+        path, relpath = directory
+        prefix = f"{relpath}/" if relpath else ""
+        files: List[Tuple[str, str]] = []
+        subdirectories: List[Tuple[str, str]] = []
+        try:
+            with os.scandir(path) as iterator:
+                for entry in iterator:
+                    entry_relpath = prefix + entry.name
+                    if _match(entry_relpath, entry.name, self._exclude):
+                        continue
+
+                    # The symbolic links to directories are not followed like os.walk.
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append((entry.path, entry_relpath))
+                    elif entry.is_file() and (
+                        not self._include or _match(entry_relpath, entry.name, self._include)
+                    ):
+                        files.append((entry.path, entry_relpath))
+        except OSError:
+            pass
+
+        return files, subdirectories
+
+
+def walk_files(
+    root: str,
+    *,
+    include: Iterable[str] = (),
+    exclude: Iterable[str] = (),
+    jobs: int = 1,
+) -> Iterator[Tuple[str, str]]:
+    """Walk the files under the directory, the directories are scanned concurrently.
+
+    The directories are scanned by :func:`os.scandir` in a thread pool, and the files are yielded
+    as soon as their directories are scanned, so the walk overlaps with the consumer. The files
+    are yielded in no particular order.
+
+    The glob patterns without "/" match the name of the file or directory, otherwise they match
+    the relative path to the root, which is joined by "/". The excluded directories are not walked.
+
+    Arguments:
+        root: The path of the root directory.
+        include: The glob patterns of the files to include, empty for all files.
+        exclude: The glob patterns of the files and directories to exclude.
+        jobs: The number of the directories scanned concurrently.
+
+    Yields:
+        The path of the file and its relative path to the root joined by "/".
+
+    """
+    scanner = _Scanner(tuple(include), tuple(exclude))
+    with ThreadPoolExecutor(jobs) as executor:
+        not_done: Set["Future[_Entries]"] = {executor.submit(scanner.scan, (root, ""))}
+        try:
+            while not_done:
+                done, not_done = wait(not_done, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirectories = future.result()
+                    not_done.update(
+                        executor.submit(scanner.scan, subdirectory)
+                        for subdirectory in subdirectories
+                    )
+                    yield from files
+        finally:
+            for future in not_done:
+                future.cancel()